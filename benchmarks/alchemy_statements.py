@@ -0,0 +1,38 @@
+"""Per-call Python overhead of the `AlchemyRepo._get_by_id` statement.
+
+Compares building a fresh `select()` per call (the old path) with the cached
+template from `setup/statements.py`. Both include the cache key computation
+SQLAlchemy does on every execute to find the compiled statement.
+
+    uv run python benchmarks/alchemy_statements.py
+"""
+
+import timeit
+from uuid import uuid4
+
+from sqlalchemy import select
+
+from fastapi_solid.infrastructure.sqlalchemy.setup import statements
+from fastapi_solid.infrastructure.sqlalchemy.user.table import UserOrm
+
+NUMBER = 20_000
+
+
+def fresh_select() -> None:
+    stmt = select(UserOrm).where(UserOrm.id == uuid4())
+    stmt._generate_cache_key()  # type: ignore[reportPrivateUsage]
+
+
+def cached_template() -> None:
+    stmt = statements.select_by_id(UserOrm)
+    stmt._generate_cache_key()  # type: ignore[reportPrivateUsage]
+
+
+def main() -> None:
+    for name, func in (("fresh select()", fresh_select), ("template", cached_template)):
+        best = min(timeit.repeat(func, number=NUMBER, repeat=5))
+        print(f"{name:<16} {best / NUMBER * 1e6:8.2f} us/call")
+
+
+if __name__ == "__main__":
+    main()
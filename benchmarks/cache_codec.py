@@ -0,0 +1,75 @@
+"""Encode/decode throughput of cached domain objects.
+
+Compares the old `dataclass_to_json`/`dataclass_from_json` (a new TypeAdapter per
+call), the same functions with cached adapters, and `CacheCodec`, for a single
+`User` and a 100-item list page.
+
+    uv run python benchmarks/cache_codec.py
+"""
+
+import timeit
+from datetime import UTC, datetime
+from uuid import uuid4
+
+from pydantic import TypeAdapter
+
+from fastapi_solid.domain.user.model import User
+from fastapi_solid.utils.converters.cache_codec import get_codec
+from fastapi_solid.utils.converters.json_to_dc import (
+    dataclass_from_json,
+    dataclass_to_json,
+)
+
+NUMBER = 2_000
+
+now = datetime.now(UTC)
+user = User(id=uuid4(), name="John Doe", created_at=now, updated_at=now)
+page = [
+    User(id=uuid4(), name=f"user {i}", created_at=now, updated_at=now)
+    for i in range(100)
+]
+
+
+def old_to_json(obj: object) -> bytes:
+    return TypeAdapter(type(obj)).dump_json(obj)
+
+
+def old_from_json[T](cls: type[T], data: bytes) -> T:
+    return TypeAdapter(cls).validate_json(data)
+
+
+def report(name: str, func: object, size: int) -> None:
+    best = min(timeit.repeat(func, number=NUMBER, repeat=5))  # type: ignore[reportArgumentType]
+    print(f"{name:<36} {NUMBER / best:>12,.0f} ops/s {size:>8} bytes")
+
+
+def main() -> None:
+    user_codec = get_codec(User)
+    page_codec = get_codec(list[User])
+    page_adapter = TypeAdapter(list[User])
+
+    user_json = old_to_json(user)
+    user_bin = user_codec.encode(user)
+    page_json = page_adapter.dump_json(page)
+    page_bin = page_codec.encode(page)
+
+    report("user encode: new TypeAdapter", lambda: old_to_json(user), len(user_json))
+    report(
+        "user encode: cached adapter", lambda: dataclass_to_json(user), len(user_json)
+    )
+    report("user encode: codec", lambda: user_codec.encode(user), len(user_bin))
+    report("user decode: new TypeAdapter", lambda: old_from_json(User, user_json), 0)
+    report(
+        "user decode: cached adapter", lambda: dataclass_from_json(User, user_json), 0
+    )
+    report("user decode: codec", lambda: user_codec.decode(user_bin), 0)
+    report("page encode: new TypeAdapter", lambda: old_to_json(page), len(page_json))
+    report("page encode: codec", lambda: page_codec.encode(page), len(page_bin))
+    report(
+        "page decode: new TypeAdapter", lambda: old_from_json(list[User], page_json), 0
+    )
+    report("page decode: codec", lambda: page_codec.decode(page_bin), 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,165 @@
+"""Microbenchmarks of the building blocks every request goes through.
+
+Results are kept as a JSON baseline, `baselines/hot_path.json` is the committed
+one; `compare` reruns the suite and fails when a case got slower than the baseline
+by more than the threshold. Baselines are only comparable on the same machine and
+Python build (both are recorded), record a new one on the reference machine.
+
+    uv run python benchmarks/hot_path.py run --save benchmarks/baselines/hot_path.json
+    uv run python benchmarks/hot_path.py compare benchmarks/baselines/hot_path.json
+    uv run python benchmarks/hot_path.py run --filter to_dataclass
+"""
+
+import argparse
+import json
+import logging
+import platform
+import statistics
+import sys
+import timeit
+from collections.abc import Callable, Coroutine
+from datetime import UTC, datetime
+from pathlib import Path
+from typing import Any
+from uuid import uuid4
+
+from fastapi import FastAPI, Request
+
+from fastapi_solid.application.exceptions.app_error import AppError, NotFound
+from fastapi_solid.application.users.dto import UserOut
+from fastapi_solid.domain.player.model import Player
+from fastapi_solid.domain.user.model import User
+from fastapi_solid.infrastructure.beanie.player.model import PlayerOdm
+from fastapi_solid.infrastructure.fastapi.dependencies.pagination import get_pagination
+from fastapi_solid.infrastructure.fastapi.error_handler import register_error_handlers
+from fastapi_solid.infrastructure.sqlalchemy.user.table import UserOrm
+from fastapi_solid.utils.config.settings import get_settings
+from fastapi_solid.utils.converters import alch_to_dc, beanie_to_dc
+from fastapi_solid.utils.converters.json_to_dc import (
+    dataclass_from_json,
+    dataclass_to_json,
+)
+from fastapi_solid.utils.logging.lib_log_filter import LibraryLogFilter
+
+REPEAT = 7  # runs of at least 0.2 s each (timeit autorange), the best one counts
+
+now = datetime.now(UTC)
+user = User(id=uuid4(), name="John Doe", created_at=now, updated_at=now)
+user_json = dataclass_to_json(user)
+user_orm = UserOrm(id=user.id, name=user.name, created_at=now, updated_at=now)
+# as loaded from the database: no validation, and no init_beanie (Mongo) needed
+player_odm = PlayerOdm.model_construct(
+    id=uuid4(), color="red", is_alive=True, created_at=now
+)
+
+log_filter = LibraryLogFilter()
+app_record = logging.LogRecord(
+    get_settings().logging_app_prefix + ".bench", logging.DEBUG, "", 0, "", None, None
+)
+lib_record = logging.LogRecord("sqlalchemy.engine", logging.INFO, "", 0, "", None, None)
+
+app = FastAPI()
+register_error_handlers(app)
+error_handler = app.exception_handlers[AppError]
+request = Request({"type": "http", "method": "GET", "path": "/", "headers": []})
+not_found = NotFound.domain_entity(User, user.id)
+
+
+def run_sync(coro: Coroutine[Any, Any, Any]) -> Any:
+    """Drives a coroutine that never suspends, without an event loop"""
+    try:
+        coro.send(None)
+    except StopIteration as e:
+        return e.value
+    raise RuntimeError("coroutine suspended")
+
+
+CASES: dict[str, Callable[[], object]] = {
+    "alch_to_dc.to_dataclass": lambda: alch_to_dc.to_dataclass(user_orm, User),
+    "beanie_to_dc.to_dataclass": lambda: beanie_to_dc.to_dataclass(player_odm, Player),
+    "UserOut.model_validate": lambda: UserOut.model_validate(
+        user, from_attributes=True
+    ),
+    "dataclass_to_json": lambda: dataclass_to_json(user),
+    "dataclass_from_json": lambda: dataclass_from_json(User, user_json),
+    "get_pagination": lambda: get_pagination(limit=10, offset=0),
+    "LibraryLogFilter.filter app": lambda: log_filter.filter(app_record),
+    "LibraryLogFilter.filter lib": lambda: log_filter.filter(lib_record),
+    "error_handler NotFound": lambda: run_sync(error_handler(request, not_found)),  # type: ignore[reportArgumentType]
+}
+
+
+def measure(func: Callable[[], object]) -> dict[str, float]:
+    timer = timeit.Timer(func)
+    number, _ = timer.autorange()
+    times = [t / number * 1e9 for t in timer.repeat(repeat=REPEAT, number=number)]
+    return {"min_ns": min(times), "median_ns": statistics.median(times)}
+
+
+def run(name_filter: str | None) -> dict[str, Any]:
+    results: dict[str, dict[str, float]] = {}
+    for name, func in CASES.items():
+        if name_filter and name_filter not in name:
+            continue
+        results[name] = measure(func)
+        print(f"{name:<32} {results[name]['min_ns']:>10,.0f} ns/call", flush=True)
+    return {
+        "created_at": datetime.now(UTC).isoformat(),
+        "python": sys.version.split()[0],
+        "platform": platform.platform(),
+        "results": results,
+    }
+
+
+def compare(baseline: dict[str, Any], current: dict[str, Any], threshold: float) -> int:
+    if baseline.get("python") != current["python"]:
+        print(f"warning: baseline is from Python {baseline.get('python')}")
+    slower = 0
+    print(f"\n{'case':<32} {'baseline':>10} {'current':>10} {'change':>8}")
+    for name, result in current["results"].items():
+        base = baseline["results"].get(name)
+        if base is None:
+            print(f"{name:<32} {'-':>10} {result['min_ns']:>10,.0f}      new")
+            continue
+        change = result["min_ns"] / base["min_ns"] - 1
+        flag = ""
+        if change > threshold:
+            flag, slower = "  SLOWER", slower + 1
+        elif change < -threshold:
+            flag = "  faster"
+        print(
+            f"{name:<32} {base['min_ns']:>10,.0f} {result['min_ns']:>10,.0f} "
+            f"{change:>+8.1%}{flag}"
+        )
+    if slower:
+        print(
+            f"\n{slower} case(s) slower than the baseline by more than {threshold:.0%}"
+        )
+    return 1 if slower else 0
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    commands = parser.add_subparsers(dest="command", required=True)
+    run_parser = commands.add_parser("run", help="run the suite")
+    run_parser.add_argument("--save", type=Path, help="write the results as baseline")
+    run_parser.add_argument("--filter", help="only cases containing this text")
+    compare_parser = commands.add_parser("compare", help="run and compare")
+    compare_parser.add_argument("baseline", type=Path)
+    compare_parser.add_argument("--threshold", type=float, default=0.10)
+    compare_parser.add_argument("--filter", help="only cases containing this text")
+    args = parser.parse_args()
+
+    if args.command == "compare":
+        baseline = json.loads(args.baseline.read_text())
+        sys.exit(compare(baseline, run(args.filter), args.threshold))
+
+    results = run(args.filter)
+    if args.save:
+        args.save.parent.mkdir(parents=True, exist_ok=True)
+        args.save.write_text(json.dumps(results, indent=2) + "\n")
+        print(f"baseline saved to {args.save}")
+
+
+if __name__ == "__main__":
+    main()
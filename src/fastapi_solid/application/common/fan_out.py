@@ -0,0 +1,63 @@
+import asyncio
+import contextvars
+from collections.abc import Awaitable, Callable
+from typing import Any, overload
+
+type Branch[T] = Callable[[], Awaitable[T]]
+
+# resets of context-local resources (request sessions), run at every branch start
+_branch_resets: list[Callable[[], object]] = []
+
+
+def isolate_per_branch(*resets: Callable[[], object]) -> None:
+    """Sets the resets that give each `fan_out` branch its own resources.
+
+    E.g. the resets of the `ContextLocalSingleton` sessions: afterwards services
+    resolved inside a branch open their own session and unit of work. Every entry
+    point using `fan_out` (app, worker, script, test) has to call it first.
+    """
+    _branch_resets[:] = resets
+
+
+@overload
+async def fan_out[T1, T2](b1: Branch[T1], b2: Branch[T2], /) -> tuple[T1, T2]: ...
+@overload
+async def fan_out[T1, T2, T3](
+    b1: Branch[T1], b2: Branch[T2], b3: Branch[T3], /
+) -> tuple[T1, T2, T3]: ...
+@overload
+async def fan_out(*branches: Branch[Any]) -> tuple[Any, ...]: ...
+
+
+async def fan_out(*branches: Branch[Any]) -> tuple[Any, ...]:
+    """Runs independent calls concurrently, results in argument order.
+
+    Every branch runs in a copy of the current context (deadline, timings) with
+    the registered resources reset, so an `AsyncSession` is never shared between
+    branches; resolve services inside the branch, not before. The first failure
+    cancels the other branches and is raised as is, so application errors keep
+    their meaning; cancelling the caller cancels all branches. Without registered
+    resets the branches would share the sessions, so it raises instead.
+    """
+    if not _branch_resets:
+        raise RuntimeError(
+            "fan_out branches would share the context's sessions, "
+            "call isolate_per_branch() at startup"
+        )
+    try:
+        async with asyncio.TaskGroup() as tasks:
+            running = [
+                tasks.create_task(_isolated(branch), context=contextvars.copy_context())
+                for branch in branches
+            ]
+    except BaseExceptionGroup as group:
+        if len(group.exceptions) == 1:
+            raise group.exceptions[0] from None
+        raise group.exceptions[0] from group
+    return tuple(task.result() for task in running)
+
+
+async def _isolated[T](branch: Branch[T]) -> T:
+    for reset in _branch_resets:
+        reset()
+    return await branch()
@@ -0,0 +1,20 @@
+from functools import cache
+
+from pydantic import BaseModel, create_model
+
+
+@cache
+def partial_model[M: BaseModel](model: type[M]) -> type[M]:
+    """Subclass of `model` with every field optional, the type of sparse outputs.
+
+    Build them with `model_construct` from the loaded fields only, the rest stays
+    unset and is dropped when serialized with `exclude_unset=True`.
+    """
+    return create_model(  # type: ignore[reportReturnType]
+        f"{model.__name__}Fields",
+        __base__=model,
+        **{
+            name: (info.annotation | None, None)  # type: ignore[reportOperatorIssue]
+            for name, info in model.model_fields.items()
+        },
+    )
@@ -0,0 +1,10 @@
+from pydantic import BaseModel
+
+from fastapi_solid.application.players.dto import PlayerOut, PlayerStatsOut
+from fastapi_solid.application.users.dto import UserOut
+
+
+class DashboardOut(BaseModel):
+    users: list[UserOut]
+    players: list[PlayerOut]
+    player_stats: PlayerStatsOut
@@ -0,0 +1,31 @@
+from collections.abc import Callable
+
+from fastapi_solid.application.common.fan_out import fan_out
+from fastapi_solid.application.dashboard.dto import DashboardOut
+from fastapi_solid.application.interfaces.common.pagination import Pagination
+from fastapi_solid.application.players.service import PlayerService
+from fastapi_solid.application.users.service import UserService
+
+
+class DashboardService:
+    """Composes users (Postgres) and players (Mongo) in one response.
+
+    Takes service factories instead of services, every branch resolves its own
+    service and with it its own session.
+    """
+
+    def __init__(
+        self,
+        users_service: Callable[[], UserService],
+        player_service: Callable[[], PlayerService],
+    ):
+        self.users_service = users_service
+        self.player_service = player_service
+
+    async def get(self, pagination: Pagination) -> DashboardOut:
+        users, players, player_stats = await fan_out(
+            lambda: self.users_service().get_all(pagination),
+            lambda: self.player_service().get_all(pagination),
+            lambda: self.player_service().get_stats(),
+        )
+        return DashboardOut(users=users, players=players, player_stats=player_stats)
@@ -27,3 +27,24 @@ class NotFound(AppError):
 class ValidationError(AppError):
     def __init__(self, message: str):
         super().__init__(ErrorType.VALIDATION_ERROR, message)
+
+
+class Conflict(AppError):
+    def __init__(self, message: str):
+        super().__init__(ErrorType.CONFLICT, message)
+
+
+class PermissionDenied(AppError):
+    def __init__(self, message: str):
+        super().__init__(ErrorType.PERMISSION_DENIED, message)
+
+
+class RateLimited(AppError):
+    def __init__(self, message: str, retry_after: float):
+        super().__init__(ErrorType.RATE_LIMITED, message)
+        self.retry_after = retry_after
+
+
+class DeadlineExceeded(AppError):
+    def __init__(self, message: str = "Request deadline exceeded"):
+        super().__init__(ErrorType.EXTERNAL_DEPENDENCY_ERROR, message)
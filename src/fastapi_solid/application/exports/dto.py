@@ -0,0 +1,25 @@
+from datetime import datetime
+from enum import StrEnum
+from uuid import UUID
+
+from pydantic import BaseModel
+
+from fastapi_solid.application.interfaces.common.job_queue import JobStatus
+
+
+class ExportKind(StrEnum):
+    USERS = "users"
+    PLAYERS = "players"
+
+
+class ExportIn(BaseModel):
+    kind: ExportKind
+
+
+class ExportOut(ExportIn):
+    id: UUID
+    status: JobStatus
+    processed: int
+    chunks: int
+    error: str | None
+    created_at: datetime
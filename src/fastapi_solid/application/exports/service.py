@@ -0,0 +1,30 @@
+from uuid import UUID
+
+from fastapi_solid.application.exceptions.app_error import Conflict, NotFound
+from fastapi_solid.application.exports.dto import ExportIn, ExportOut
+from fastapi_solid.application.interfaces.common.job_queue import JobQueue, JobStatus
+from fastapi_solid.utils.logging.logger import get_logger
+
+logger = get_logger(__name__)
+
+
+class ExportService:
+    def __init__(self, job_queue: JobQueue):
+        self.job_queue = job_queue
+
+    async def create(self, export_in: ExportIn) -> ExportOut:
+        job = await self.job_queue.enqueue(export_in.kind)
+        logger.info("Queued %s export %s", job.kind, job.id)
+        return ExportOut.model_validate(job, from_attributes=True)
+
+    async def get_by_id(self, export_id: UUID) -> ExportOut:
+        job = await self.job_queue.get(export_id)
+        if not job:
+            raise NotFound(f"Export with id '{export_id}' was not found")
+        return ExportOut.model_validate(job, from_attributes=True)
+
+    async def get_finished(self, export_id: UUID) -> ExportOut:
+        export = await self.get_by_id(export_id)
+        if export.status is not JobStatus.DONE:
+            raise Conflict(f"Export '{export_id}' is {export.status}, not done")
+        return export
@@ -0,0 +1,24 @@
+from abc import ABC, abstractmethod
+from collections.abc import AsyncIterator
+from dataclasses import dataclass
+from enum import StrEnum
+
+
+class ChangeOp(StrEnum):
+    INSERT = "insert"
+    UPDATE = "update"
+    DELETE = "delete"
+    RESET = "reset"  # history was lost, the subscriber should refetch
+
+
+@dataclass(frozen=True)
+class ChangeEvent:
+    token: str  # resume token
+    op: ChangeOp
+    id: str  # entity id, empty for RESET
+
+
+class ChangeFeed(ABC):
+    @abstractmethod
+    def subscribe(self, resume_token: str | None = None) -> AsyncIterator[ChangeEvent]:
+        """Endless stream of changes, starting after `resume_token` when given"""
@@ -0,0 +1,47 @@
+from abc import ABC, abstractmethod
+from dataclasses import dataclass
+from datetime import datetime
+from enum import StrEnum
+from uuid import UUID
+
+
+class JobStatus(StrEnum):
+    QUEUED = "queued"
+    RUNNING = "running"
+    DONE = "done"
+    FAILED = "failed"
+
+
+@dataclass
+class Job:
+    id: UUID
+    kind: str
+    status: JobStatus
+    created_at: datetime
+    processed: int = 0  # items written so far
+    chunks: int = 0
+    error: str | None = None
+
+
+class JobQueue(ABC):
+    @abstractmethod
+    async def enqueue(self, kind: str) -> Job: ...
+
+    @abstractmethod
+    async def get(self, job_id: UUID) -> Job | None: ...
+
+    @abstractmethod
+    async def reserve(self, timeout: float) -> Job | None:
+        """Takes the next queued job and marks it running, None after `timeout`"""
+
+    @abstractmethod
+    async def update(self, job: Job) -> None:
+        """Saves the progress of a reserved job and keeps its reservation alive"""
+
+    @abstractmethod
+    async def complete(self, job: Job) -> None:
+        """Saves the final state and releases the reservation"""
+
+    @abstractmethod
+    async def requeue_stale(self, older_than: float) -> int:
+        """Puts back jobs whose worker stopped reporting, returns their count"""
@@ -1,4 +1,5 @@
 from abc import ABC, abstractmethod
+from collections.abc import Mapping
 
 CacheResponse = bytes | None
 
@@ -12,3 +13,9 @@ class KeyValueCache(ABC):
 
     @abstractmethod
     async def delete(self, key: str) -> None: ...
+
+    @abstractmethod
+    async def set_many(
+        self, values: Mapping[str, str | bytes], ttl: int | Mapping[str, int]
+    ) -> None:
+        """`ttl` is either shared by all keys or given per key"""
@@ -0,0 +1,2 @@
+# names of the output fields to load, sorted and without duplicates
+Fields = tuple[str, ...]
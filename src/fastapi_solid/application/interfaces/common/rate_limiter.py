@@ -0,0 +1,10 @@
+from abc import ABC, abstractmethod
+
+
+class RateLimiter(ABC):
+    @abstractmethod
+    async def hit(self, key: str, rate: float, burst: int) -> float:
+        """Takes one token from the bucket of `key`.
+
+        Returns 0 when the hit is allowed, otherwise seconds until a retry may succeed.
+        """
@@ -1,7 +1,9 @@
 from abc import ABC, abstractmethod
+from typing import Any
 from uuid import UUID
 
 from fastapi_solid.application.interfaces.common.pagination import Pagination
+from fastapi_solid.application.interfaces.common.projection import Fields
 from fastapi_solid.application.players.dto import PlayerIn, PlayerUpdate
 from fastapi_solid.domain.player.model import Player
 
@@ -10,14 +12,36 @@ class PlayerRepository(ABC):
     @abstractmethod
     async def get_all(self, pagination: Pagination | None = None) -> list[Player]: ...
 
+    @abstractmethod
+    async def get_after(self, after: UUID | None, limit: int) -> list[Player]:
+        """Up to `limit` entities with id above `after`, in id order"""
+
     @abstractmethod
     async def get_by_id(self, id: UUID) -> Player | None: ...
 
+    @abstractmethod
+    async def get_all_fields(
+        self, fields: Fields, pagination: Pagination | None = None
+    ) -> list[dict[str, Any]]:
+        """Like `get_all`, but only `fields` are loaded"""
+
+    @abstractmethod
+    async def get_fields_by_id(self, id: UUID, fields: Fields) -> dict[str, Any] | None:
+        """Like `get_by_id`, but only `fields` are loaded"""
+
     @abstractmethod
     async def create(self, player_in: PlayerIn) -> Player: ...
 
     @abstractmethod
-    async def update(self, id: UUID, update_data: PlayerUpdate) -> Player: ...
+    async def update(
+        self, id: UUID, update_data: PlayerUpdate
+    ) -> tuple[Player, Player]:
+        """The entity before and after the change, the former read atomically with it"""
+
+    @abstractmethod
+    async def delete(self, id: UUID) -> Player:
+        """The deleted entity, read atomically with the delete"""
 
     @abstractmethod
-    async def delete(self, id: UUID) -> None: ...
+    async def evict(self, id: UUID) -> None:
+        """Drops cached copies of the entity, call it after a change is committed"""
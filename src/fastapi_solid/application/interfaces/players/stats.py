@@ -0,0 +1,24 @@
+from abc import ABC, abstractmethod
+from collections.abc import Mapping
+
+PlayerGroup = tuple[str, bool]  # (color, is_alive)
+
+
+class PlayerStatsRepository(ABC):
+    """Player counts per group, maintained incrementally by the player writes"""
+
+    @abstractmethod
+    async def add(self, deltas: Mapping[PlayerGroup, int]) -> None:
+        """Adds `deltas` to the counters, within the current unit of work"""
+
+    @abstractmethod
+    async def get_counts(self) -> dict[PlayerGroup, int]:
+        """Current counters, read without scanning the players"""
+
+    @abstractmethod
+    async def reconcile(self) -> int | None:
+        """Recounts the players and corrects the counters.
+
+        Returns the total drift fixed, None when writes kept changing the counters
+        during the recount and it has to be retried.
+        """
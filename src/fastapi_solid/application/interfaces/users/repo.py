@@ -1,7 +1,9 @@
 from abc import ABC, abstractmethod
+from typing import Any
 from uuid import UUID
 
 from fastapi_solid.application.interfaces.common.pagination import Pagination
+from fastapi_solid.application.interfaces.common.projection import Fields
 from fastapi_solid.application.users.dto import UserIn, UserUpdate
 from fastapi_solid.domain.user.model import User
 
@@ -10,9 +12,23 @@ class UserRepository(ABC):
     @abstractmethod
     async def get_all(self, pagination: Pagination | None = None) -> list[User]: ...
 
+    @abstractmethod
+    async def get_after(self, after: UUID | None, limit: int) -> list[User]:
+        """Up to `limit` entities with id above `after`, in id order"""
+
     @abstractmethod
     async def get_by_id(self, id: UUID) -> User | None: ...
 
+    @abstractmethod
+    async def get_all_fields(
+        self, fields: Fields, pagination: Pagination | None = None
+    ) -> list[dict[str, Any]]:
+        """Like `get_all`, but only `fields` are loaded"""
+
+    @abstractmethod
+    async def get_fields_by_id(self, id: UUID, fields: Fields) -> dict[str, Any] | None:
+        """Like `get_by_id`, but only `fields` are loaded"""
+
     @abstractmethod
     async def get_random_user(self) -> User | None: ...
 
@@ -24,3 +40,7 @@ class UserRepository(ABC):
 
     @abstractmethod
     async def delete(self, id: UUID) -> None: ...
+
+    @abstractmethod
+    async def evict(self, id: UUID) -> None:
+        """Drops cached copies of the entity, call it after a change is committed"""
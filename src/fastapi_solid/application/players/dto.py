@@ -16,3 +16,16 @@ class PlayerOut(PlayerIn):
 
 class PlayerUpdate(PlayerIn):
     pass
+
+
+class PlayerGroupCount(BaseModel):
+    color: str
+    is_alive: bool
+    count: int
+
+
+class PlayerStatsOut(BaseModel):
+    total: int
+    alive: int
+    by_color: dict[str, int]
+    groups: list[PlayerGroupCount]
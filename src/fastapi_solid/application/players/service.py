@@ -1,29 +1,67 @@
 from uuid import UUID
 
+from fastapi_solid.application.common.projection import partial_model
 from fastapi_solid.application.exceptions.app_error import NotFound, ValidationError
 from fastapi_solid.application.interfaces.common.pagination import Pagination
+from fastapi_solid.application.interfaces.common.projection import Fields
 from fastapi_solid.application.interfaces.common.uow import UnitOfWork
 from fastapi_solid.application.interfaces.players.repo import PlayerRepository
-from fastapi_solid.application.players.dto import PlayerIn, PlayerOut, PlayerUpdate
+from fastapi_solid.application.interfaces.players.stats import (
+    PlayerGroup,
+    PlayerStatsRepository,
+)
+from fastapi_solid.application.players.dto import (
+    PlayerGroupCount,
+    PlayerIn,
+    PlayerOut,
+    PlayerStatsOut,
+    PlayerUpdate,
+)
 from fastapi_solid.domain.player.model import Player
 from fastapi_solid.domain.player.rules import can_add_player
+from fastapi_solid.utils.durability.context import Durability, with_durability
 from fastapi_solid.utils.logging.logger import get_logger
 
 logger = get_logger(__name__)
 
 
 class PlayerService:
-    def __init__(self, uow: UnitOfWork, players_repo: PlayerRepository):
+    def __init__(
+        self,
+        uow: UnitOfWork,
+        players_repo: PlayerRepository,
+        stats_repo: PlayerStatsRepository,
+    ):
         self.uow = uow
         self.players_repo = players_repo
+        self.stats_repo = stats_repo
 
-    async def get_all(self, pagination: Pagination) -> list[PlayerOut]:
+    async def get_all(
+        self, pagination: Pagination, fields: Fields | None = None
+    ) -> list[PlayerOut]:
+        """Whole outputs, or sparse ones with only `fields` loaded and set"""
         async with self.uow:
+            if fields:
+                rows = await self.players_repo.get_all_fields(fields, pagination)
+                sparse = partial_model(PlayerOut)
+                return [sparse.model_construct(**r) for r in rows]
             players = await self.players_repo.get_all(pagination)
             return [PlayerOut.model_validate(p, from_attributes=True) for p in players]
 
-    async def get_by_id(self, player_id: UUID) -> PlayerOut:
+    async def get_after(self, after: UUID | None, limit: int) -> list[PlayerOut]:
         async with self.uow:
+            players = await self.players_repo.get_after(after, limit)
+            return [PlayerOut.model_validate(p, from_attributes=True) for p in players]
+
+    async def get_by_id(
+        self, player_id: UUID, fields: Fields | None = None
+    ) -> PlayerOut:
+        async with self.uow:
+            if fields:
+                row = await self.players_repo.get_fields_by_id(player_id, fields)
+                if not row:
+                    raise NotFound.domain_entity(Player, player_id)
+                return partial_model(PlayerOut).model_construct(**row)
             player = await self.players_repo.get_by_id(player_id)
             if not player:
                 raise NotFound.domain_entity(Player, player_id)
@@ -36,16 +74,46 @@ class PlayerService:
             )
         async with self.uow as unit_of_work:
             player = await self.players_repo.create(player_in)
+            await self.stats_repo.add({_group(player): 1})
             await unit_of_work.commit()
         return PlayerOut.model_validate(player, from_attributes=True)
 
     async def update(self, player_id: UUID, update_data: PlayerUpdate) -> PlayerOut:
         async with self.uow as unit_of_work:
-            player = await self.players_repo.update(player_id, update_data)
+            before, player = await self.players_repo.update(player_id, update_data)
+            if _group(before) != _group(player):
+                await self.stats_repo.add({_group(before): -1, _group(player): 1})
             await unit_of_work.commit()
+        await self.players_repo.evict(player_id)
         return PlayerOut.model_validate(player, from_attributes=True)
 
     async def delete(self, player_id: UUID) -> None:
         async with self.uow as unit_of_work:
-            await self.players_repo.delete(player_id)
+            player = await self.players_repo.delete(player_id)
+            await self.stats_repo.add({_group(player): -1})
             await unit_of_work.commit()
+        await self.players_repo.evict(player_id)
+
+    async def get_stats(self) -> PlayerStatsOut:
+        counts = await self.stats_repo.get_counts()
+        by_color: dict[str, int] = {}
+        for (color, _), count in counts.items():
+            by_color[color] = by_color.get(color, 0) + count
+        return PlayerStatsOut(
+            total=sum(counts.values()),
+            alive=sum(c for (_, is_alive), c in counts.items() if is_alive),
+            by_color=by_color,
+            groups=[
+                PlayerGroupCount(color=color, is_alive=is_alive, count=count)
+                for (color, is_alive), count in sorted(counts.items())
+            ],
+        )
+
+    @with_durability(Durability.FAST)  # periodic and self-correcting
+    async def reconcile_stats(self) -> int | None:
+        """Corrects drift of the counters, e.g. after writes outside this service"""
+        return await self.stats_repo.reconcile()
+
+
+def _group(player: Player) -> PlayerGroup:
+    return (player.color, player.is_alive)
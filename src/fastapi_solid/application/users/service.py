@@ -1,7 +1,9 @@
 from uuid import UUID
 
+from fastapi_solid.application.common.projection import partial_model
 from fastapi_solid.application.exceptions.app_error import NotFound
 from fastapi_solid.application.interfaces.common.pagination import Pagination
+from fastapi_solid.application.interfaces.common.projection import Fields
 from fastapi_solid.application.interfaces.common.uow import UnitOfWork
 from fastapi_solid.application.interfaces.users.repo import UserRepository
 from fastapi_solid.application.users.dto import UserIn, UserOut, UserUpdate
@@ -16,13 +18,30 @@ class UserService:
         self.uow = uow
         self.users_repo = users_repo
 
-    async def get_all(self, pagination: Pagination) -> list[UserOut]:
+    async def get_all(
+        self, pagination: Pagination, fields: Fields | None = None
+    ) -> list[UserOut]:
+        """Whole outputs, or sparse ones with only `fields` loaded and set"""
         async with self.uow:
+            if fields:
+                rows = await self.users_repo.get_all_fields(fields, pagination)
+                sparse = partial_model(UserOut)
+                return [sparse.model_construct(**r) for r in rows]
             users = await self.users_repo.get_all(pagination)
             return [UserOut.model_validate(u, from_attributes=True) for u in users]
 
-    async def get_by_id(self, user_id: UUID) -> UserOut:
+    async def get_after(self, after: UUID | None, limit: int) -> list[UserOut]:
         async with self.uow:
+            users = await self.users_repo.get_after(after, limit)
+            return [UserOut.model_validate(u, from_attributes=True) for u in users]
+
+    async def get_by_id(self, user_id: UUID, fields: Fields | None = None) -> UserOut:
+        async with self.uow:
+            if fields:
+                row = await self.users_repo.get_fields_by_id(user_id, fields)
+                if not row:
+                    raise NotFound.domain_entity(User, user_id)
+                return partial_model(UserOut).model_construct(**row)
             user = await self.users_repo.get_by_id(user_id)
             if not user:
                 raise NotFound.domain_entity(User, user_id)
@@ -45,9 +64,11 @@ class UserService:
         async with self.uow as unit_of_work:
             user = await self.users_repo.update(user_id, update_data)
             await unit_of_work.commit()
+        await self.users_repo.evict(user_id)
         return UserOut.model_validate(user, from_attributes=True)
 
     async def delete(self, user_id: UUID) -> None:
         async with self.uow as unit_of_work:
             await self.users_repo.delete(user_id)
             await unit_of_work.commit()
+        await self.users_repo.evict(user_id)
@@ -51,6 +51,9 @@ def do_run_migrations(connection: Connection) -> None:
         connection=connection,
         target_metadata=target_metadata,
         compare_server_default=True,
+        # commit every revision on its own, a long online backfill in a later
+        # revision must not keep earlier ones uncommitted
+        transaction_per_migration=True,
     )
 
     with context.begin_transaction():
@@ -63,16 +66,19 @@ async def run_async_migrations() -> None:
 
     """
 
-    connectable = async_engine_from_config(
-        config.get_section(config.config_ini_section, {}),
-        prefix="sqlalchemy.",
-        poolclass=pool.NullPool,
-    )
+    # the main database and every users shard share one schema history each
+    for url in dict.fromkeys([settings.db_dsn, *settings.db_shard_dsns]):
+        connectable = async_engine_from_config(
+            config.get_section(config.config_ini_section, {}),
+            prefix="sqlalchemy.",
+            poolclass=pool.NullPool,
+            url=url,
+        )
 
-    async with connectable.connect() as connection:
-        await connection.run_sync(do_run_migrations)
+        async with connectable.connect() as connection:
+            await connection.run_sync(do_run_migrations)
 
-    await connectable.dispose()
+        await connectable.dispose()
 
 
 def run_migrations_online() -> None:
@@ -0,0 +1,206 @@
+"""Helpers for migrations that must not lock big tables.
+
+Use them from revision scripts instead of `op.create_index`/`op.execute`:
+
+    def upgrade() -> None:
+        op.add_column("users", sa.Column("name_lower", sa.String(), nullable=True))
+        backfill(
+            "users_name_lower",
+            "users",
+            set_="name_lower = lower(name)",
+            where="name_lower IS NULL",
+        )
+        create_index_concurrently("ix_users_name_lower", "users", ["name_lower"])
+
+They run outside the migration transaction, in autocommit mode.
+"""
+
+import time
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import context, op
+
+from fastapi_solid.utils.logging.logger import get_logger
+
+logger = get_logger(__name__)
+
+PROGRESS_TABLE = "alembic_backfill_progress"
+
+
+def create_index_concurrently(
+    index_name: str,
+    table: str,
+    columns: Sequence[str],
+    unique: bool = False,
+    where: str | None = None,
+) -> None:
+    """`CREATE INDEX CONCURRENTLY`, writes to the table aren't blocked meanwhile.
+
+    An interrupted concurrent build leaves an invalid index behind, it is dropped
+    and built again, a valid one is kept, so the migration can simply be re-run.
+    """
+    if context.is_offline_mode():
+        with op.get_context().autocommit_block():
+            _create_index(index_name, table, columns, unique, where)
+        return
+
+    with op.get_context().autocommit_block():
+        valid = op.get_bind().scalar(
+            sa.text(
+                "SELECT i.indisvalid FROM pg_index i "
+                "JOIN pg_class c ON c.oid = i.indexrelid "
+                "WHERE c.relname = :name AND pg_table_is_visible(c.oid)"
+            ),
+            {"name": index_name},
+        )
+        if valid:
+            logger.info("Index %s already exists", index_name)
+            return
+        if valid is not None:
+            logger.warning("Rebuilding invalid index %s", index_name)
+            drop_index_concurrently(index_name, table)
+        _create_index(index_name, table, columns, unique, where)
+
+
+def drop_index_concurrently(index_name: str, table: str) -> None:
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            index_name, table_name=table, postgresql_concurrently=True, if_exists=True
+        )
+
+
+def backfill(
+    name: str,
+    table: str,
+    set_: str,
+    where: str,
+    batch_size: int = 1000,
+    rows_per_second: float | None = 5000,
+    key: str = "id",
+) -> None:
+    """Runs `UPDATE table SET <set_> WHERE <where>` in keyset batches by `key`.
+
+    Every batch commits on its own and holds row locks only for its rows; batches
+    are throttled to `rows_per_second`. The last key is stored under `name` in the
+    progress table, so a re-run continues after the last completed batch and a
+    finished backfill is skipped. `where` should exclude already updated rows.
+    """
+    if context.is_offline_mode():  # a SQL script can't batch, emit one statement
+        op.execute(f"UPDATE {table} SET {set_} WHERE {where}")
+        return
+
+    with op.get_context().autocommit_block():
+        conn = op.get_bind()
+        key_column = sa.Table(table, sa.MetaData(), autoload_with=conn).c[key]
+        _ensure_progress_table()
+
+        progress = conn.execute(
+            sa.text(
+                f"SELECT last_key, rows, done FROM {PROGRESS_TABLE} WHERE name = :n"
+            ),
+            {"n": name},
+        ).one_or_none()
+        if progress and progress.done:
+            logger.info("Backfill %s already done, skipping", name)
+            return
+        last_key = progress.last_key if progress else None
+        rows = progress.rows if progress else 0
+        if last_key is not None:
+            logger.info("Backfill %s resumes after %s rows", name, rows)
+
+        first_batch = _batch_statement(table, key, set_, where)
+        next_batch = _batch_statement(table, key, set_, where, key_column.type)
+
+        started = time.monotonic()
+        while True:
+            batch_started = time.monotonic()
+            if last_key is None:
+                keys = conn.execute(first_batch, {"limit": batch_size}).scalars().all()
+            else:
+                after = key_column.type.python_type(last_key)
+                keys = (
+                    conn.execute(next_batch, {"limit": batch_size, "after": after})
+                    .scalars()
+                    .all()
+                )
+            if not keys:
+                break
+            last_key, rows = str(max(keys)), rows + len(keys)
+            _save_progress(name, last_key, rows, done=False)
+
+            logger.info(
+                "Backfill %s: %s rows, %.0f rows/s",
+                name,
+                rows,
+                rows / max(time.monotonic() - started, 1e-9),
+            )
+            if rows_per_second:
+                pause = len(keys) / rows_per_second - (time.monotonic() - batch_started)
+                if pause > 0:
+                    time.sleep(pause)
+
+        _save_progress(name, last_key, rows, done=True)
+        logger.info("Backfill %s done, %s rows", name, rows)
+
+
+def reset_backfill(name: str) -> None:
+    """Forgets the progress of a backfill, call it from `downgrade`"""
+    if context.is_offline_mode():
+        return
+    _ensure_progress_table()
+    op.execute(
+        sa.text(f"DELETE FROM {PROGRESS_TABLE} WHERE name = :n").bindparams(n=name)
+    )
+
+
+def _batch_statement(
+    table: str,
+    key: str,
+    set_: str,
+    where: str,
+    key_type: sa.types.TypeEngine[object] | None = None,
+) -> sa.TextClause:
+    after = f"AND {key} > :after" if key_type is not None else ""
+    stmt = sa.text(
+        f"WITH batch AS ("
+        f"  SELECT {key} FROM {table} WHERE ({where}) {after}"
+        f"  ORDER BY {key} LIMIT :limit"
+        f") UPDATE {table} SET {set_} FROM batch "
+        f"WHERE {table}.{key} = batch.{key} RETURNING {table}.{key}"
+    )
+    if key_type is not None:
+        stmt = stmt.bindparams(sa.bindparam("after", type_=key_type))
+    return stmt
+
+
+def _create_index(
+    index_name: str, table: str, columns: Sequence[str], unique: bool, where: str | None
+) -> None:
+    op.create_index(
+        index_name,
+        table,
+        list(columns),
+        unique=unique,
+        postgresql_concurrently=True,
+        postgresql_where=sa.text(where) if where else None,
+    )
+
+
+def _ensure_progress_table() -> None:
+    op.execute(
+        f"CREATE TABLE IF NOT EXISTS {PROGRESS_TABLE} ("
+        "name text PRIMARY KEY, last_key text, rows bigint NOT NULL DEFAULT 0, "
+        "done boolean NOT NULL DEFAULT false, updated_at timestamptz DEFAULT now())"
+    )
+
+
+def _save_progress(name: str, last_key: str | None, rows: int, done: bool) -> None:
+    op.get_bind().execute(
+        sa.text(
+            f"INSERT INTO {PROGRESS_TABLE} (name, last_key, rows, done) "
+            "VALUES (:n, :k, :r, :d) ON CONFLICT (name) DO UPDATE SET "
+            "last_key = :k, rows = :r, done = :d, updated_at = now()"
+        ),
+        {"n": name, "k": last_key, "r": rows, "d": done},
+    )
@@ -0,0 +1,50 @@
+"""users change notify
+
+Revision ID: 3c1f0a7d9e42
+Revises: 78950f9a20bc
+Create Date: 2026-10-19 09:12:40.215337
+
+"""
+
+from collections.abc import Sequence
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "3c1f0a7d9e42"
+down_revision: str | Sequence[str] | None = "78950f9a20bc"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.execute(
+        """
+        CREATE OR REPLACE FUNCTION notify_users_changes() RETURNS trigger AS $$
+        BEGIN
+            PERFORM pg_notify(
+                'users_changes',
+                json_build_object(
+                    'op', TG_OP,
+                    'id', COALESCE(NEW.id, OLD.id)
+                )::text
+            );
+            RETURN NULL;
+        END;
+        $$ LANGUAGE plpgsql
+        """
+    )
+    op.execute(
+        """
+        CREATE TRIGGER users_changes_notify
+        AFTER INSERT OR UPDATE OR DELETE ON users
+        FOR EACH ROW EXECUTE FUNCTION notify_users_changes()
+        """
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.execute("DROP TRIGGER IF EXISTS users_changes_notify ON users")
+    op.execute("DROP FUNCTION IF EXISTS notify_users_changes()")
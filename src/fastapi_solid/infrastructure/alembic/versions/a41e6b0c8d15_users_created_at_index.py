@@ -0,0 +1,31 @@
+"""users created_at index
+
+Revision ID: a41e6b0c8d15
+Revises: 3c1f0a7d9e42
+Create Date: 2026-10-19 09:12:44.318201
+
+"""
+
+from collections.abc import Sequence
+
+from fastapi_solid.infrastructure.alembic.online import (
+    create_index_concurrently,
+    drop_index_concurrently,
+)
+
+# revision identifiers, used by Alembic.
+revision: str = "a41e6b0c8d15"
+down_revision: str | Sequence[str] | None = "3c1f0a7d9e42"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # shards serve list pages in (created_at, id) order for the k-way merge
+    create_index_concurrently("ix_users_created_at_id", "users", ["created_at", "id"])
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    drop_index_concurrently("ix_users_created_at_id", "users")
@@ -0,0 +1,41 @@
+from collections.abc import AsyncIterator
+from typing import Any
+
+from beanie import Document
+from fastapi_solid.application.interfaces.common.change_feed import (
+    ChangeEvent,
+    ChangeOp,
+)
+
+OPERATIONS = {
+    "insert": ChangeOp.INSERT,
+    "update": ChangeOp.UPDATE,
+    "replace": ChangeOp.UPDATE,
+    "delete": ChangeOp.DELETE,
+}
+
+
+class MongoChangeSource:
+    """Change stream of a Beanie document collection, resumable by token"""
+
+    resumable = True
+
+    def __init__(self, model: type[Document]):
+        self._model = model
+
+    async def stream(self, resume_token: str | None) -> AsyncIterator[ChangeEvent]:
+        collection = self._model.get_pymongo_collection()
+        resume_after = {"_data": resume_token} if resume_token else None
+        change_stream = await collection.watch(resume_after=resume_after)
+        async with change_stream:
+            async for change in change_stream:
+                if event := self._to_event(change):
+                    yield event
+
+    def _to_event(self, change: dict[str, Any]) -> ChangeEvent | None:
+        op = OPERATIONS.get(change["operationType"])
+        if op is None:  # drop, rename, invalidate...
+            return None
+        return ChangeEvent(
+            token=change["_id"]["_data"], op=op, id=str(change["documentKey"]["_id"])
+        )
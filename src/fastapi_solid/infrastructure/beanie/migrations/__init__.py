@@ -1,6 +1,12 @@
+import asyncio
 import subprocess
 import sys
+from pathlib import Path
 
+from beanie.migrations.database import DBHandler
+from beanie.migrations.models import RunningDirections, RunningMode
+from beanie.migrations.runner import MigrationNode
+from fastapi_solid.infrastructure.beanie.setup.client import client  # type: ignore[reportUnknownVariableType]
 from fastapi_solid.utils.config.settings import get_settings
 from fastapi_solid.utils.logging import get_logger
 
@@ -8,51 +14,42 @@ settings = get_settings()
 logger = get_logger(__name__)
 
 
-# fmt: off
+async def _migrate(direction: RunningDirections, distance: int = 0) -> None:
+    # in-process, on the app client (standard UUIDs, pool settings)
+    DBHandler.client = client  # type: ignore[reportAttributeAccessIssue]
+    DBHandler.database = client.get_database(settings.mongo_db_name)  # type: ignore[reportAttributeAccessIssue]
+    try:
+        root = await MigrationNode.build(Path(settings.mongo_migrations_path))
+        await root.run(
+            mode=RunningMode(direction=direction, distance=distance),
+            allow_index_dropping=False,
+            use_transaction=settings.mongo_use_transactions,
+        )
+    finally:
+        await client.close()
+
+
 def all_forward():
     logger.info("Running all forward migrations")
-    subprocess.run([
-        "beanie", "migrate",
-        "-uri", settings.mongo_dsn,
-        "-db", settings.mongo_db_name,
-        "-p", settings.mongo_migrations_path
-    ])
+    asyncio.run(_migrate(RunningDirections.FORWARD))
 
 
 def one_forward():
     logger.info("Running one forward migration")
-    subprocess.run([
-        "beanie", "migrate",
-        "-uri", settings.mongo_dsn,
-        "-db", settings.mongo_db_name,
-        "-p", settings.mongo_migrations_path,
-        "--distance", "1"
-    ])
+    asyncio.run(_migrate(RunningDirections.FORWARD, distance=1))
 
 
 def one_backward():
     logger.info("Running one backward migration")
-    subprocess.run([
-        "beanie", "migrate",
-        "-uri", settings.mongo_dsn,
-        "-db", settings.mongo_db_name,
-        "-p", settings.mongo_migrations_path,
-        "--distance", "1",
-        "--backward"
-    ])
+    asyncio.run(_migrate(RunningDirections.BACKWARD, distance=1))
 
 
 def all_backward():
     logger.info("Running all backward migrations")
-    subprocess.run([
-        "beanie", "migrate",
-        "-uri", settings.mongo_dsn,
-        "-db", settings.mongo_db_name,
-        "-p", settings.mongo_migrations_path,
-        "--backward"
-    ])
+    asyncio.run(_migrate(RunningDirections.BACKWARD))
 
 
+# fmt: off
 def create_migration():
     if len(sys.argv) < 2:
         logger.error("Migration name is required. "
@@ -60,7 +57,7 @@ def create_migration():
         sys.exit(1)
     
     migration_name = sys.argv[1]
-    logger.info(f"Creating migration: {migration_name}")
+    logger.info("Creating migration: %s", migration_name)
     
     subprocess.run([
         "beanie", "migrate", 
@@ -1,11 +1,12 @@
 from datetime import UTC, datetime
 from uuid import UUID, uuid4
 
-from beanie import Document
 from pydantic import Field
 
+from fastapi_solid.infrastructure.beanie.setup.durability import ProfiledDocument
 
-class PlayerOdm(Document):
+
+class PlayerOdm(ProfiledDocument):
     id: UUID = Field(default_factory=uuid4)  # type: ignore[reportIncompatibleVariableOverride]
     color: str
     is_alive: bool
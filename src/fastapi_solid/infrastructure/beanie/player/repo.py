@@ -1,32 +1,68 @@
+from typing import Any
 from uuid import UUID
 
+from pymongo.asynchronous.client_session import AsyncClientSession
+
 from fastapi_solid.application.interfaces.common.pagination import Pagination
+from fastapi_solid.application.interfaces.common.projection import Fields
 from fastapi_solid.application.interfaces.players.repo import PlayerRepository
 from fastapi_solid.application.players.dto import PlayerIn, PlayerUpdate
 from fastapi_solid.domain.player.model import Player
 from fastapi_solid.infrastructure.beanie.player.model import PlayerOdm
 from fastapi_solid.infrastructure.beanie.setup.base_repo import BeanieRepo
+from fastapi_solid.infrastructure.cache.entity_cache import EntityCache
 from fastapi_solid.utils.converters.beanie_to_dc import to_dataclass
 
 
 class BeaniePlayerRepo(PlayerRepository, BeanieRepo[PlayerOdm]):
     model = PlayerOdm
 
+    def __init__(self, session: AsyncClientSession, entity_cache: EntityCache[Player]):
+        super().__init__(session)
+        self.entity_cache = entity_cache
+
     async def get_all(self, pagination: Pagination | None = None) -> list[Player]:
         docs = await self._get_all(pagination)
-        return [to_dataclass(d, Player) for d in docs]
+        players = [to_dataclass(d, Player) for d in docs]
+        if pagination:  # a page, not a full scan
+            await self.entity_cache.put_many({p.id: p for p in players})
+        return players
+
+    async def get_after(self, after: UUID | None, limit: int) -> list[Player]:
+        docs = await self._get_after(after, limit)
+        players = [to_dataclass(d, Player) for d in docs]
+        await self.entity_cache.put_many({p.id: p for p in players})
+        return players
 
     async def get_by_id(self, id: UUID) -> Player | None:
+        return await self.entity_cache.get_or_load(id, lambda: self._load_by_id(id))
+
+    async def _load_by_id(self, id: UUID) -> Player | None:
         doc = await self._get_by_id(id)
         return to_dataclass(doc, Player) if doc else None
 
+    async def get_all_fields(
+        self, fields: Fields, pagination: Pagination | None = None
+    ) -> list[dict[str, Any]]:
+        return await self._get_all_fields(fields, pagination)
+
+    async def get_fields_by_id(self, id: UUID, fields: Fields) -> dict[str, Any] | None:
+        # the entity cache holds whole players, a projected read skips it
+        return await self._get_fields_by_id(id, fields)
+
     async def create(self, player_in: PlayerIn) -> Player:
         doc = await self._create(player_in.model_dump())
         return to_dataclass(doc, Player)
 
-    async def update(self, id: UUID, update_data: PlayerUpdate) -> Player:
-        result = await self._update_by_id(id, update_data.model_dump())
-        return to_dataclass(result, Player)
+    async def update(
+        self, id: UUID, update_data: PlayerUpdate
+    ) -> tuple[Player, Player]:
+        before, after = await self._update_by_id(id, update_data.model_dump())
+        return to_dataclass(before, Player), to_dataclass(after, Player)
+
+    async def delete(self, id: UUID) -> Player:
+        doc = await self._delete(id)
+        return to_dataclass(doc, Player)
 
-    async def delete(self, id: UUID) -> None:
-        await self._delete(id)
+    async def evict(self, id: UUID) -> None:
+        await self.entity_cache.invalidate(id)
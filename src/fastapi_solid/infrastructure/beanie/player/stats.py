@@ -0,0 +1,100 @@
+import random
+from collections.abc import Mapping
+from typing import Any
+
+from pymongo import UpdateOne
+from pymongo.asynchronous.client_session import AsyncClientSession
+from pymongo.asynchronous.collection import AsyncCollection
+
+from fastapi_solid.application.interfaces.players.stats import (
+    PlayerGroup,
+    PlayerStatsRepository,
+)
+from fastapi_solid.infrastructure.beanie.player.model import PlayerOdm
+from fastapi_solid.infrastructure.beanie.setup.deadline import mongo_deadline
+from fastapi_solid.infrastructure.beanie.setup.durability import profiled
+from fastapi_solid.utils.logging.logger import get_logger
+
+logger = get_logger(__name__)
+
+STATS_COLLECTION = "players_stats"
+
+
+class BeaniePlayerStatsRepo(PlayerStatsRepository):
+    """Counters in `players_stats`, one document per (slot, color, is_alive).
+
+    Every write increments a random one of `slots` slot documents, so concurrent
+    transactions rarely conflict on the same document; a read sums all of them,
+    its cost depends on the number of groups, not players.
+    """
+
+    def __init__(self, session: AsyncClientSession, slots: int):
+        self._session = session
+        self.slots = slots
+
+    @property
+    def _collection(self) -> AsyncCollection[Any]:
+        return profiled(PlayerOdm.get_pymongo_collection().database[STATS_COLLECTION])
+
+    async def add(self, deltas: Mapping[PlayerGroup, int]) -> None:
+        slot = random.randrange(self.slots)
+        ops = [
+            UpdateOne(
+                {"_id": {"slot": slot, "color": color, "is_alive": is_alive}},
+                {"$inc": {"count": delta}},
+                upsert=True,
+            )
+            for (color, is_alive), delta in deltas.items()
+            if delta
+        ]
+        if ops:
+            with mongo_deadline():
+                await self._collection.bulk_write(
+                    ops, ordered=False, session=self._session
+                )
+
+    async def get_counts(self) -> dict[PlayerGroup, int]:
+        counts: dict[PlayerGroup, int] = {}
+        with mongo_deadline():
+            async for doc in self._collection.find({}, session=self._session):
+                group = (doc["_id"]["color"], doc["_id"]["is_alive"])
+                counts[group] = counts.get(group, 0) + doc["count"]
+        return {group: count for group, count in counts.items() if count}
+
+    async def reconcile(self) -> int | None:
+        before = await self.get_counts()
+        actual = await self._recount()
+        if await self.get_counts() != before:  # unknown which writes were recounted
+            logger.info("Player stats changed during the recount, retrying later")
+            return None
+
+        drift = {
+            group: actual.get(group, 0) - before.get(group, 0)
+            for group in actual.keys() | before.keys()
+        }
+        drift = {group: delta for group, delta in drift.items() if delta}
+        if drift:
+            logger.warning("Correcting player stats drift: %s", drift)
+            await self.add(drift)
+        await self._drop_empty()
+        return sum(abs(delta) for delta in drift.values())
+
+    async def _recount(self) -> dict[PlayerGroup, int]:
+        pipeline: list[dict[str, Any]] = [
+            {
+                "$group": {
+                    "_id": {"color": "$color", "is_alive": "$is_alive"},
+                    "count": {"$sum": 1},
+                }
+            }
+        ]
+        players = PlayerOdm.get_pymongo_collection()
+        cursor = await players.aggregate(pipeline, session=self._session)
+        return {
+            (doc["_id"]["color"], doc["_id"]["is_alive"]): doc["count"]
+            async for doc in cursor
+        }
+
+    async def _drop_empty(self) -> None:
+        # groups that no longer have players leave zeroed slot documents behind
+        await self._collection.delete_many({"count": 0}, session=self._session)
@@ -1,16 +1,21 @@
 from collections.abc import Sequence
-from typing import Any, overload
+from typing import Any, cast, overload
 from uuid import UUID
 
-from beanie import Document
+from beanie import Document, UpdateResponse
+from beanie.odm.utils.parsing import parse_obj
 from pymongo.asynchronous.client_session import AsyncClientSession
 
 from fastapi_solid.application.exceptions.app_error import NotFound
 from fastapi_solid.application.interfaces.common.pagination import Pagination
+from fastapi_solid.application.interfaces.common.projection import Fields
+from fastapi_solid.infrastructure.beanie.setup.deadline import mongo_deadline
 from fastapi_solid.utils.logging.logger import get_logger
 
 logger = get_logger(__name__)
 
+MIN_ID = UUID(int=0)  # sorts before any other id
+
 
 class BeanieRepo[T: Document]:
     model: type[T]
@@ -22,13 +27,46 @@ class BeanieRepo[T: Document]:
         cursor = self.model.find_all(session=self._session)
         if pagination:
             cursor = cursor.skip(pagination.offset).limit(pagination.limit)
-        return await cursor.to_list()
+        with mongo_deadline():
+            return await cursor.to_list()
+
+    async def _get_after(self, after: UUID | None, limit: int) -> Sequence[T]:
+        cursor = (
+            self.model.find(self.model.id > (after or MIN_ID), session=self._session)
+            .sort("+_id")
+            .limit(limit)
+        )
+        with mongo_deadline():
+            return await cursor.to_list()
 
     async def _get_by_id(self, id: UUID) -> T | None:
-        return await self.model.find_one(self.model.id == id, session=self._session)
+        with mongo_deadline():
+            return await self.model.find_one(self.model.id == id, session=self._session)
+
+    async def _get_all_fields(
+        self, fields: Fields, pagination: Pagination | None = None
+    ) -> list[dict[str, Any]]:
+        """Raw documents projected to `fields`, no model is parsed"""
+        cursor = self.model.get_pymongo_collection().find(
+            {}, _projection(fields), session=self._session
+        )
+        if pagination:
+            cursor = cursor.skip(pagination.offset).limit(pagination.limit)
+        with mongo_deadline():
+            return [_from_raw(doc) async for doc in cursor]
+
+    async def _get_fields_by_id(
+        self, id: UUID, fields: Fields
+    ) -> dict[str, Any] | None:
+        with mongo_deadline():
+            doc = await self.model.get_pymongo_collection().find_one(
+                {"_id": id}, _projection(fields), session=self._session
+            )
+        return _from_raw(doc) if doc else None
 
     async def _count(self) -> int:
-        return await self.model.find_all(session=self._session).count()
+        with mongo_deadline():
+            return await self.model.find_all(session=self._session).count()
 
     @overload
     async def _create(self, values: dict[str, Any]) -> T: ...
@@ -40,45 +78,57 @@ class BeanieRepo[T: Document]:
     ) -> T | Sequence[T]:
         if isinstance(values, dict):
             doc = self.model(**values)
-            await doc.insert(session=self._session)
+            with mongo_deadline():
+                await doc.insert(session=self._session)
             return doc
 
         if not values:
             return []
 
         docs = [self.model(**payload) for payload in values]
-        await self.model.insert_many(docs, session=self._session)
+        with mongo_deadline():
+            await self.model.insert_many(docs, session=self._session)
         return docs
 
     async def _update_by_id(
         self, id: UUID, values: dict[str, Any], exclude_none: bool = False
-    ) -> T:
+    ) -> tuple[T, T]:
+        """The document before and after `values` are set, read by the write itself"""
         if exclude_none:
             values = {k: v for k, v in values.items() if v is not None}
 
-        if values:
-            result = await self.model.find_one(
-                self.model.id == id, session=self._session
-            ).set(values, session=self._session)
-
-            matched = getattr(result, "matched_count", 0)
-
-            if matched == 0:
-                raise NotFound(f"{self.model.__name__[:-3]} with id={id} not found")
+        query = self.model.find_one(self.model.id == id, session=self._session)
+        with mongo_deadline():
+            if values:
+                before = await query.set(
+                    values,
+                    session=self._session,
+                    response_type=UpdateResponse.OLD_DOCUMENT,
+                )
+            else:
+                before = await query
+        if not before:
+            raise NotFound(f"{self.model.__name__[:-3]} with id={id} not found")
+        return before, before.model_copy(update=values)
 
-        updated_doc = await self.model.find_one(
-            self.model.id == id, session=self._session
-        )
-        if not updated_doc:
-            raise NotFound(
-                f"{self.model.__name__[:-3]} with id={id} not found after update"
+    async def _delete(self, id: UUID) -> T:
+        """The deleted document"""
+        with mongo_deadline():
+            doc = await self.model.get_pymongo_collection().find_one_and_delete(
+                {"_id": id}, session=self._session
             )
-        return updated_doc
-
-    async def _delete(self, id: UUID) -> None:
-        res = await self.model.find_one(
-            self.model.id == id, session=self._session
-        ).delete(session=self._session)
-        deleted = getattr(res, "deleted_count", 0) if res is not None else 0
-        if deleted == 0:
+        if not doc:
             raise NotFound(f"{self.model.__name__[:-3]} with id={id} not found")
+        return cast(T, parse_obj(self.model, doc))
+
+
+def _projection(fields: Fields) -> dict[str, bool]:
+    projection = {"_id": "id" in fields}  # `_id` is returned unless excluded
+    projection.update((f, True) for f in fields if f != "id")
+    return projection
+
+
+def _from_raw(doc: dict[str, Any]) -> dict[str, Any]:
+    if "_id" in doc:
+        doc["id"] = doc.pop("_id")
+    return doc
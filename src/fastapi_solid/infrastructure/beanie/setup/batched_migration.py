@@ -0,0 +1,151 @@
+import asyncio
+import time
+from collections import deque
+from collections.abc import Callable
+from inspect import signature
+from typing import Any
+
+from beanie import Document
+from beanie.migrations.controllers.base import BaseMigrationController
+from pymongo import UpdateOne
+from pymongo.asynchronous.collection import AsyncCollection
+
+from fastapi_solid.utils.config.settings import get_settings
+from fastapi_solid.utils.logging.logger import get_logger
+
+logger = get_logger(__name__)
+settings = get_settings()
+
+CHECKPOINTS_COLLECTION = "migrations_checkpoints"
+
+# raw document -> update spec for it, None to leave the document as is
+Transform = Callable[..., dict[str, Any] | None]
+
+
+class _Throughput:
+    report_interval = 10.0  # seconds
+
+    def __init__(self, name: str, processed: int):
+        self.name = name
+        self.started_at = self._reported_at = time.monotonic()
+        self.started_with = processed
+
+    def report(self, processed: int, final: bool = False) -> None:
+        now = time.monotonic()
+        if not final and now - self._reported_at < self.report_interval:
+            return
+        self._reported_at = now
+        done = processed - self.started_with
+        rate = done / max(now - self.started_at, 1e-9)
+        logger.info(
+            "%s: %s documents %s, %.0f docs/s",
+            self.name,
+            processed,
+            "migrated" if final else "so far",
+            rate,
+        )
+
+
+def batched_migration(
+    document_model: type[Document],
+    batch_size: int | None = None,
+    parallelism: int | None = None,
+):
+    """Beanie migration controller that rewrites documents with `bulk_write`.
+
+    The decorated function gets a raw document and returns an update spec for it
+    (e.g. `{"$rename": {...}}`), so no model is parsed or dumped per document.
+    Batches are read from one cursor in `_id` order and up to `parallelism` bulk
+    writes run at once. The last fully written `_id` is checkpointed, so an
+    interrupted run resumes after it; transforms must therefore be idempotent.
+
+    Writes don't join the migration transaction, a collection wide rewrite
+    doesn't fit into one.
+    """
+
+    class BatchedMigration(BaseMigrationController):
+        def __init__(self, function: Transform):
+            self.function = function
+            self.pass_self = "self" in signature(function).parameters
+            self.document_model = document_model
+            self.batch_size = batch_size or settings.mongo_migration_batch_size
+            self.parallelism = parallelism or settings.mongo_migration_parallelism
+            self.name = f"{function.__module__}.{function.__qualname__}"
+
+        def __call__(self, *args: Any, **kwargs: Any):
+            pass
+
+        @property
+        def models(self) -> list[type[Document]]:
+            return [self.document_model]
+
+        async def run(self, session: Any) -> None:
+            collection = self.document_model.get_pymongo_collection()
+            checkpoints = collection.database[CHECKPOINTS_COLLECTION]
+            checkpoint = await checkpoints.find_one({"_id": self.name}) or {}
+            last_id = checkpoint.get("last_id")
+            processed: int = checkpoint.get("processed", 0)
+            if last_id is not None:
+                logger.info("%s: resuming after %s documents", self.name, processed)
+
+            query = {"_id": {"$gt": last_id}} if last_id is not None else {}
+            cursor = collection.find(
+                query, sort=[("_id", 1)], batch_size=self.batch_size
+            )
+            throughput = _Throughput(self.name, processed)
+            # in-flight writes in read order: (task, last _id of the batch, size)
+            pending: deque[tuple[asyncio.Task[None], Any, int]] = deque()
+            try:
+                while batch := await cursor.to_list(self.batch_size):
+                    task = asyncio.create_task(self._write(collection, batch))
+                    pending.append((task, batch[-1]["_id"], len(batch)))
+                    if len(pending) >= self.parallelism:
+                        await asyncio.wait([pending[0][0]])
+                    # checkpoint only a prefix of finished batches, the ones after
+                    # a still running write are redone after a crash
+                    while pending and pending[0][0].done():
+                        task, last_id, size = pending.popleft()
+                        task.result()
+                        processed += size
+                        await self._checkpoint(checkpoints, last_id, processed)
+                        throughput.report(processed)
+                while pending:
+                    task, last_id, size = pending.popleft()
+                    await task
+                    processed += size
+                    await self._checkpoint(checkpoints, last_id, processed)
+            except BaseException:
+                for task, _, _ in pending:
+                    task.cancel()
+                raise
+            finally:
+                await cursor.close()
+
+            await checkpoints.delete_one({"_id": self.name})
+            throughput.report(processed, final=True)
+
+        async def _write(
+            self, collection: AsyncCollection[Any], batch: list[dict[str, Any]]
+        ) -> None:
+            ops: list[UpdateOne] = []
+            for document in batch:
+                update = (
+                    self.function(None, document)
+                    if self.pass_self
+                    else self.function(document)
+                )
+                if update:
+                    ops.append(UpdateOne({"_id": document["_id"]}, update))
+            if ops:
+                await collection.bulk_write(ops, ordered=False)
+
+        async def _checkpoint(
+            self, checkpoints: AsyncCollection[Any], last_id: Any, processed: int
+        ) -> None:
+            await checkpoints.update_one(
+                {"_id": self.name},
+                {"$set": {"last_id": last_id, "processed": processed}},
+                upsert=True,
+            )
+
+    return BatchedMigration
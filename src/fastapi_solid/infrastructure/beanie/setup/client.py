@@ -4,6 +4,7 @@ from typing import Any
 from beanie import Document, init_beanie  # type: ignore[reportUnknownVariableType]
 from pymongo import AsyncMongoClient
 
+from fastapi_solid.infrastructure.beanie.setup.command_timing import CommandTiming
 from fastapi_solid.utils.config.settings import get_settings
 
 settings = get_settings()
@@ -14,9 +15,10 @@ client = AsyncMongoClient(  # type: ignore[reportUnknownVariableType]
     connectTimeoutMS=2_000,
     socketTimeoutMS=10_000,
     maxPoolSize=50,
-    minPoolSize=1,
+    minPoolSize=settings.mongo_pool_min_size,
     uuidRepresentation="standard",
     retryWrites=True,
+    event_listeners=[CommandTiming()],
 )
 
 
@@ -0,0 +1,52 @@
+from typing import Any
+
+from pymongo import monitoring
+
+from fastapi_solid.utils.timing.context import record
+from fastapi_solid.utils.timing.slow_queries import log_slow_query
+
+# noise in a logged command, not part of its shape
+_IGNORED_FIELDS = frozenset({"lsid", "txnNumber", "$clusterTime", "$db"})
+
+
+class CommandTiming(monitoring.CommandListener):
+    """Adds every Mongo command to the request `mongo` timing, logs the slow ones.
+
+    Listeners are called synchronously by the task that runs the command, so the
+    request context is the current one.
+    """
+
+    max_pending = 10_000
+
+    def __init__(self):
+        self._commands: dict[tuple[int, int], tuple[str, Any]] = {}
+
+    def started(self, event: monitoring.CommandStartedEvent) -> None:
+        if len(self._commands) >= self.max_pending:  # finish events got lost
+            self._commands.clear()
+        self._commands[(event.request_id, event.operation_id or 0)] = (
+            event.command_name,
+            event.command,
+        )
+
+    def succeeded(self, event: monitoring.CommandSucceededEvent) -> None:
+        self._finished(event)
+
+    def failed(self, event: monitoring.CommandFailedEvent) -> None:
+        self._finished(event)
+
+    def _finished(
+        self, event: monitoring.CommandSucceededEvent | monitoring.CommandFailedEvent
+    ) -> None:
+        seconds = event.duration_micros / 1_000_000
+        record("mongo", seconds)
+        started = self._commands.pop((event.request_id, event.operation_id or 0), None)
+        if started is None:
+            return
+        name, command = started
+        log_slow_query(
+            "mongo",
+            f"{name} {command.get(name)}",
+            {k: v for k, v in command.items() if k not in _IGNORED_FIELDS},
+            seconds,
+        )
@@ -0,0 +1,24 @@
+from collections.abc import Iterator
+from contextlib import contextmanager
+
+import pymongo
+from pymongo.errors import PyMongoError
+
+from fastapi_solid.application.exceptions.app_error import DeadlineExceeded
+from fastapi_solid.utils.deadline.context import remaining_time
+
+
+@contextmanager
+def mongo_deadline() -> Iterator[None]:
+    """Bounds Mongo operations by the request deadline.
+
+    pymongo's client side operation timeout sends the remaining time as `maxTimeMS`
+    and uses it as the socket timeout, so a slow server can't hold the request.
+    """
+    with pymongo.timeout(remaining_time()):
+        try:
+            yield
+        except PyMongoError as e:
+            if e.timeout:
+                raise DeadlineExceeded() from e
+            raise
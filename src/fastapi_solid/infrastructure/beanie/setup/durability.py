@@ -0,0 +1,69 @@
+from dataclasses import dataclass
+from functools import cache
+from typing import Any
+
+from beanie import Document
+from pymongo.asynchronous.collection import AsyncCollection
+from pymongo.read_concern import ReadConcern
+from pymongo.write_concern import WriteConcern
+
+from fastapi_solid.utils.config.settings import get_settings
+from fastapi_solid.utils.durability.context import Durability, current_durability
+
+settings = get_settings()
+
+
+@dataclass(frozen=True, slots=True)
+class MongoProfile:
+    write_concern: WriteConcern
+    read_concern: ReadConcern
+    transaction: bool  # whether a unit of work runs in a transaction
+
+
+PROFILES: dict[Durability, MongoProfile] = {
+    Durability.FAST: MongoProfile(
+        WriteConcern(w=1), ReadConcern("local"), transaction=False
+    ),
+    Durability.DURABLE: MongoProfile(
+        WriteConcern(w="majority"), ReadConcern("majority"), transaction=True
+    ),
+}
+
+
+def current_profile() -> Durability:
+    """Profile chosen by the context, `mongo_durability` when none was chosen"""
+    return current_durability() or Durability(settings.mongo_durability)
+
+
+def mongo_profile() -> MongoProfile:
+    return PROFILES[current_profile()]
+
+
+def profiled[D: dict[str, Any]](collection: AsyncCollection[D]) -> AsyncCollection[D]:
+    """`collection` with the concerns of the current profile.
+
+    Inside a transaction pymongo uses the concerns of the transaction instead.
+    """
+    return _with_profile(collection, current_profile())
+
+
+@cache
+def _with_profile[D: dict[str, Any]](
+    collection: AsyncCollection[D], durability: Durability
+) -> AsyncCollection[D]:
+    profile = PROFILES[durability]
+    return collection.with_options(
+        write_concern=profile.write_concern, read_concern=profile.read_concern
+    )
+
+
+class ProfiledDocument(Document):
+    """Document whose queries and writes use the profile of the current context.
+
+    Beanie reaches the collection only through `get_pymongo_collection`, so
+    `BeanieRepo` operations and raw ones of the repositories both follow it.
+    """
+
+    @classmethod
+    def get_pymongo_collection(cls) -> AsyncCollection[Any]:
+        return profiled(super().get_pymongo_collection())
@@ -3,18 +3,30 @@ from types import TracebackType
 from pymongo.asynchronous.client_session import AsyncClientSession
 
 from fastapi_solid.application.interfaces.common.uow import UnitOfWork
+from fastapi_solid.infrastructure.beanie.setup.deadline import mongo_deadline
+from fastapi_solid.infrastructure.beanie.setup.durability import mongo_profile
 from fastapi_solid.utils.config.settings import get_settings
 
 settings = get_settings()
 
 
 class BeanieUnitOfWork(UnitOfWork):
+    """Transaction with the concerns of the current durability profile.
+
+    Profiles without a transaction (`fast`) run the operations on their own,
+    each with the write concern of the profile; commit and rollback are no-ops.
+    """
+
     def __init__(self, session: AsyncClientSession):
         self._session = session
 
     async def __aenter__(self) -> "UnitOfWork":
         await self._session.__aenter__()
-        await self._session.start_transaction()
+        profile = mongo_profile()
+        if profile.transaction:
+            await self._session.start_transaction(
+                read_concern=profile.read_concern, write_concern=profile.write_concern
+            )
         return self
 
     async def __aexit__(
@@ -23,15 +35,19 @@ class BeanieUnitOfWork(UnitOfWork):
         exc: BaseException | None,
         tb: TracebackType | None,
     ) -> None:
-        if exc_type is not None:
+        if exc_type is not None and self._session.in_transaction:
             await self._session.abort_transaction()
         await self._session.__aexit__(exc_type, exc, tb)
 
     async def commit(self) -> None:
-        await self._session.commit_transaction()
+        if not self._session.in_transaction:
+            return
+        with mongo_deadline():
+            await self._session.commit_transaction()
 
     async def rollback(self) -> None:
-        await self._session.abort_transaction()
+        if self._session.in_transaction:
+            await self._session.abort_transaction()
 
 
 class DummyBeanieUnitOfWork(UnitOfWork):
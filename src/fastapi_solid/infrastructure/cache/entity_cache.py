@@ -0,0 +1,77 @@
+from collections.abc import Awaitable, Callable, Mapping
+from dataclasses import is_dataclass
+from uuid import UUID
+
+from fastapi_solid.application.interfaces.common.key_value_cache import KeyValueCache
+from fastapi_solid.utils.converters.cache_codec import get_codec
+from fastapi_solid.utils.logging.logger import get_logger
+
+logger = get_logger(__name__)
+
+NEGATIVE = b"\x00"  # cached "not found", never a valid codec header
+
+
+class EntityCache[D]:
+    """Read-through cache of domain dataclasses by id for repositories.
+
+    Keys embed the dataclass schema version, so entries of an older shape are
+    never read after a deploy. Misses of the source are cached for a short
+    `negative_ttl`. List pages are written through with `put_many`, so opening an
+    entity of a listed page is a hit. Entries are invalidated after an update or
+    delete is committed; invalidating before, a concurrent read could cache the old
+    row again.
+    """
+
+    def __init__(
+        self,
+        cache: KeyValueCache,
+        dc: type[D],
+        namespace: str,
+        ttl: int,
+        negative_ttl: int,
+        enabled: bool = True,
+    ):
+        if not is_dataclass(dc):
+            raise TypeError(f"{dc} is not a dataclass")
+        self._cache = cache
+        self._codec = get_codec(dc)
+        self._prefix = f"entity:{namespace}:{self._codec.schema_hash:08x}:"
+        self._ttl = ttl
+        self._negative_ttl = negative_ttl
+        self._enabled = enabled
+
+    def key(self, id: UUID) -> str:
+        return self._prefix + str(id)
+
+    async def get_or_load(
+        self, id: UUID, loader: Callable[[], Awaitable[D | None]]
+    ) -> D | None:
+        if not self._enabled:
+            return await loader()
+
+        key = self.key(id)
+        if cached := await self._cache.get(key):
+            if cached == NEGATIVE:
+                return None
+            try:
+                if (entity := self._codec.decode(cached)) is not None:
+                    return entity
+            except ValueError:  # damaged entry
+                logger.debug("Failed to validate cache for key=%s", key, exc_info=True)
+
+        entity = await loader()
+        if entity is None:
+            await self._cache.set(key, NEGATIVE, self._negative_ttl)
+        else:
+            await self._cache.set(key, self._codec.encode(entity), self._ttl)
+        return entity
+
+    async def put_many(self, entities: Mapping[UUID, D]) -> None:
+        """Caches already loaded entities by id in one round trip"""
+        if self._enabled and entities:
+            values = {self.key(id): self._codec.encode(e) for id, e in entities.items()}
+            await self._cache.set_many(values, self._ttl)
+
+    async def invalidate(self, id: UUID) -> None:
+        if self._enabled:
+            await self._cache.delete(self.key(id))
@@ -0,0 +1,108 @@
+import asyncio
+import contextvars
+from collections import deque
+from collections.abc import AsyncIterator
+from typing import Protocol
+
+from fastapi_solid.application.interfaces.common.change_feed import (
+    ChangeEvent,
+    ChangeFeed,
+    ChangeOp,
+)
+from fastapi_solid.utils.logging.logger import get_logger
+
+logger = get_logger(__name__)
+
+
+class ChangeSource(Protocol):
+    # whether `stream` can continue from a token after a reconnect
+    resumable: bool
+
+    def stream(self, resume_token: str | None) -> AsyncIterator[ChangeEvent]: ...
+
+
+class ChangeBroadcaster(ChangeFeed):
+    """Fans one database listener out to every subscriber of the worker.
+
+    The listener starts with the first subscriber and reconnects with backoff.
+    Recent events are kept, so a subscriber reconnecting with a known token gets
+    what it missed. Unknown tokens, overflowing subscriber queues and lost source
+    history produce a RESET event instead.
+    """
+
+    max_backoff = 30.0
+
+    def __init__(
+        self, name: str, source: ChangeSource, history_size: int, queue_size: int
+    ):
+        self.name = name
+        self._source = source
+        self._history: deque[ChangeEvent] = deque(maxlen=history_size)
+        self._queue_size = queue_size
+        self._subscribers: set[asyncio.Queue[ChangeEvent]] = set()
+        self._task: asyncio.Task[None] | None = None
+
+    async def subscribe(
+        self, resume_token: str | None = None
+    ) -> AsyncIterator[ChangeEvent]:
+        if self._task is None or self._task.done():
+            # fresh context, the listener must not inherit the request deadline
+            self._task = asyncio.create_task(
+                self._run(), name=f"cdc-{self.name}", context=contextvars.Context()
+            )
+
+        queue: asyncio.Queue[ChangeEvent] = asyncio.Queue(self._queue_size)
+        backlog = self._backlog(resume_token) if resume_token else []
+        self._subscribers.add(queue)
+        try:
+            for event in backlog:
+                yield event
+            while True:
+                yield await queue.get()
+        finally:
+            self._subscribers.discard(queue)
+
+    async def close(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            await asyncio.gather(self._task, return_exceptions=True)
+            self._task = None
+
+    def _backlog(self, resume_token: str) -> list[ChangeEvent]:
+        tokens = [e.token for e in self._history]
+        if resume_token not in tokens:
+            return [self._reset_event()]
+        return list(self._history)[tokens.index(resume_token) + 1 :]
+
+    async def _run(self) -> None:
+        token: str | None = None
+        backoff = 1.0
+        while True:
+            try:
+                async for event in self._source.stream(token):
+                    token = event.token
+                    backoff = 1.0
+                    self._publish(event)
+            except Exception:
+                logger.warning("%s change listener failed", self.name, exc_info=True)
+            if not self._source.resumable:  # events may be lost until reconnect
+                token = None
+                self._history.clear()
+                self._publish(self._reset_event())
+            await asyncio.sleep(backoff)
+            backoff = min(backoff * 2, self.max_backoff)
+
+    def _publish(self, event: ChangeEvent) -> None:
+        if event.op is not ChangeOp.RESET:
+            self._history.append(event)
+        for queue in self._subscribers:
+            try:
+                queue.put_nowait(event)
+            except asyncio.QueueFull:  # slow client, make it refetch
+                while not queue.empty():
+                    queue.get_nowait()
+                queue.put_nowait(self._reset_event())
+
+    def _reset_event(self) -> ChangeEvent:
+        last = self._history[-1].token if self._history else ""
+        return ChangeEvent(token=last, op=ChangeOp.RESET, id="")
@@ -1,9 +1,18 @@
+from typing import Any
+
 from dependency_injector import containers, providers
 from redis.asyncio import Redis  # type: ignore[reportMissingTypeStubs]
 
+from fastapi_solid.application.dashboard.service import DashboardService
+from fastapi_solid.application.exports.service import ExportService
 from fastapi_solid.application.players.service import PlayerService
 from fastapi_solid.application.users.service import UserService
+from fastapi_solid.domain.player.model import Player
+from fastapi_solid.domain.user.model import User
+from fastapi_solid.infrastructure.beanie.change_stream import MongoChangeSource
+from fastapi_solid.infrastructure.beanie.player.model import PlayerOdm
 from fastapi_solid.infrastructure.beanie.player.repo import BeaniePlayerRepo
+from fastapi_solid.infrastructure.beanie.player.stats import BeaniePlayerStatsRepo
 from fastapi_solid.infrastructure.beanie.setup.client import (
     client,  # type: ignore[reportUnknownVariableType]
 )
@@ -11,44 +20,193 @@ from fastapi_solid.infrastructure.beanie.uow import (
     BeanieUnitOfWork,
     DummyBeanieUnitOfWork,
 )
+from fastapi_solid.infrastructure.cache.entity_cache import EntityCache
+from fastapi_solid.infrastructure.cdc.broadcaster import ChangeBroadcaster
+from fastapi_solid.infrastructure.di.context_proxy import ContextProxy
+from fastapi_solid.infrastructure.exports.files import ExportFiles
 from fastapi_solid.infrastructure.redis.cache import RedisCache
-from fastapi_solid.infrastructure.sqlalchemy.setup.engine import async_session_factory
-from fastapi_solid.infrastructure.sqlalchemy.uow import AlchemyUnitOfWork
-from fastapi_solid.infrastructure.sqlalchemy.user.repo import AlchemyUserRepo
+from fastapi_solid.infrastructure.redis.circuit_breaker import CircuitBreaker
+from fastapi_solid.infrastructure.redis.idempotency import RedisIdempotencyStore
+from fastapi_solid.infrastructure.redis.job_queue import RedisJobQueue
+from fastapi_solid.infrastructure.redis.rate_limiter import RedisRateLimiter
+from fastapi_solid.infrastructure.sqlalchemy.change_notify import PostgresChangeSource
+from fastapi_solid.infrastructure.sqlalchemy.setup.engine import (
+    async_session_factory,
+    sharded_session_factory,
+)
+from fastapi_solid.infrastructure.sqlalchemy.uow import (
+    AlchemyUnitOfWork,
+    ShardedUnitOfWork,
+)
+from fastapi_solid.infrastructure.sqlalchemy.user.repo import (
+    AlchemyUserRepo,
+    ShardedAlchemyUserRepo,
+)
 from fastapi_solid.utils.config.settings import get_settings
 
 settings = get_settings()
 
+PER_REQUEST, SHARED = "per_request", "shared"
+
+
+def _scoped(scope: providers.Provider[str], cls: type, **kwargs: object) -> Any:
+    # stateless uow/repos/services are built once per container in the shared
+    # scope and reach the request session through a ContextProxy
+    return providers.Selector(
+        scope,
+        per_request=providers.Factory(cls, **kwargs),
+        shared=providers.Singleton(cls, **kwargs),
+    )
+
 
 class Container(containers.DeclarativeContainer):
     wiring_config = containers.WiringConfiguration(
         packages=["fastapi_solid.infrastructure.fastapi.endpoints.v1"]
     )  # fastapi integration
 
+    # e.g. `Container(config={"di_scope": SHARED})`
+    config = providers.Configuration(
+        default={
+            "di_scope": SHARED if settings.di_stateless_singletons else PER_REQUEST
+        }
+    )
+    scope = config.di_scope
+
     redis = providers.Singleton(
         Redis.from_url,  # type: ignore[reportUnknownMemberType]
         settings.redis_dsn,
+        socket_timeout=settings.redis_socket_timeout,
+        socket_connect_timeout=settings.redis_socket_timeout,
     )
 
-    key_value_cache = providers.Singleton(RedisCache, redis_client=redis)
+    redis_breaker = providers.Singleton(
+        CircuitBreaker,
+        name="redis",
+        failure_threshold=settings.redis_breaker_failure_threshold,
+        slow_call_threshold=settings.redis_breaker_slow_call_threshold,
+        reset_timeout=settings.redis_breaker_reset_timeout,
+    )
+
+    key_value_cache = providers.Singleton(
+        RedisCache, redis_client=redis, breaker=redis_breaker
+    )
+    rate_limiter = providers.Singleton(
+        RedisRateLimiter,
+        redis_client=redis,
+        breaker=redis_breaker,
+        lease_size=settings.rate_limit_lease_size,
+    )
+    idempotency_store = providers.Singleton(
+        RedisIdempotencyStore,
+        redis_client=redis,
+        breaker=redis_breaker,
+        ttl=settings.idempotency_ttl,
+        lock_ttl=settings.idempotency_lock_ttl,
+    )
 
-    al_session = providers.ContextLocalSingleton(async_session_factory)
+    if settings.db_shard_dsns:
+        al_session = providers.ContextLocalSingleton(sharded_session_factory)
+    else:
+        al_session = providers.ContextLocalSingleton(async_session_factory)
     be_session = providers.ContextLocalSingleton(client.start_session)
+    al_session_ref = providers.Selector(
+        scope,
+        per_request=al_session,
+        shared=providers.Singleton(ContextProxy, al_session.provider),
+    )
+    be_session_ref = providers.Selector(
+        scope,
+        per_request=be_session,
+        shared=providers.Singleton(ContextProxy, be_session.provider),
+    )
 
-    alchemy_uow = providers.Factory(AlchemyUnitOfWork, session=al_session)
-    beanie_uow = providers.Factory(
+    alchemy_uow = _scoped(
+        scope,
+        ShardedUnitOfWork if settings.db_shard_dsns else AlchemyUnitOfWork,
+        session=al_session_ref,
+    )
+    beanie_uow = _scoped(
+        scope,
         BeanieUnitOfWork if settings.mongo_use_transactions else DummyBeanieUnitOfWork,
-        session=be_session,
+        session=be_session_ref,
+    )
+
+    users_entity_cache = providers.Singleton(
+        EntityCache,
+        cache=key_value_cache,
+        dc=User,
+        namespace="user",
+        ttl=settings.entity_cache_ttl,
+        negative_ttl=settings.entity_cache_negative_ttl,
+        enabled=settings.entity_cache_enabled,
+    )
+    users_repo = _scoped(
+        scope,
+        ShardedAlchemyUserRepo if settings.db_shard_dsns else AlchemyUserRepo,
+        session=al_session_ref,
+        cache=key_value_cache,
+        entity_cache=users_entity_cache,
+        raw_reads=settings.db_raw_reads,
     )
+    users_service = _scoped(scope, UserService, uow=alchemy_uow, users_repo=users_repo)
 
-    users_repo = providers.Factory(
-        AlchemyUserRepo, session=al_session, cache=key_value_cache
+    players_entity_cache = providers.Singleton(
+        EntityCache,
+        cache=key_value_cache,
+        dc=Player,
+        namespace="player",
+        ttl=settings.entity_cache_ttl,
+        negative_ttl=settings.entity_cache_negative_ttl,
+        enabled=settings.entity_cache_enabled,
     )
-    users_service = providers.Factory(
-        UserService, uow=alchemy_uow, users_repo=users_repo
+    player_repo = _scoped(
+        scope,
+        BeaniePlayerRepo,
+        session=be_session_ref,
+        entity_cache=players_entity_cache,
+    )
+    player_stats_repo = _scoped(
+        scope,
+        BeaniePlayerStatsRepo,
+        session=be_session_ref,
+        slots=settings.player_stats_slots,
+    )
+    player_service = _scoped(
+        scope,
+        PlayerService,
+        uow=beanie_uow,
+        players_repo=player_repo,
+        stats_repo=player_stats_repo,
+    )
+
+    dashboard_service = _scoped(
+        scope,
+        DashboardService,
+        users_service=users_service.provider,
+        player_service=player_service.provider,
     )
 
-    player_repo = providers.Factory(BeaniePlayerRepo, session=be_session)
-    player_service = providers.Factory(
-        PlayerService, uow=beanie_uow, players_repo=player_repo
+    export_queue = providers.Singleton(
+        RedisJobQueue, redis_client=redis, name="exports", ttl=settings.export_ttl
+    )
+    export_files = providers.Singleton(ExportFiles, root=settings.export_dir)
+    export_service = _scoped(scope, ExportService, job_queue=export_queue)
+
+    users_change_feed = providers.Singleton(
+        ChangeBroadcaster,
+        name="users",
+        source=providers.Singleton(
+            PostgresChangeSource,
+            dsns=settings.db_shard_dsns or [settings.db_dsn],
+            channel="users_changes",
+        ),
+        history_size=settings.cdc_history_size,
+        queue_size=settings.cdc_subscriber_queue_size,
+    )
+    players_change_feed = providers.Singleton(
+        ChangeBroadcaster,
+        name="players",
+        source=providers.Singleton(MongoChangeSource, PlayerOdm),
+        history_size=settings.cdc_history_size,
+        queue_size=settings.cdc_subscriber_queue_size,
     )
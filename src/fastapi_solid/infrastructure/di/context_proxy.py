@@ -0,0 +1,24 @@
+from collections.abc import Callable
+from typing import Any
+
+
+class ContextProxy:
+    """Stand-in for a context-local object such as a request session.
+
+    Every attribute access resolves the object of the current context through
+    `provider` (e.g. a `ContextLocalSingleton`), so services and repos holding the
+    proxy can be built once and shared between requests. `__class__` is forwarded
+    too, so `isinstance` checks of drivers still pass.
+    """
+
+    __slots__ = ("_provider",)
+
+    def __init__(self, provider: Callable[[], Any]):
+        object.__setattr__(self, "_provider", provider)
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._provider(), name)
+
+    @property
+    def __class__(self) -> type:  # type: ignore[reportIncompatibleVariableOverride]
+        return self._provider().__class__
@@ -0,0 +1,54 @@
+import os
+import shutil
+import time
+from collections.abc import Iterator, Sequence
+from pathlib import Path
+from uuid import UUID
+
+
+class ExportFiles:
+    """Export results on local disk, one directory of NDJSON chunks per job.
+
+    API and worker processes must share `root` (a volume in docker-compose).
+    Calls do blocking file I/O, run them in a thread from async code.
+    """
+
+    read_block_size = 64 * 1024
+
+    def __init__(self, root: str):
+        self._root = Path(root)
+
+    def clear(self, job_id: UUID) -> None:
+        shutil.rmtree(self._job_dir(job_id), ignore_errors=True)
+
+    def write_chunk(self, job_id: UUID, number: int, lines: Sequence[str]) -> None:
+        job_dir = self._job_dir(job_id)
+        job_dir.mkdir(parents=True, exist_ok=True)
+        path = job_dir / f"part-{number:05d}.ndjson"
+        tmp_path = path.with_suffix(".tmp")
+        with tmp_path.open("w", encoding="utf-8") as f:
+            for line in lines:
+                f.write(line)
+                f.write("\n")
+        os.replace(tmp_path, path)  # readers never see a half written chunk
+
+    def read(self, job_id: UUID) -> Iterator[bytes]:
+        """All chunks of the job as one NDJSON stream"""
+        for path in sorted(self._job_dir(job_id).glob("part-*.ndjson")):
+            with path.open("rb") as f:
+                while block := f.read(self.read_block_size):
+                    yield block
+
+    def delete_expired(self, max_age: float) -> int:
+        if not self._root.is_dir():
+            return 0
+        expire_before = time.time() - max_age
+        deleted = 0
+        for job_dir in self._root.iterdir():
+            if job_dir.is_dir() and job_dir.stat().st_mtime < expire_before:
+                shutil.rmtree(job_dir, ignore_errors=True)
+                deleted += 1
+        return deleted
+
+    def _job_dir(self, job_id: UUID) -> Path:
+        return self._root / str(job_id)
@@ -0,0 +1,106 @@
+import asyncio
+import contextvars
+import time
+from collections.abc import Awaitable, Callable, Mapping, Sequence
+from typing import Protocol
+from uuid import UUID
+
+from fastapi_solid.application.interfaces.common.job_queue import (
+    Job,
+    JobQueue,
+    JobStatus,
+)
+from fastapi_solid.infrastructure.exports.files import ExportFiles
+from fastapi_solid.utils.logging.logger import get_logger
+
+logger = get_logger(__name__)
+
+
+class ExportRow(Protocol):
+    id: UUID
+
+    def model_dump_json(self) -> str: ...
+
+
+# (after id, limit) -> next rows in id order
+ExportSource = Callable[[UUID | None, int], Awaitable[Sequence[ExportRow]]]
+
+
+class ExportWorker:
+    """Runs queued export jobs chunk by chunk, reporting progress after each one.
+
+    Rows are read with keyset pagination in short transactions, one per chunk, so
+    an export never pins a connection or a snapshot for its whole duration.
+    """
+
+    housekeeping_interval = 30.0  # seconds
+
+    def __init__(
+        self,
+        job_queue: JobQueue,
+        files: ExportFiles,
+        sources: Mapping[str, ExportSource],
+        chunk_size: int,
+        poll_interval: float,
+        stale_after: float,
+        files_ttl: float,
+    ):
+        self.job_queue = job_queue
+        self.files = files
+        self.sources = sources
+        self.chunk_size = chunk_size
+        self.poll_interval = poll_interval
+        self.stale_after = stale_after
+        self.files_ttl = files_ttl
+        self._next_housekeeping = 0.0
+
+    async def run(self, stop: asyncio.Event) -> None:
+        logger.info("Export worker started")
+        while not stop.is_set():
+            job = await self.job_queue.reserve(self.poll_interval)
+            if job is None:  # idle, good time for housekeeping
+                await self._housekeeping()
+                continue
+            await self._process(job)
+        logger.info("Export worker stopped")
+
+    async def _process(self, job: Job) -> None:
+        source = self.sources.get(job.kind)
+        job.processed = job.chunks = 0  # a requeued job starts over
+        try:
+            if source is None:
+                raise ValueError(f"Unknown export kind '{job.kind}'")
+            await asyncio.to_thread(self.files.clear, job.id)
+            after: UUID | None = None
+            while rows := await self._fetch(source, after):
+                lines = [row.model_dump_json() for row in rows]
+                await asyncio.to_thread(
+                    self.files.write_chunk, job.id, job.chunks, lines
+                )
+                job.chunks += 1
+                job.processed += len(rows)
+                after = rows[-1].id
+                await self.job_queue.update(job)
+            job.status = JobStatus.DONE
+            logger.info("Export %s done, %s rows", job.id, job.processed)
+        except Exception as e:
+            logger.exception("Export %s failed", job.id)
+            job.status = JobStatus.FAILED
+            job.error = str(e)
+        await self.job_queue.complete(job)
+
+    async def _fetch(
+        self, source: ExportSource, after: UUID | None
+    ) -> Sequence[ExportRow]:
+        # a fresh context per chunk gets fresh DB sessions, like a request does
+        return await asyncio.create_task(
+            source(after, self.chunk_size), context=contextvars.Context()
+        )
+
+    async def _housekeeping(self) -> None:
+        if time.monotonic() < self._next_housekeeping:
+            return
+        self._next_housekeeping = time.monotonic() + self.housekeeping_interval
+        if requeued := await self.job_queue.requeue_stale(self.stale_after):
+            logger.warning("Requeued %s stale export jobs", requeued)
+        await asyncio.to_thread(self.files.delete_expired, self.files_ttl)
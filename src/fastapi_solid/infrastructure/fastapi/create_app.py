@@ -3,17 +3,31 @@ from contextlib import asynccontextmanager
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi_cache import FastAPICache
-from fastapi_cache.backends.redis import RedisBackend
 
+from fastapi_solid.application.common.fan_out import isolate_per_branch
 from fastapi_solid.infrastructure.beanie import docs
 from fastapi_solid.infrastructure.beanie.setup.client import (
     client,  # type: ignore[reportUnknownVariableType]
     init_beanie_async,
 )
 from fastapi_solid.infrastructure.di.container import Container
+from fastapi_solid.infrastructure.redis.fastapi_cache_backend import BreakerRedisBackend
+from fastapi_solid.utils.config.settings import get_settings
 
 from .endpoints import api_v1_router
+from .endpoints.health import health_router
+from .endpoints.metrics import metrics_router
+from .endpoints.profiling import profiling_router
 from .error_handler import register_error_handlers
+from .middlewares.adaptive_limit import AdaptiveLimit
+from .middlewares.concurrency_limit import ConcurrencyLimitMiddleware
+from .middlewares.deadline import DeadlineMiddleware
+from .middlewares.idempotency import IdempotencyMiddleware
+from .middlewares.profiling import ProfilingMiddleware
+from .middlewares.server_timing import ServerTimingMiddleware
+from .warmup import warm_up
+
+settings = get_settings()
 
 
 @asynccontextmanager
@@ -21,12 +35,21 @@ async def lifespan(app: FastAPI):
     container = Container()
 
     redis = container.redis()
-    FastAPICache.init(RedisBackend(redis), prefix="fastapi-cache")
+    FastAPICache.init(
+        BreakerRedisBackend(redis, container.redis_breaker()), prefix="fastapi-cache"
+    )
 
     app.container = container  # type: ignore[reportAttributeAccessIssue]
+    isolate_per_branch(container.al_session.reset, container.be_session.reset)
 
     await init_beanie_async(docs)
+    if settings.warmup_enabled:
+        await warm_up(app, redis)
+    app.state.ready = True
     yield
+    app.state.ready = False
+    await container.users_change_feed().close()
+    await container.players_change_feed().close()
     await client.close()
     await redis.close()
 
@@ -34,6 +57,31 @@ async def lifespan(app: FastAPI):
 def create_app() -> FastAPI:
     app = FastAPI(lifespan=lifespan, docs_url="/api/docs")
 
+    if settings.idempotency_enabled:
+        app.add_middleware(
+            IdempotencyMiddleware, wait_timeout=settings.idempotency_wait_timeout
+        )
+    app.add_middleware(
+        DeadlineMiddleware,
+        default_timeout=settings.request_timeout_default,
+        max_timeout=settings.request_timeout_max,
+    )
+
+    if settings.concurrency_limit_enabled:
+        app.add_middleware(
+            ConcurrencyLimitMiddleware,
+            limit=AdaptiveLimit(
+                initial=settings.concurrency_limit_initial,
+                min_limit=settings.concurrency_limit_min,
+                max_limit=settings.concurrency_limit_max,
+                tolerance=settings.concurrency_latency_tolerance,
+            ),
+            read_share=settings.concurrency_read_share,
+            exclude_suffixes=("/stream",),
+            unsampled_prefixes=("/health", "/metrics"),
+        )
+    if settings.server_timing_enabled:
+        app.add_middleware(ServerTimingMiddleware)
     app.add_middleware(
         CORSMiddleware,
         allow_origins=["*"],
@@ -41,7 +89,18 @@ def create_app() -> FastAPI:
         allow_methods=["*"],
         allow_headers=["*"],
     )
+    if settings.profiling_enabled:
+        app.add_middleware(
+            ProfilingMiddleware,
+            token=settings.profiling_token,
+            sample_rate=settings.profiling_sample_rate,
+            interval=settings.profiling_interval,
+        )
 
     app.include_router(api_v1_router)
+    app.include_router(metrics_router)
+    app.include_router(health_router)
+    if settings.profiling_enabled:
+        app.include_router(profiling_router)
     register_error_handlers(app)
     return app
@@ -0,0 +1,15 @@
+from fastapi_solid.utils.durability.context import Durability, set_durability
+
+
+class DurabilityProfile:
+    """Route dependency choosing the durability profile of the request.
+
+    Put it into the route `dependencies`, the unit of work and the repositories
+    of the request then use `profile` unless a service method chooses another.
+    """
+
+    def __init__(self, profile: Durability):
+        self.profile = profile
+
+    async def __call__(self) -> None:
+        set_durability(self.profile)
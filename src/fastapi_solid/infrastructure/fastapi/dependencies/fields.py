@@ -0,0 +1,63 @@
+from functools import cache
+from typing import Annotated, Any
+
+from fastapi import Query
+from fastapi.encoders import jsonable_encoder
+from fastapi_cache.coder import JsonCoder
+from pydantic import BaseModel, Field
+
+from fastapi_solid.application.common.projection import partial_model
+from fastapi_solid.application.exceptions.app_error import ValidationError
+from fastapi_solid.application.interfaces.common.projection import Fields
+
+
+class FieldSelection:
+    """Route dependency reading the `fields` query parameter of a sparse fieldset.
+
+    `?fields=id,name` selects output fields of `model` to load and return; unknown
+    names are rejected. Without the parameter, or when it names every field, it
+    returns None and the route serves whole entities.
+    """
+
+    def __init__(self, model: type[BaseModel]):
+        self.allowed = frozenset(model.model_fields)
+
+    def __call__(
+        self,
+        fields: Annotated[
+            str | None, Query(description="Comma separated output fields")
+        ] = None,
+    ) -> Fields | None:
+        if not fields:
+            return None
+        selected = {f.strip() for f in fields.split(",") if f.strip()}
+        if unknown := selected - self.allowed:
+            raise ValidationError(
+                f"Unknown fields: {', '.join(sorted(unknown))}, "
+                f"allowed: {', '.join(sorted(self.allowed))}"
+            )
+        if not selected or selected == self.allowed:
+            return None
+        return tuple(sorted(selected))
+
+
+@cache
+def sparse(model: type[BaseModel]) -> Any:
+    """Response model of whole `model` outputs or sparse ones of its fields.
+
+    Routes using it set `response_model_exclude_unset=True`, so fields not
+    selected are left out of the response instead of being sent as nulls.
+    """
+    return Annotated[model | partial_model(model), Field(union_mode="left_to_right")]
+
+
+class SparseJsonCoder(JsonCoder):
+    """Response cache coder for `sparse` routes.
+
+    The default one dumps unset fields of a sparse output as nulls, which a cache
+    hit would then send; this one leaves them out, as the miss did.
+    """
+
+    @classmethod
+    def encode(cls, value: Any) -> bytes:
+        return super().encode(jsonable_encoder(value, exclude_unset=True))
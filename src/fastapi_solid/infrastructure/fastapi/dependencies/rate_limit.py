@@ -0,0 +1,74 @@
+from collections.abc import Callable
+from functools import cache
+from ipaddress import ip_address, ip_network
+
+from fastapi import Request
+
+from fastapi_solid.application.exceptions.app_error import RateLimited
+from fastapi_solid.application.interfaces.common.rate_limiter import RateLimiter
+from fastapi_solid.utils.config.settings import get_settings
+
+settings = get_settings()
+
+
+trusted_networks = [ip_network(p, strict=False) for p in settings.trusted_proxies]
+
+
+@cache
+def _is_trusted(host: str) -> bool:
+    try:
+        address = ip_address(host)
+    except ValueError:
+        return False
+    return any(address in network for network in trusted_networks)
+
+
+def client_ip(request: Request) -> str:
+    """The peer address, or behind trusted proxies the rightmost untrusted hop.
+
+    `X-Forwarded-For` is only believed when it was set by a trusted proxy, any
+    client can send the header, and entries left of the first untrusted hop may
+    be forged.
+    """
+    host = request.client.host if request.client else "unknown"
+    if not _is_trusted(host):
+        return host
+    forwarded = request.headers.get("x-forwarded-for", "")
+    hops = [h.strip() for h in forwarded.split(",") if h.strip()]
+    for hop in reversed(hops):
+        if not _is_trusted(hop):
+            return hop
+    return hops[0] if hops else host
+
+
+class RateLimit:
+    """Route dependency that rejects a client once its token bucket is empty.
+
+    Put it into the route `dependencies`, so it runs before `@inject` resolves
+    services and no session or UoW is created for rejected requests.
+    """
+
+    def __init__(
+        self,
+        rate: float | None = None,
+        burst: int | None = None,
+        key_func: Callable[[Request], str] = client_ip,
+    ):
+        self.rate = settings.rate_limit_rate if rate is None else rate
+        self.burst = settings.rate_limit_burst if burst is None else burst
+        if self.rate <= 0 or self.burst < 0:
+            raise ValueError(f"Invalid rate limit: rate={rate}, burst={burst}")
+        self.key_func = key_func
+
+    async def __call__(self, request: Request) -> None:
+        if not settings.rate_limit_enabled:
+            return
+
+        limiter: RateLimiter = request.app.container.rate_limiter()
+        route = request.scope.get("route")
+        route_key = getattr(route, "path", request.url.path)
+        key = f"{request.method}:{route_key}:{self.key_func(request)}"
+
+        retry_after = await limiter.hit(key, self.rate, self.burst)
+        if retry_after > 0:
+            raise RateLimited("Too many requests", retry_after)
@@ -0,0 +1,11 @@
+from fastapi_solid.utils.deadline.context import tighten_deadline
+
+
+class RequestTimeout:
+    """Route dependency that shortens the request deadline to `seconds`"""
+
+    def __init__(self, seconds: float):
+        self.seconds = seconds
+
+    async def __call__(self) -> None:
+        tighten_deadline(self.seconds)
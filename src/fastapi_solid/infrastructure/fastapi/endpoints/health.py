@@ -0,0 +1,17 @@
+from fastapi import APIRouter, Request
+from fastapi.responses import JSONResponse
+
+health_router = APIRouter(prefix="/health", tags=["Health"])
+
+
+@health_router.get("/live")
+async def live():
+    return "ok"
+
+
+# ready after the warmup, not ready again once shutdown starts
+@health_router.get("/ready")
+async def ready(request: Request):
+    if not getattr(request.app.state, "ready", False):
+        return JSONResponse(status_code=503, content="Not ready")
+    return "ok"
@@ -0,0 +1,47 @@
+import hmac
+from typing import Annotated
+
+from fastapi import APIRouter, Depends, Header, Query
+from fastapi.responses import PlainTextResponse
+
+from fastapi_solid.application.exceptions.app_error import PermissionDenied
+from fastapi_solid.utils.config.settings import get_settings
+from fastapi_solid.utils.profiling.sampler import StackSampler
+
+settings = get_settings()
+
+
+async def require_profiling_token(x_profile: Annotated[str, Header()] = "") -> None:
+    if not settings.profiling_token or not hmac.compare_digest(
+        x_profile, settings.profiling_token
+    ):
+        raise PermissionDenied("Profiling token is missing or invalid")
+
+
+profiling_router = APIRouter(
+    prefix="/debug/profile",
+    tags=["Profiling"],
+    dependencies=[Depends(require_profiling_token)],
+)
+
+
+@profiling_router.get("", response_class=PlainTextResponse)
+async def get_profile(route: str | None = None):
+    """Collapsed stacks (`flamegraph.pl`, speedscope), optionally of one route"""
+    return StackSampler().collapsed(route)
+
+
+@profiling_router.get("/routes")
+async def get_profiled_routes() -> dict[str, int]:
+    return StackSampler().labels()
+
+
+@profiling_router.put("/sample-rate")
+async def set_sample_rate(rate: Annotated[float, Query(ge=0, le=1)]) -> float:
+    StackSampler().sample_rate = rate
+    return rate
+
+
+@profiling_router.delete("", status_code=204)
+async def reset_profile() -> None:
+    StackSampler().reset()
@@ -0,0 +1,33 @@
+from typing import Annotated
+
+from dependency_injector.wiring import Provide, inject
+from fastapi import APIRouter, Depends
+
+from fastapi_solid.application.dashboard.dto import DashboardOut
+from fastapi_solid.application.dashboard.service import DashboardService
+from fastapi_solid.application.interfaces.common.pagination import Pagination
+from fastapi_solid.infrastructure.di.container import Container
+from fastapi_solid.infrastructure.fastapi.dependencies.pagination import get_pagination
+from fastapi_solid.infrastructure.fastapi.dependencies.rate_limit import RateLimit
+from fastapi_solid.infrastructure.fastapi.dependencies.timeout import RequestTimeout
+from fastapi_solid.infrastructure.fastapi.routing import TimedRoute
+
+dashboard_router = APIRouter(
+    prefix="/dashboard", tags=["Dashboard"], route_class=TimedRoute
+)
+
+
+# users and players are read concurrently, the latency is the slower of the two
+@dashboard_router.get(
+    "",
+    response_model=DashboardOut,
+    dependencies=[Depends(RateLimit()), Depends(RequestTimeout(5))],
+)
+@inject
+async def get_dashboard(
+    dashboard_service: Annotated[
+        DashboardService, Depends(Provide[Container.dashboard_service])
+    ],
+    pagination: Annotated[Pagination, Depends(get_pagination)],
+):
+    return await dashboard_service.get(pagination)
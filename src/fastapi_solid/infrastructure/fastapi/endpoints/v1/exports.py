@@ -0,0 +1,62 @@
+from typing import Annotated
+from uuid import UUID
+
+from dependency_injector.wiring import Provide, inject
+from fastapi import APIRouter, Depends, status
+from fastapi.responses import StreamingResponse
+
+from fastapi_solid.application.exports.dto import ExportIn, ExportOut
+from fastapi_solid.application.exports.service import ExportService
+from fastapi_solid.infrastructure.di.container import Container
+from fastapi_solid.infrastructure.exports.files import ExportFiles
+from fastapi_solid.infrastructure.fastapi.dependencies.rate_limit import RateLimit
+from fastapi_solid.infrastructure.fastapi.routing import TimedRoute
+
+exports_router = APIRouter(prefix="/exports", tags=["Exports"], route_class=TimedRoute)
+
+
+# the export itself runs in the worker (`fastapi-solid-worker`), poll the status
+@exports_router.post(
+    "",
+    response_model=ExportOut,
+    status_code=status.HTTP_202_ACCEPTED,
+    dependencies=[Depends(RateLimit(rate=0.2, burst=3))],
+)
+@inject
+async def create_export(
+    export_in: ExportIn,
+    export_service: Annotated[
+        ExportService, Depends(Provide[Container.export_service])
+    ],
+):
+    return await export_service.create(export_in)
+
+
+@exports_router.get("/{id}", response_model=ExportOut)
+@inject
+async def get_export(
+    id: UUID,
+    export_service: Annotated[
+        ExportService, Depends(Provide[Container.export_service])
+    ],
+):
+    return await export_service.get_by_id(id)
+
+
+@exports_router.get("/{id}/download")
+@inject
+async def download_export(
+    id: UUID,
+    export_service: Annotated[
+        ExportService, Depends(Provide[Container.export_service])
+    ],
+    export_files: Annotated[ExportFiles, Depends(Provide[Container.export_files])],
+):
+    export = await export_service.get_finished(id)
+    return StreamingResponse(
+        export_files.read(id),  # sync iterator, read in the threadpool
+        media_type="application/x-ndjson",
+        headers={
+            "Content-Disposition": f'attachment; filename="{export.kind}-{id}.ndjson"'
+        },
+    )
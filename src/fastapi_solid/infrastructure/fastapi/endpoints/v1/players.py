@@ -2,39 +2,91 @@ from typing import Annotated
 from uuid import UUID
 
 from dependency_injector.wiring import Provide, inject
-from fastapi import APIRouter, Depends, status
+from fastapi import APIRouter, Depends, Header, status
 from fastapi_cache.decorator import cache
 
+from fastapi_solid.application.interfaces.common.change_feed import ChangeFeed
 from fastapi_solid.application.interfaces.common.pagination import Pagination
-from fastapi_solid.application.players.dto import PlayerIn, PlayerOut, PlayerUpdate
+from fastapi_solid.application.interfaces.common.projection import Fields
+from fastapi_solid.application.players.dto import (
+    PlayerIn,
+    PlayerOut,
+    PlayerStatsOut,
+    PlayerUpdate,
+)
 from fastapi_solid.application.players.service import PlayerService
 from fastapi_solid.infrastructure.di.container import Container
+from fastapi_solid.infrastructure.fastapi.dependencies.durability import (
+    DurabilityProfile,
+)
+from fastapi_solid.infrastructure.fastapi.dependencies.fields import (
+    FieldSelection,
+    SparseJsonCoder,
+    sparse,
+)
 from fastapi_solid.infrastructure.fastapi.dependencies.pagination import get_pagination
+from fastapi_solid.infrastructure.fastapi.dependencies.rate_limit import RateLimit
+from fastapi_solid.infrastructure.fastapi.dependencies.timeout import RequestTimeout
+from fastapi_solid.infrastructure.fastapi.routing import TimedRoute
+from fastapi_solid.infrastructure.fastapi.sse import change_stream_response
+from fastapi_solid.utils.durability.context import Durability
 
-players_router = APIRouter(prefix="/players", tags=["Players"])
+players_router = APIRouter(prefix="/players", tags=["Players"], route_class=TimedRoute)
 
 
-@players_router.get("", response_model=list[PlayerOut])
+@players_router.get(
+    "",
+    response_model=list[sparse(PlayerOut)],
+    response_model_exclude_unset=True,
+    dependencies=[Depends(RateLimit()), Depends(RequestTimeout(5))],
+)
 @inject
 async def get_players(
     player_service: Annotated[
         PlayerService, Depends(Provide[Container.player_service])
     ],
     pagination: Annotated[Pagination, Depends(get_pagination)],
+    fields: Annotated[Fields | None, Depends(FieldSelection(PlayerOut))],
 ):
-    return await player_service.get_all(pagination)
+    return await player_service.get_all(pagination, fields)
 
 
-@players_router.get("/{id}", response_model=PlayerOut)
-@cache(10)  # caching http response
+# replaces polling of the list route, `Last-Event-ID` resumes after a reconnect
+@players_router.get("/stream", dependencies=[Depends(RateLimit(rate=1, burst=5))])
+@inject
+async def stream_players_changes(
+    change_feed: Annotated[ChangeFeed, Depends(Provide[Container.players_change_feed])],
+    last_event_id: Annotated[str | None, Header()] = None,
+):
+    return change_stream_response(change_feed, last_event_id)
+
+
+# counters kept up to date by the writes, no scan of the collection
+@players_router.get(
+    "/stats", response_model=PlayerStatsOut, dependencies=[Depends(RateLimit())]
+)
+@inject
+async def get_players_stats(
+    player_service: Annotated[
+        PlayerService, Depends(Provide[Container.player_service])
+    ],
+):
+    return await player_service.get_stats()
+
+
+@players_router.get(
+    "/{id}", response_model=sparse(PlayerOut), response_model_exclude_unset=True
+)
+@cache(10, coder=SparseJsonCoder)  # caching http response
 @inject
 async def get_player(
     id: UUID,
     player_service: Annotated[
         PlayerService, Depends(Provide[Container.player_service])
     ],
+    fields: Annotated[Fields | None, Depends(FieldSelection(PlayerOut))],
 ):
-    return await player_service.get_by_id(id)
+    return await player_service.get_by_id(id, fields)
 
 
 @players_router.post("", response_model=PlayerOut, status_code=status.HTTP_201_CREATED)
@@ -48,7 +100,12 @@ async def create_player(
     return await player_service.create(player_in)
 
 
-@players_router.put("/{id}", response_model=PlayerOut)
+# frequent liveness updates; counter drift is fixed by the periodic reconcile
+@players_router.put(
+    "/{id}",
+    response_model=PlayerOut,
+    dependencies=[Depends(DurabilityProfile(Durability.FAST))],
+)
 @inject
 async def update_player(
     id: UUID,
@@ -2,29 +2,50 @@ from typing import Annotated
 from uuid import UUID
 
 from dependency_injector.wiring import Provide, inject
-from fastapi import APIRouter, Depends, status
+from fastapi import APIRouter, Depends, Header, status
 from fastapi_cache.decorator import cache
 
+from fastapi_solid.application.interfaces.common.change_feed import ChangeFeed
 from fastapi_solid.application.interfaces.common.pagination import Pagination
+from fastapi_solid.application.interfaces.common.projection import Fields
 from fastapi_solid.application.users.dto import UserIn, UserOut, UserUpdate
 from fastapi_solid.application.users.service import UserService
 from fastapi_solid.infrastructure.di.container import Container
+from fastapi_solid.infrastructure.fastapi.dependencies.fields import (
+    FieldSelection,
+    SparseJsonCoder,
+    sparse,
+)
 from fastapi_solid.infrastructure.fastapi.dependencies.pagination import get_pagination
+from fastapi_solid.infrastructure.fastapi.dependencies.rate_limit import RateLimit
+from fastapi_solid.infrastructure.fastapi.dependencies.timeout import RequestTimeout
+from fastapi_solid.infrastructure.fastapi.routing import TimedRoute
+from fastapi_solid.infrastructure.fastapi.sse import change_stream_response
 
-users_router = APIRouter(prefix="/users", tags=["Users"])
+users_router = APIRouter(prefix="/users", tags=["Users"], route_class=TimedRoute)
 
 
-@users_router.get("", response_model=list[UserOut])
+@users_router.get(
+    "",
+    response_model=list[sparse(UserOut)],
+    response_model_exclude_unset=True,
+    dependencies=[Depends(RateLimit()), Depends(RequestTimeout(5))],
+)
 @inject
 async def get_users(
     users_service: Annotated[UserService, Depends(Provide[Container.users_service])],
     pagination: Annotated[Pagination, Depends(get_pagination)],
+    fields: Annotated[Fields | None, Depends(FieldSelection(UserOut))],
 ):
-    return await users_service.get_all(pagination)
+    return await users_service.get_all(pagination, fields)
 
 
 # route to demonstrate our aside-cache
-@users_router.get("/random", response_model=UserOut)  # not REST
+@users_router.get(  # not REST
+    "/random",
+    response_model=UserOut,
+    dependencies=[Depends(RateLimit(rate=5, burst=10))],
+)
 @inject
 async def get_random_user(
     users_service: Annotated[UserService, Depends(Provide[Container.users_service])],
@@ -32,14 +53,27 @@ async def get_random_user(
     return await users_service.get_random()
 
 
-@users_router.get("/{id}", response_model=UserOut)
-@cache(10)  # caching http response
+# replaces polling of the list route, `Last-Event-ID` resumes after a reconnect
+@users_router.get("/stream", dependencies=[Depends(RateLimit(rate=1, burst=5))])
+@inject
+async def stream_users_changes(
+    change_feed: Annotated[ChangeFeed, Depends(Provide[Container.users_change_feed])],
+    last_event_id: Annotated[str | None, Header()] = None,
+):
+    return change_stream_response(change_feed, last_event_id)
+
+
+@users_router.get(
+    "/{id}", response_model=sparse(UserOut), response_model_exclude_unset=True
+)
+@cache(10, coder=SparseJsonCoder)  # caching http response
 @inject
 async def get_user(
     id: UUID,
     users_service: Annotated[UserService, Depends(Provide[Container.users_service])],
+    fields: Annotated[Fields | None, Depends(FieldSelection(UserOut))],
 ):
-    return await users_service.get_by_id(id)
+    return await users_service.get_by_id(id, fields)
 
 
 @users_router.post("", response_model=UserOut, status_code=status.HTTP_201_CREATED)
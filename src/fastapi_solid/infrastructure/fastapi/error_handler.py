@@ -1,7 +1,9 @@
+from math import ceil
+
 from fastapi import FastAPI, Request, status
 from fastapi.responses import JSONResponse
 
-from fastapi_solid.application.exceptions.app_error import AppError
+from fastapi_solid.application.exceptions.app_error import AppError, RateLimited
 from fastapi_solid.application.exceptions.error_types import ErrorType
 
 HTTP_MAP = {
@@ -21,4 +23,7 @@ def register_error_handlers(app: FastAPI) -> None:
     @app.exception_handler(AppError)
     async def _(request: Request, exc: AppError):
         status_code = HTTP_MAP.get(exc.error_type, 500)
-        return JSONResponse(status_code=status_code, content=str(exc))
+        headers = None
+        if isinstance(exc, RateLimited):
+            headers = {"Retry-After": str(ceil(exc.retry_after))}
+        return JSONResponse(status_code=status_code, content=str(exc), headers=headers)
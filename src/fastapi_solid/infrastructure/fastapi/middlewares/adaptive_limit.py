@@ -0,0 +1,67 @@
+import time
+from dataclasses import dataclass
+
+
+@dataclass
+class _RouteLatency:
+    recent: float  # short moving average, the current latency of the route
+    baseline: float  # long moving average, its usual latency
+    errors: float = 0.0  # short moving average of the failure rate
+    samples: int = 1
+
+
+class AdaptiveLimit:
+    """AIMD concurrency limit driven by observed latency.
+
+    Samples are keyed by route, and every route keeps two moving averages of its
+    latency: a recent one over about the last 10 requests and a baseline over about
+    500. Both mix cache hits and misses in the same proportion, so a route serving
+    both compares like with like, and one slow request moves the recent average by
+    a tenth of its excess only. A route is overloaded once its recent average
+    exceeds `baseline * tolerance` or most of its recent requests failed; the limit
+    is then multiplied by `backoff`, at most once per recent round trip. Otherwise a
+    busy limit grows by `1/limit` per sample, i.e. about +1 per round trip.
+    """
+
+    recent_weight = 0.1
+    baseline_weight = 0.002
+    warmup_samples = 20  # a route is judged once its averages have settled
+    max_error_rate = 0.5
+
+    def __init__(
+        self,
+        initial: int,
+        min_limit: int,
+        max_limit: int,
+        tolerance: float = 2.0,
+        backoff: float = 0.9,
+    ):
+        self.limit = float(initial)
+        self.min_limit = min_limit
+        self.max_limit = max_limit
+        self.tolerance = tolerance
+        self.backoff = backoff
+        self.in_flight = 0
+        self._routes: dict[str, _RouteLatency] = {}
+        self._last_decrease = 0.0
+
+    def on_sample(self, latency: float, failed: bool = False, key: str = "") -> None:
+        route = self._routes.get(key)
+        if route is None:
+            route = self._routes[key] = _RouteLatency(latency, latency)
+        else:
+            route.recent += (latency - route.recent) * self.recent_weight
+            route.baseline += (latency - route.baseline) * self.baseline_weight
+            route.errors += (failed - route.errors) * self.recent_weight
+            route.samples += 1
+
+        now = time.monotonic()
+        if route.samples >= self.warmup_samples and (
+            route.recent > route.baseline * self.tolerance
+            or route.errors > self.max_error_rate
+        ):
+            if now - self._last_decrease >= route.recent:
+                self.limit = max(self.min_limit, self.limit * self.backoff)
+                self._last_decrease = now
+        elif self.in_flight * 2 >= self.limit:
+            self.limit = min(self.max_limit, self.limit + 1 / self.limit)
@@ -0,0 +1,77 @@
+import time
+
+from starlette.responses import JSONResponse
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from .adaptive_limit import AdaptiveLimit
+
+READ_METHODS = frozenset({"GET", "HEAD", "OPTIONS"})
+
+
+class ConcurrencyLimitMiddleware:
+    """Sheds requests above the adaptive per-worker concurrency limit with 503.
+
+    Reads may only take `read_share` of the limit, the rest is kept for writes,
+    so a flood of list calls can't starve mutations. Long-lived streams matching
+    `exclude_suffixes` bypass the limit, they would hold a slot for their lifetime.
+    Paths under `unsampled_prefixes` (probes, metrics) count against the limit but
+    their latency doesn't feed it.
+    """
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        limit: AdaptiveLimit,
+        read_share: float = 0.8,
+        retry_after: int = 1,
+        exclude_suffixes: tuple[str, ...] = (),
+        unsampled_prefixes: tuple[str, ...] = (),
+    ):
+        self.app = app
+        self.limit = limit
+        self.read_share = read_share
+        self.retry_after = retry_after
+        self.exclude_suffixes = exclude_suffixes
+        self.unsampled_prefixes = unsampled_prefixes
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or scope["path"].endswith(self.exclude_suffixes):
+            await self.app(scope, receive, send)
+            return
+
+        cap = self.limit.limit
+        if scope["method"] in READ_METHODS:
+            cap *= self.read_share
+        if self.limit.in_flight >= cap:
+            response = JSONResponse(
+                status_code=503,
+                content="Server is overloaded, retry later",
+                headers={"Retry-After": str(self.retry_after)},
+            )
+            await response(scope, receive, send)
+            return
+
+        status_code = 500
+
+        async def send_wrapper(message: Message) -> None:
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            await send(message)
+
+        self.limit.in_flight += 1
+        started = time.perf_counter()
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            self.limit.in_flight -= 1
+            if not scope["path"].startswith(self.unsampled_prefixes):
+                self.limit.on_sample(
+                    time.perf_counter() - started, status_code >= 500, _route(scope)
+                )
+
+
+def _route(scope: Scope) -> str:
+    # set by the router on the shared scope; unmatched paths share one key
+    path = getattr(scope.get("route"), "path", "<unmatched>")
+    return f"{scope['method']} {path}"
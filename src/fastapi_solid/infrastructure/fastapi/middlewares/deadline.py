@@ -0,0 +1,38 @@
+from starlette.types import ASGIApp, Receive, Scope, Send
+
+from fastapi_solid.utils.deadline.context import deadline_scope
+
+TIMEOUT_HEADER = b"x-request-timeout"
+
+
+class DeadlineMiddleware:
+    """Starts the request deadline from `X-Request-Timeout` (seconds) or the default.
+
+    The client value is capped by `max_timeout`; routes may tighten it further with
+    the `RequestTimeout` dependency.
+    """
+
+    def __init__(self, app: ASGIApp, default_timeout: float, max_timeout: float):
+        self.app = app
+        self.default_timeout = default_timeout
+        self.max_timeout = max_timeout
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        with deadline_scope(self._timeout(scope)):
+            await self.app(scope, receive, send)
+
+    def _timeout(self, scope: Scope) -> float:
+        for name, value in scope["headers"]:
+            if name == TIMEOUT_HEADER:
+                try:
+                    requested = float(value)
+                except ValueError:
+                    break
+                if requested > 0:
+                    return min(requested, self.max_timeout)
+                break
+        return self.default_timeout
@@ -0,0 +1,185 @@
+import asyncio
+import hashlib
+import json
+import time
+from contextlib import suppress
+from dataclasses import dataclass, field
+
+from starlette.responses import JSONResponse
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from fastapi_solid.infrastructure.redis.idempotency import RedisIdempotencyStore
+
+KEY_HEADER = b"idempotency-key"
+IDEMPOTENT_METHODS = frozenset({"POST", "PUT", "PATCH"})
+# Client errors a retry of the same request would get again; anything else that
+# isn't a success (429, 408, 409, 412, 5xx) may change and is left retryable.
+STORED_ERRORS = frozenset({400, 422})
+
+
+@dataclass
+class _Captured:
+    status: int = 500
+    headers: list[tuple[bytes, bytes]] = field(default_factory=list)
+    body: bytearray = field(default_factory=bytearray)
+
+    def encode(self, fingerprint: str) -> bytes:
+        meta = {
+            "fingerprint": fingerprint,
+            "status": self.status,
+            "headers": [
+                [k.decode("latin-1"), v.decode("latin-1")] for k, v in self.headers
+            ],
+        }
+        return json.dumps(meta).encode() + b"\n" + self.body
+
+    @classmethod
+    def decode(cls, raw: bytes) -> tuple[str, "_Captured"]:
+        meta_raw, _, body = raw.partition(b"\n")
+        meta = json.loads(meta_raw)
+        headers = [
+            (k.encode("latin-1"), v.encode("latin-1")) for k, v in meta["headers"]
+        ]
+        return meta["fingerprint"], cls(meta["status"], headers, bytearray(body))
+
+
+class IdempotencyMiddleware:
+    """Executes a write carrying an `Idempotency-Key` header at most once.
+
+    The first successful or deterministically rejected (400, 422) response is
+    stored in Redis for `ttl`; retries with the same key get it replayed without
+    reaching the route. Duplicates arriving while the first request still runs wait
+    for its result: in-process ones on a future, ones on other workers by polling,
+    up to `wait_timeout`. Reusing a key with a
+    different body is rejected. Without Redis the request runs as a plain one.
+    """
+
+    poll_interval = 0.05  # seconds
+    max_key_length = 255
+
+    def __init__(self, app: ASGIApp, wait_timeout: float):
+        self.app = app
+        self.wait_timeout = wait_timeout
+        self._in_flight: dict[str, asyncio.Future[None]] = {}
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or scope["method"] not in IDEMPOTENT_METHODS:
+            await self.app(scope, receive, send)
+            return
+        idempotency_key = dict(scope["headers"]).get(KEY_HEADER)
+        if idempotency_key is None:
+            await self.app(scope, receive, send)
+            return
+        if len(idempotency_key) > self.max_key_length:
+            await self._reject(scope, receive, send, 400, "Idempotency-Key is too long")
+            return
+
+        body, receive = await _buffer_body(receive)
+        fingerprint = hashlib.sha256(body).hexdigest()
+        key = f"{scope['method']}:{scope['path']}:{idempotency_key.decode('latin-1')}"
+        store: RedisIdempotencyStore = scope["app"].container.idempotency_store()
+
+        waiting_until = time.monotonic() + self.wait_timeout
+        while True:
+            if (stored := await store.get(key)) is not None:
+                await self._replay(stored, fingerprint, scope, receive, send)
+                return
+            token = await store.lock(key)
+            if token is None:  # Redis is unavailable
+                await self.app(scope, receive, send)
+                return
+            if token:
+                break
+            if time.monotonic() >= waiting_until:
+                await self._reject(
+                    scope, receive, send, 409, "A request with this key is in progress"
+                )
+                return
+            await self._wait(key, waiting_until)
+
+        future = self._in_flight[key] = asyncio.get_running_loop().create_future()
+        try:
+            captured = _Captured()
+            await self.app(scope, receive, _capturing(send, captured))
+            if 200 <= captured.status < 300 or captured.status in STORED_ERRORS:
+                await store.save(key, captured.encode(fingerprint))
+        finally:
+            # local duplicates are released even if the unlock below fails
+            del self._in_flight[key]
+            future.set_result(None)
+            await store.unlock(key, token)
+
+    async def _wait(self, key: str, until: float) -> None:
+        if (future := self._in_flight.get(key)) is not None:
+            with suppress(TimeoutError):
+                await asyncio.wait_for(asyncio.shield(future), until - time.monotonic())
+        else:  # running on another worker
+            await asyncio.sleep(self.poll_interval)
+
+    async def _replay(
+        self,
+        stored: bytes,
+        fingerprint: str,
+        scope: Scope,
+        receive: Receive,
+        send: Send,
+    ) -> None:
+        stored_fingerprint, captured = _Captured.decode(stored)
+        if stored_fingerprint != fingerprint:
+            await self._reject(
+                scope,
+                receive,
+                send,
+                422,
+                "Idempotency-Key was used for another request",
+            )
+            return
+        headers = [*captured.headers, (b"idempotent-replayed", b"true")]
+        await send(
+            {
+                "type": "http.response.start",
+                "status": captured.status,
+                "headers": headers,
+            }
+        )
+        await send({"type": "http.response.body", "body": bytes(captured.body)})
+
+    async def _reject(
+        self, scope: Scope, receive: Receive, send: Send, status: int, message: str
+    ) -> None:
+        await JSONResponse(status_code=status, content=message)(scope, receive, send)
+
+
+async def _buffer_body(receive: Receive) -> tuple[bytes, Receive]:
+    """Reads the whole request body and returns a receive that replays it"""
+    chunks: list[bytes] = []
+    more_body = True
+    while more_body:
+        message = await receive()
+        if message["type"] != "http.request":  # client went away
+            break
+        chunks.append(message.get("body", b""))
+        more_body = message.get("more_body", False)
+    body = b"".join(chunks)
+    replayed = False
+
+    async def replay() -> Message:
+        nonlocal replayed
+        if replayed:
+            return await receive()
+        replayed = True
+        return {"type": "http.request", "body": body, "more_body": False}
+
+    return body, replay
+
+
+def _capturing(send: Send, captured: _Captured) -> Send:
+    async def send_wrapper(message: Message) -> None:
+        if message["type"] == "http.response.start":
+            captured.status = message["status"]
+            captured.headers = list(message.get("headers", []))
+        elif message["type"] == "http.response.body":
+            captured.body += message.get("body", b"")
+        await send(message)
+
+    return send_wrapper
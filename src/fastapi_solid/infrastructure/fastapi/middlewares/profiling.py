@@ -0,0 +1,46 @@
+import hmac
+import random
+
+from starlette.types import ASGIApp, Receive, Scope, Send
+
+from fastapi_solid.utils.profiling.sampler import StackSampler
+
+PROFILE_HEADER = b"x-profile"
+
+
+class ProfilingMiddleware:
+    """Samples the CPU stacks of selected requests into per-route flamegraphs.
+
+    A request is profiled when it carries `X-Profile: <token>` or, at random, with
+    probability `StackSampler.sample_rate` (changeable at runtime through the
+    profiling endpoints). Other requests only pay for the check.
+    """
+
+    def __init__(self, app: ASGIApp, token: str, sample_rate: float, interval: float):
+        self.app = app
+        self.token = token.encode()
+        self.sampler = StackSampler(interval)
+        self.sampler.sample_rate = sample_rate
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or not self._selected(scope):
+            await self.app(scope, receive, send)
+            return
+
+        self.sampler.track()
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            route = scope.get("route")
+            path = getattr(route, "path", "<unmatched>")
+            self.sampler.untrack(f"{scope['method']} {path}")
+
+    def _selected(self, scope: Scope) -> bool:
+        if self.sampler.sample_rate and random.random() < self.sampler.sample_rate:
+            return True
+        if not self.token:
+            return False
+        for name, value in scope["headers"]:
+            if name == PROFILE_HEADER:
+                return hmac.compare_digest(value, self.token)
+        return False
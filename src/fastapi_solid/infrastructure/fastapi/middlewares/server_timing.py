@@ -0,0 +1,31 @@
+from starlette.datastructures import MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from fastapi_solid.utils.timing.context import timing_scope
+
+
+class ServerTimingMiddleware:
+    """Adds a `Server-Timing` header with the time and call count per backend.
+
+    Backends report into the request timings themselves: SQLAlchemy engine
+    events, the pymongo command listener and the Redis circuit breaker. Routes of
+    `TimedRoute` add the serialization time after the endpoint returned.
+    """
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        with timing_scope(scope) as timings:
+
+            async def send_wrapper(message: Message) -> None:
+                if message["type"] == "http.response.start":
+                    headers = MutableHeaders(scope=message)
+                    headers.append("Server-Timing", timings.server_timing())
+                await send(message)
+
+            await self.app(scope, receive, send_wrapper)
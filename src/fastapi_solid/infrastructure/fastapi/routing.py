@@ -0,0 +1,47 @@
+import time
+from collections.abc import Callable
+from functools import wraps
+from inspect import iscoroutinefunction
+from typing import Any
+
+from fastapi.routing import APIRoute
+
+from fastapi_solid.utils.timing.context import current_timings
+
+
+class TimedRoute(APIRoute):
+    """Route that marks when its endpoint returned.
+
+    What follows until the response starts, response model validation and JSON
+    encoding, shows up as `serialize` in the `Server-Timing` header.
+    """
+
+    def __init__(self, path: str, endpoint: Callable[..., Any], **kwargs: Any):
+        super().__init__(path, _mark_endpoint_done(endpoint), **kwargs)
+
+
+def _mark_endpoint_done(endpoint: Callable[..., Any]) -> Callable[..., Any]:
+    if iscoroutinefunction(endpoint):
+
+        @wraps(endpoint)
+        async def async_wrapper(*args: Any, **kwargs: Any) -> Any:
+            try:
+                return await endpoint(*args, **kwargs)
+            finally:
+                _mark()
+
+        return async_wrapper
+
+    @wraps(endpoint)
+    def wrapper(*args: Any, **kwargs: Any) -> Any:
+        try:
+            return endpoint(*args, **kwargs)
+        finally:
+            _mark()
+
+    return wrapper
+
+
+def _mark() -> None:
+    if (timings := current_timings()) is not None:
+        timings.endpoint_done = time.perf_counter()
@@ -0,0 +1,55 @@
+import asyncio
+import json
+from collections.abc import AsyncIterator
+from contextlib import suppress
+
+from fastapi.responses import StreamingResponse
+
+from fastapi_solid.application.interfaces.common.change_feed import (
+    ChangeEvent,
+    ChangeFeed,
+)
+from fastapi_solid.utils.config.settings import get_settings
+
+settings = get_settings()
+
+
+def _format(event: ChangeEvent) -> str:
+    data = json.dumps({"op": event.op, "id": event.id}, separators=(",", ":"))
+    return f"id: {event.token}\nevent: {event.op}\ndata: {data}\n\n"
+
+
+async def _event_stream(
+    feed: ChangeFeed, resume_token: str | None
+) -> AsyncIterator[str]:
+    events: asyncio.Queue[ChangeEvent] = asyncio.Queue(1)
+
+    async def pump() -> None:
+        async for event in feed.subscribe(resume_token):
+            await events.put(event)
+
+    pump_task = asyncio.create_task(pump())
+    try:
+        while True:
+            try:
+                async with asyncio.timeout(settings.sse_heartbeat_interval):
+                    event = await events.get()
+            except TimeoutError:
+                yield ": ping\n\n"  # keeps proxies from closing an idle stream
+                continue
+            yield _format(event)
+    finally:
+        pump_task.cancel()
+        with suppress(asyncio.CancelledError):
+            await pump_task
+
+
+def change_stream_response(
+    feed: ChangeFeed, resume_token: str | None
+) -> StreamingResponse:
+    """Server-Sent Events of `feed`, resumable with the `Last-Event-ID` header"""
+    return StreamingResponse(
+        _event_stream(feed, resume_token),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
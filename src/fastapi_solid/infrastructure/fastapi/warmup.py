@@ -0,0 +1,131 @@
+import asyncio
+import time
+from collections.abc import Awaitable
+
+from redis.asyncio import Redis  # type: ignore[reportMissingTypeStubs]
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+from starlette.types import ASGIApp, Message
+
+from fastapi_solid.infrastructure.beanie.setup.client import client  # type: ignore[reportUnknownVariableType]
+from fastapi_solid.infrastructure.sqlalchemy.setup.base_repo import MIN_ID
+from fastapi_solid.infrastructure.sqlalchemy.setup.engine import (
+    async_session_factory,
+    shard_session_factories,
+)
+from fastapi_solid.infrastructure.sqlalchemy.setup.statements import (
+    select_by_id,
+    select_page,
+)
+from fastapi_solid.infrastructure.sqlalchemy.user.table import UserOrm
+from fastapi_solid.utils.config.settings import get_settings
+from fastapi_solid.utils.logging.logger import get_logger
+
+logger = get_logger(__name__)
+settings = get_settings()
+
+# executed on every warmed connection: compiled once, prepared per connection
+HOT_STATEMENTS = [
+    (select_by_id(UserOrm), {"id": MIN_ID}),
+    (select_page(UserOrm), {"limit": 1, "offset": 0}),
+]
+
+
+async def warm_up(app: ASGIApp, redis: Redis) -> None:
+    """Pays the cold start before the first request does.
+
+    Opens the minimum number of connections of every pool, prepares the hot
+    statements on each Postgres connection, then sends `warmup_paths` through the
+    app itself: DI wiring, validators, serializers and hot cache keys (such as
+    `random_user`) are built on the way. Failed steps are logged and skipped,
+    a partially warm worker is still better than none.
+    """
+    started = time.perf_counter()
+    await asyncio.gather(
+        _step("postgres", _warm_postgres()),
+        _step("mongo", _warm_mongo()),
+        _step("redis", _warm_redis(redis)),
+    )
+    for path in settings.warmup_paths:
+        await _step(path, _request(app, path))
+    logger.info("Warmup done in %.2f s", time.perf_counter() - started)
+
+
+async def _step(name: str, step: Awaitable[None]) -> None:
+    started = time.perf_counter()
+    try:
+        async with asyncio.timeout(settings.warmup_timeout):
+            await step
+    except Exception:
+        logger.warning("Warmup of %s failed", name, exc_info=True)
+        return
+    logger.debug("Warmed up %s in %.3f s", name, time.perf_counter() - started)
+
+
+async def _warm_postgres() -> None:
+    factories = shard_session_factories or [async_session_factory]
+    await asyncio.gather(*(_fill_pool(f) for f in factories))
+
+
+async def _fill_pool(factory: async_sessionmaker[AsyncSession]) -> None:
+    # overflow connections are closed on return, more than the pool size is waste
+    size = min(settings.db_pool_min_size, factory.kw["bind"].pool.size())
+    # every session holds its connection until all are open, so none is reused
+    opened = asyncio.Barrier(size)
+
+    async def warm_connection() -> None:
+        async with factory() as session:
+            for statement, params in HOT_STATEMENTS:
+                await session.execute(statement, params)
+            await opened.wait()
+
+    # a failed connection cancels the others, releasing the sessions they hold
+    async with asyncio.TaskGroup() as tasks:
+        for _ in range(size):
+            tasks.create_task(warm_connection())
+
+
+async def _warm_mongo() -> None:
+    # server selection; pymongo itself keeps `minPoolSize` connections afterwards
+    await asyncio.gather(
+        *(client.admin.command("ping") for _ in range(settings.mongo_pool_min_size))  # type: ignore[reportUnknownMemberType]
+    )
+
+
+async def _warm_redis(redis: Redis) -> None:
+    await asyncio.gather(*(redis.ping() for _ in range(settings.redis_pool_min_size)))  # type: ignore[reportUnknownMemberType]
+
+
+async def _request(app: ASGIApp, target: str) -> None:
+    path, _, query = target.partition("?")
+    scope = {
+        "type": "http",
+        "asgi": {"version": "3.0"},
+        "http_version": "1.1",
+        "method": "GET",
+        "scheme": "http",
+        "path": path,
+        "raw_path": path.encode(),
+        "root_path": "",
+        "query_string": query.encode(),
+        "headers": [(b"host", b"warmup")],
+        "client": ("127.0.0.1", 0),
+        "server": ("warmup", 80),
+    }
+    request_sent = False
+    status = 0
+
+    async def receive() -> Message:
+        nonlocal request_sent
+        if request_sent:
+            return {"type": "http.disconnect"}
+        request_sent = True
+        return {"type": "http.request", "body": b"", "more_body": False}
+
+    async def send(message: Message) -> None:
+        nonlocal status
+        if message["type"] == "http.response.start":
+            status = message["status"]
+
+    await app(scope, receive, send)
+    if status >= 500:
+        raise RuntimeError(f"GET {target} responded with {status}")
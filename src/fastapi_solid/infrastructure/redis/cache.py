@@ -1,20 +1,79 @@
+import asyncio
+from collections.abc import Awaitable, Callable, Mapping
+from typing import Any
+
 from redis.asyncio import Redis  # type: ignore[reportMissingTypeStubs]
 
+from fastapi_solid.application.exceptions.app_error import DeadlineExceeded
 from fastapi_solid.application.interfaces.common.key_value_cache import (
     CacheResponse,
     KeyValueCache,
 )
+from fastapi_solid.infrastructure.redis.circuit_breaker import CircuitBreaker
+from fastapi_solid.utils.deadline.context import remaining_time
+from fastapi_solid.utils.logging.logger import get_logger
+from fastapi_solid.utils.metrics.registry import MetricsRegistry
+
+logger = get_logger(__name__)
+
+FAILED: Any = object()  # fallback marking a failed or skipped call
+
+failed_deletes = MetricsRegistry().counter(
+    "cache_failed_deletes_total", "Cache keys whose delete failed or was skipped"
+)
+
+
+def _invalidation_failed(keys: int) -> None:
+    # a lost invalidation leaves a stale entry until its TTL ends
+    failed_deletes.inc(keys)
+    logger.warning("Cache delete of %s key(s) failed, entries stay until TTL", keys)
+
+
+async def _with_deadline[T](
+    func: Callable[..., Awaitable[T]], *args: Any, **kwargs: Any
+) -> T:
+    # checked before the call is made, so no coroutine is left unawaited
+    timeout = remaining_time()
+    try:
+        async with asyncio.timeout(timeout):
+            return await func(*args, **kwargs)
+    except TimeoutError as e:
+        raise DeadlineExceeded() from e
 
 
 class RedisCache(KeyValueCache):
-    def __init__(self, redis_client: Redis):
+    """Redis cache that degrades to misses and dropped writes when Redis fails"""
+
+    def __init__(self, redis_client: Redis, breaker: CircuitBreaker):
         self._redis_client = redis_client
+        self._breaker = breaker
 
     async def get(self, key: str) -> CacheResponse:
-        return await self._redis_client.get(key)  # type: ignore[reportUnknownVariableType]
+        return await self._breaker.call(
+            lambda: _with_deadline(self._redis_client.get, key),  # type: ignore[reportUnknownLambdaType]
+            None,
+        )
 
     async def set(self, key: str, value: str | bytes, ttl: int) -> None:
-        await self._redis_client.set(key, value, ex=ttl)  # type: ignore[reportUnknownVariableType]
+        await self._breaker.call(
+            lambda: _with_deadline(self._redis_client.set, key, value, ex=ttl),  # type: ignore[reportUnknownLambdaType]
+            None,
+        )
 
     async def delete(self, key: str) -> None:
-        await self._redis_client.delete(key)  # type: ignore[reportUnknownVariableType]
+        deleted = await self._breaker.call(
+            lambda: _with_deadline(self._redis_client.delete, key),  # type: ignore[reportUnknownLambdaType]
+            FAILED,
+        )
+        if deleted is FAILED:
+            _invalidation_failed(1)
+
+    async def set_many(
+        self, values: Mapping[str, str | bytes], ttl: int | Mapping[str, int]
+    ) -> None:
+        if not values:
+            return
+        pipe = self._redis_client.pipeline(transaction=False)
+        for key, value in values.items():
+            pipe.set(key, value, ex=ttl if isinstance(ttl, int) else ttl[key])  # type: ignore[reportUnknownMemberType]
+        await self._breaker.call(lambda: _with_deadline(pipe.execute), None)  # type: ignore[reportUnknownLambdaType]
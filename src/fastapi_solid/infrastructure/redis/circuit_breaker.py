@@ -0,0 +1,127 @@
+import time
+from collections.abc import Awaitable, Callable
+from enum import IntEnum
+
+from redis.exceptions import RedisError  # type: ignore[reportMissingTypeStubs]
+
+from fastapi_solid.application.exceptions.app_error import DeadlineExceeded
+from fastapi_solid.utils.logging.logger import get_logger
+from fastapi_solid.utils.metrics.registry import MetricsRegistry
+from fastapi_solid.utils.timing.context import record
+
+logger = get_logger(__name__)
+
+metrics = MetricsRegistry()
+state_gauge = metrics.gauge(
+    "circuit_breaker_state", "Circuit breaker state: 0 closed, 1 half-open, 2 open"
+)
+opened_counter = metrics.counter(
+    "circuit_breaker_opened_total", "How many times the circuit breaker opened"
+)
+skipped_counter = metrics.counter(
+    "circuit_breaker_skipped_calls_total", "Calls skipped while the breaker was open"
+)
+
+
+class BreakerState(IntEnum):
+    CLOSED = 0
+    HALF_OPEN = 1
+    OPEN = 2
+
+
+class CircuitBreaker:
+    """Stops calling a failing dependency and falls back immediately.
+
+    Errors of the dependency (`failures`: Redis, connection and timeout errors)
+    and calls slower than `slow_call_threshold` count as failures. The request's
+    own `DeadlineExceeded` and any other error are raised unjudged. After
+    `failure_threshold` consecutive failures the breaker opens for `reset_timeout`
+    seconds, then lets a single probe through: success closes it, failure opens
+    it again.
+    """
+
+    failures: tuple[type[Exception], ...] = (RedisError, OSError, TimeoutError)
+
+    def __init__(
+        self,
+        name: str,
+        failure_threshold: int,
+        slow_call_threshold: float,
+        reset_timeout: float,
+    ):
+        self.name = name
+        self.failure_threshold = failure_threshold
+        self.slow_call_threshold = slow_call_threshold
+        self.reset_timeout = reset_timeout
+        self._state = BreakerState.CLOSED
+        self._failures = 0
+        self._opened_at = 0.0
+        self._probe_in_flight = False
+        state_gauge.set(self._state, breaker=name)
+
+    @property
+    def state(self) -> BreakerState:
+        return self._state
+
+    async def call[T](self, call: Callable[[], Awaitable[T]], fallback: T) -> T:
+        if not self._allow():
+            skipped_counter.inc(breaker=self.name)
+            return fallback
+
+        started = time.perf_counter()
+        try:
+            result = await call()
+        except DeadlineExceeded:  # the request ran out of time, not the dependency
+            self._probe_in_flight = False
+            raise
+        except self.failures:
+            logger.warning("%s call failed", self.name, exc_info=True)
+            self._on_failure()
+            return fallback
+        except BaseException:  # cancelled or a bug, don't judge the dependency
+            self._probe_in_flight = False
+            raise
+        finally:
+            record(self.name, time.perf_counter() - started)
+
+        if time.perf_counter() - started > self.slow_call_threshold:
+            self._on_failure()
+        else:
+            self._on_success()
+        return result
+
+    def _allow(self) -> bool:
+        if self._state is BreakerState.CLOSED:
+            return True
+        if self._state is BreakerState.OPEN:
+            if time.monotonic() - self._opened_at < self.reset_timeout:
+                return False
+            self._set_state(BreakerState.HALF_OPEN)
+        if self._probe_in_flight:
+            return False
+        self._probe_in_flight = True
+        return True
+
+    def _on_success(self) -> None:
+        self._failures = 0
+        self._probe_in_flight = False
+        if self._state is not BreakerState.CLOSED:
+            logger.info("%s circuit breaker closed", self.name)
+            self._set_state(BreakerState.CLOSED)
+
+    def _on_failure(self) -> None:
+        self._failures += 1
+        self._probe_in_flight = False
+        if (
+            self._state is BreakerState.HALF_OPEN
+            or self._failures >= self.failure_threshold
+        ):
+            if self._state is not BreakerState.OPEN:
+                logger.warning("%s circuit breaker opened", self.name)
+                opened_counter.inc(breaker=self.name)
+            self._opened_at = time.monotonic()
+            self._set_state(BreakerState.OPEN)
+
+    def _set_state(self, state: BreakerState) -> None:
+        self._state = state
+        state_gauge.set(state, breaker=self.name)
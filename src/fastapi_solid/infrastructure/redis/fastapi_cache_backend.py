@@ -0,0 +1,30 @@
+from fastapi_cache.backends.redis import RedisBackend
+from redis.asyncio import Redis  # type: ignore[reportMissingTypeStubs]
+
+from fastapi_solid.infrastructure.redis.circuit_breaker import CircuitBreaker
+
+
+class BreakerRedisBackend(RedisBackend):
+    """fastapi-cache backend that skips Redis while the breaker is open"""
+
+    def __init__(self, redis: Redis, breaker: CircuitBreaker):
+        super().__init__(redis)  # type: ignore[reportArgumentType]
+        self._breaker = breaker
+
+    async def get_with_ttl(self, key: str) -> tuple[int, bytes | None]:
+        return await self._breaker.call(
+            lambda: RedisBackend.get_with_ttl(self, key), (0, None)
+        )
+
+    async def get(self, key: str) -> bytes | None:
+        return await self._breaker.call(lambda: RedisBackend.get(self, key), None)
+
+    async def set(self, key: str, value: bytes, expire: int | None = None) -> None:
+        await self._breaker.call(
+            lambda: RedisBackend.set(self, key, value, expire), None
+        )
+
+    async def clear(self, namespace: str | None = None, key: str | None = None) -> int:
+        return await self._breaker.call(
+            lambda: RedisBackend.clear(self, namespace, key), 0
+        )
@@ -0,0 +1,65 @@
+from uuid import uuid4
+
+from redis.asyncio import Redis  # type: ignore[reportMissingTypeStubs]
+
+from fastapi_solid.infrastructure.redis.circuit_breaker import CircuitBreaker
+
+# KEYS[1] - lock key, ARGV[1] - owner token. Deletes the lock only if still owned.
+UNLOCK_LUA = """
+if redis.call('GET', KEYS[1]) == ARGV[1] then
+    return redis.call('DEL', KEYS[1])
+end
+return 0
+"""
+
+
+class RedisIdempotencyStore:
+    """Stored responses and in-flight locks of idempotent requests.
+
+    Calls go through the breaker; while Redis is unavailable `lock` returns None
+    and callers should process the request as a plain one.
+    """
+
+    key_prefix = "idempotency:"
+
+    def __init__(
+        self, redis_client: Redis, breaker: CircuitBreaker, ttl: int, lock_ttl: float
+    ):
+        self._redis_client = redis_client
+        self._breaker = breaker
+        self._ttl = ttl
+        self._lock_ttl_ms = int(lock_ttl * 1000)
+        self._unlock = redis_client.register_script(UNLOCK_LUA)  # type: ignore[reportUnknownMemberType]
+
+    async def get(self, key: str) -> bytes | None:
+        return await self._breaker.call(
+            lambda: self._redis_client.get(self.key_prefix + key),  # type: ignore[reportUnknownLambdaType]
+            None,
+        )
+
+    async def save(self, key: str, value: bytes) -> None:
+        await self._breaker.call(
+            lambda: self._redis_client.set(self.key_prefix + key, value, ex=self._ttl),  # type: ignore[reportUnknownLambdaType]
+            None,
+        )
+
+    async def lock(self, key: str) -> str | None:
+        """Owner token when locked, "" when someone else holds it, None on failure"""
+        token = uuid4().hex
+
+        async def acquire() -> str:
+            acquired = await self._redis_client.set(  # type: ignore[reportUnknownMemberType]
+                self._lock_key(key), token, nx=True, px=self._lock_ttl_ms
+            )
+            return token if acquired else ""
+
+        return await self._breaker.call(acquire, None)
+
+    async def unlock(self, key: str, token: str) -> None:
+        await self._breaker.call(
+            lambda: self._unlock(keys=[self._lock_key(key)], args=[token]),  # type: ignore[reportUnknownLambdaType]
+            None,
+        )
+
+    def _lock_key(self, key: str) -> str:
+        return f"{self.key_prefix}lock:{key}"
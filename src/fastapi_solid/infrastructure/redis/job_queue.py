@@ -0,0 +1,123 @@
+import time
+from datetime import UTC, datetime
+from uuid import UUID, uuid4
+
+from redis.asyncio import Redis  # type: ignore[reportMissingTypeStubs]
+
+from fastapi_solid.application.interfaces.common.job_queue import (
+    Job,
+    JobQueue,
+    JobStatus,
+)
+
+# KEYS: running list, pending list, job hash; ARGV[1] - job id.
+# Moves the job back only if it's still reserved, so two workers can't both do it.
+REQUEUE_LUA = """
+if redis.call('LREM', KEYS[1], 1, ARGV[1]) == 0 then
+    return 0
+end
+redis.call('HSET', KEYS[3], 'status', 'queued')
+redis.call('RPUSH', KEYS[2], ARGV[1])
+return 1
+"""
+
+
+class RedisJobQueue(JobQueue):
+    """Reliable list queue: reserved ids move to a running list until completed.
+
+    Workers refresh a heartbeat with every progress update, jobs of workers that
+    died are put back by `requeue_stale`. Job records expire after `ttl`.
+    """
+
+    def __init__(self, redis_client: Redis, name: str, ttl: int):
+        self._redis_client = redis_client
+        self._pending_key = f"jobs:{name}:pending"
+        self._running_key = f"jobs:{name}:running"
+        self._job_prefix = f"jobs:{name}:job:"
+        self._ttl = ttl
+        self._requeue = redis_client.register_script(REQUEUE_LUA)  # type: ignore[reportUnknownMemberType]
+
+    async def enqueue(self, kind: str) -> Job:
+        job = Job(
+            id=uuid4(), kind=kind, status=JobStatus.QUEUED, created_at=datetime.now(UTC)
+        )
+        pipe = self._redis_client.pipeline(transaction=True)
+        self._save(pipe, job)
+        pipe.lpush(self._pending_key, str(job.id))  # type: ignore[reportUnknownMemberType]
+        await pipe.execute()  # type: ignore[reportUnknownMemberType]
+        return job
+
+    async def get(self, job_id: UUID) -> Job | None:
+        data: dict[bytes, bytes] = await self._redis_client.hgetall(
+            self._job_key(job_id)
+        )  # type: ignore[reportUnknownMemberType]
+        if not data:
+            return None
+        fields = {k.decode(): v.decode() for k, v in data.items()}
+        return Job(
+            id=UUID(fields["id"]),
+            kind=fields["kind"],
+            status=JobStatus(fields["status"]),
+            created_at=datetime.fromisoformat(fields["created_at"]),
+            processed=int(fields["processed"]),
+            chunks=int(fields["chunks"]),
+            error=fields.get("error") or None,
+        )
+
+    async def reserve(self, timeout: float) -> Job | None:
+        raw_id: bytes | None = await self._redis_client.blmove(  # type: ignore[reportUnknownMemberType]
+            self._pending_key, self._running_key, timeout, "RIGHT", "LEFT"
+        )
+        if raw_id is None:
+            return None
+        job = await self.get(UUID(raw_id.decode()))
+        if job is None:  # expired while queued
+            await self._redis_client.lrem(self._running_key, 1, raw_id)  # type: ignore[reportUnknownMemberType]
+            return None
+        job.status = JobStatus.RUNNING
+        await self.update(job)
+        return job
+
+    async def update(self, job: Job) -> None:
+        pipe = self._redis_client.pipeline(transaction=True)
+        self._save(pipe, job)
+        await pipe.execute()  # type: ignore[reportUnknownMemberType]
+
+    async def complete(self, job: Job) -> None:
+        pipe = self._redis_client.pipeline(transaction=True)
+        self._save(pipe, job)
+        pipe.lrem(self._running_key, 1, str(job.id))  # type: ignore[reportUnknownMemberType]
+        await pipe.execute()  # type: ignore[reportUnknownMemberType]
+
+    async def requeue_stale(self, older_than: float) -> int:
+        running: list[bytes] = await self._redis_client.lrange(self._running_key, 0, -1)  # type: ignore[reportUnknownMemberType]
+        deadline = time.time() - older_than
+        requeued = 0
+        for raw_id in running:
+            job_key = self._job_prefix + raw_id.decode()
+            heartbeat = await self._redis_client.hget(job_key, "heartbeat")  # type: ignore[reportUnknownMemberType]
+            if heartbeat is not None and float(heartbeat) > deadline:  # type: ignore[reportUnknownArgumentType]
+                continue
+            keys = [self._running_key, self._pending_key, job_key]
+            requeued += await self._requeue(keys=keys, args=[raw_id])  # type: ignore[reportUnknownVariableType]
+        return requeued  # type: ignore[reportUnknownVariableType]
+
+    def _job_key(self, job_id: UUID) -> str:
+        return self._job_prefix + str(job_id)
+
+    def _save(self, pipe: object, job: Job) -> None:
+        key = self._job_key(job.id)
+        pipe.hset(  # type: ignore[reportAttributeAccessIssue]
+            key,
+            mapping={
+                "id": str(job.id),
+                "kind": job.kind,
+                "status": job.status,
+                "created_at": job.created_at.isoformat(),
+                "processed": job.processed,
+                "chunks": job.chunks,
+                "error": job.error or "",
+                "heartbeat": time.time(),
+            },
+        )
+        pipe.expire(key, self._ttl)  # type: ignore[reportAttributeAccessIssue]
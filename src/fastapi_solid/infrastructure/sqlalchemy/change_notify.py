@@ -0,0 +1,57 @@
+import asyncio
+import json
+from collections.abc import AsyncIterator, Sequence
+from itertools import count
+from uuid import uuid4
+
+import asyncpg
+
+from fastapi_solid.application.interfaces.common.change_feed import (
+    ChangeEvent,
+    ChangeOp,
+)
+from sqlalchemy import make_url
+
+
+class PostgresChangeSource:
+    """LISTEN on a NOTIFY channel fed by a table trigger, on every given database.
+
+    NOTIFY keeps no history, so tokens are only unique per listener
+    (`<listener id>-<seq>`) and a reconnect can't resume. Losing any of the
+    connections ends the stream.
+    """
+
+    resumable = False
+
+    def __init__(self, dsns: Sequence[str], channel: str):
+        # SQLAlchemy DSNs, asyncpg wants a plain postgresql:// one
+        self._dsns = [
+            make_url(dsn).set(drivername="postgresql").render_as_string(False)
+            for dsn in dsns
+        ]
+        self._channel = channel
+
+    async def stream(self, resume_token: str | None) -> AsyncIterator[ChangeEvent]:
+        payloads: asyncio.Queue[str | None] = asyncio.Queue()
+        listener_id = uuid4().hex[:8]
+        seq = count(1)
+
+        connections: list[asyncpg.Connection] = []
+        try:
+            for dsn in self._dsns:
+                connection = await asyncpg.connect(dsn)
+                connections.append(connection)
+                await connection.add_listener(
+                    self._channel, lambda *args: payloads.put_nowait(args[3])
+                )
+                connection.add_termination_listener(lambda _: payloads.put_nowait(None))
+            while (payload := await payloads.get()) is not None:
+                data = json.loads(payload)
+                yield ChangeEvent(
+                    token=f"{listener_id}-{next(seq)}",
+                    op=ChangeOp(data["op"].lower()),
+                    id=data["id"],
+                )
+        finally:
+            await asyncio.gather(*(c.close() for c in connections))
+        raise ConnectionError(f"LISTEN connection on {self._channel} was closed")
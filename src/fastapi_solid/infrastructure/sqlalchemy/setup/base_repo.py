@@ -1,18 +1,25 @@
 from collections.abc import Mapping, Sequence
+from logging import DEBUG
 from typing import Any, overload
 from uuid import UUID
 
-from sqlalchemy import func, insert, select, update
+from sqlalchemy import Executable, Result, insert
+from sqlalchemy.exc import DBAPIError
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from fastapi_solid.application.exceptions.app_error import NotFound
+from fastapi_solid.application.exceptions.app_error import DeadlineExceeded, NotFound
 from fastapi_solid.application.interfaces.common.pagination import Pagination
+from fastapi_solid.application.interfaces.common.projection import Fields
 from fastapi_solid.utils.logging.logger import get_logger
 
+from . import statements
 from .base_model import Base
+from .deadline import is_deadline_error
 
 logger = get_logger(__name__)
 
+MIN_ID = UUID(int=0)  # sorts before any other id
+
 
 class AlchemyRepo[T: Base]:
     model: type[T]
@@ -20,21 +27,75 @@ class AlchemyRepo[T: Base]:
     def __init__(self, session: AsyncSession):
         self._session = session
 
+    async def _execute(
+        self, stmt: Executable, params: Mapping[str, Any] | None = None
+    ) -> Result[Any]:
+        try:
+            return await self._session.execute(stmt, params)
+        except DBAPIError as e:
+            if is_deadline_error(e):
+                raise DeadlineExceeded() from e
+            raise
+
     async def _get_all(self, pagination: Pagination | None = None) -> Sequence[T]:
-        query = select(self.model)
         if pagination:
-            query = query.limit(pagination.limit).offset(pagination.offset)
-        res = await self._session.execute(query)
+            res = await self._execute(
+                statements.select_page(self.model),
+                {"limit": pagination.limit, "offset": pagination.offset},
+            )
+        else:
+            res = await self._execute(statements.select_all(self.model))
+        return res.scalars().all()
+
+    async def _get_ordered(self, limit: int) -> Sequence[T]:
+        res = await self._execute(
+            statements.select_ordered(self.model), {"limit": limit}
+        )
+        return res.scalars().all()
+
+    async def _get_after(self, after: UUID | None, limit: int) -> Sequence[T]:
+        res = await self._execute(
+            statements.select_after(self.model),
+            {"after": after or MIN_ID, "limit": limit},
+        )
         return res.scalars().all()
 
     async def _get_by_id(self, id: UUID) -> T | None:
-        query = select(self.model).where(self.model.id == id)
-        res = await self._session.execute(query)
+        res = await self._execute(statements.select_by_id(self.model), {"id": id})
         return res.scalar_one_or_none()
 
+    async def _get_all_fields(
+        self, fields: Fields, pagination: Pagination | None = None
+    ) -> list[dict[str, Any]]:
+        """Rows of only the `fields` columns, nothing else is read or sent"""
+        if pagination:
+            res = await self._execute(
+                statements.select_columns_page(self.model, fields),
+                {"limit": pagination.limit, "offset": pagination.offset},
+            )
+        else:
+            res = await self._execute(statements.select_columns(self.model, fields))
+        return [dict(row) for row in res.mappings()]
+
+    async def _get_ordered_fields(
+        self, fields: Fields, limit: int
+    ) -> list[dict[str, Any]]:
+        res = await self._execute(
+            statements.select_columns_ordered(self.model, fields), {"limit": limit}
+        )
+        return [dict(row) for row in res.mappings()]
+
+    async def _get_fields_by_id(
+        self, id: UUID, fields: Fields
+    ) -> dict[str, Any] | None:
+        res = await self._execute(
+            statements.select_columns_by_id(self.model, fields), {"id": id}
+        )
+        row = res.mappings().one_or_none()
+        return dict(row) if row else None
+
     async def _count(self) -> int:
-        query = select(func.count(self.model.id))
-        res = await self._session.execute(query)
+        res = await self._execute(statements.select_count(self.model))
         return res.scalar_one()
 
     @overload
@@ -46,37 +107,31 @@ class AlchemyRepo[T: Base]:
         self, values: Mapping[str, Any] | Sequence[Mapping[str, Any]]
     ) -> T | Sequence[T]:
         stmt = insert(self.model).values(values).returning(self.model)
-        res = await self._session.execute(stmt)
+        res = await self._execute(stmt)
         if isinstance(values, dict):
             created_entity = res.scalar_one()
-            logger.debug(f"Created {created_entity}")
+            logger.debug("Created %r", created_entity)
             return created_entity
         created_entities = res.scalars().all()
         logger.debug(
-            "Created %s entities of %s",
-            len(created_entities),
-            self.model.__class__.__name__,
+            "Created %s entities of %s", len(created_entities), self.model.__name__
         )
         return created_entities
 
     async def _update_by_id(self, id: UUID, values: Mapping[str, Any]) -> T:
-        stmt = (
-            update(self.model)
-            .where(self.model.id == id)
-            .values(values)
-            .returning(self.model)
-        )
-        res = await self._session.execute(stmt)
+        stmt = statements.update_by_id(self.model, tuple(values))
+        params = {f"v_{k}": v for k, v in values.items()}
+        res = await self._execute(stmt, {"pk": id, **params})
         updated = res.scalar_one_or_none()
         if updated is None:
             raise NotFound(f"{self.model.__name__[:-3]} with id={id} not found")
-        logger.debug(f"Updated {updated}")
+        logger.debug("Updated %r", updated)
         return updated
 
     async def _delete(self, id: UUID) -> None:
         entity = await self._session.get(self.model, id)
-        entity_repr = repr(entity)
         if not entity:
             raise NotFound(f"{self.model.__name__[:-3]} with id={id} not found")
+        if logger.isEnabledFor(DEBUG):  # repr before the instance is expunged
+            logger.debug("Deleting %r", entity)
         await self._session.delete(entity)
-        logger.debug(f"Deleted {entity_repr}")
@@ -0,0 +1,33 @@
+from math import ceil
+
+from sqlalchemy import Connection, event, text
+from sqlalchemy.exc import DBAPIError
+from sqlalchemy.orm import Session, SessionTransaction
+
+from fastapi_solid.utils.deadline.context import remaining_time
+
+QUERY_CANCELED = "57014"
+
+_set_statement_timeout = text("SELECT set_config('statement_timeout', :timeout, true)")
+
+
+class DeadlineSession(Session):
+    """Session that bounds every transaction by the request deadline"""
+
+
+@event.listens_for(DeadlineSession, "after_begin")
+def _apply_statement_timeout(
+    session: Session, transaction: SessionTransaction, connection: Connection
+) -> None:
+    timeout = remaining_time()
+    if timeout is not None:
+        connection.execute(
+            _set_statement_timeout, {"timeout": str(ceil(timeout * 1000))}
+        )
+
+
+def is_deadline_error(exc: BaseException) -> bool:
+    return (
+        isinstance(exc, DBAPIError)
+        and getattr(exc.orig, "sqlstate", None) == QUERY_CANCELED
+    )
@@ -1,8 +1,43 @@
-from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+from sqlalchemy.ext.asyncio import (
+    AsyncEngine,
+    AsyncSession,
+    async_sessionmaker,
+    create_async_engine,
+)
 
 from fastapi_solid.utils.config.settings import get_settings
 
+from .deadline import DeadlineSession
+from .query_timing import instrument_engine
+from .sharding import ShardedSession
+
 settings = get_settings()
 
-async_engine = create_async_engine(settings.db_dsn)
-async_session_factory = async_sessionmaker(async_engine)
+
+def _create_engine(dsn: str) -> AsyncEngine:
+    engine = create_async_engine(
+        dsn,
+        query_cache_size=settings.db_query_cache_size,
+        connect_args={
+            "prepared_statement_cache_size": settings.db_prepared_statement_cache_size
+        },
+    )
+    instrument_engine(engine.sync_engine)
+    return engine
+
+
+def _session_factory(engine: AsyncEngine) -> async_sessionmaker[AsyncSession]:
+    return async_sessionmaker(engine, sync_session_class=DeadlineSession)
+
+
+async_engine = _create_engine(settings.db_dsn)
+async_session_factory = _session_factory(async_engine)
+
+# users shards, empty when users live in the main database
+shard_session_factories = [
+    _session_factory(_create_engine(dsn)) for dsn in settings.db_shard_dsns
+]
+
+
+def sharded_session_factory() -> ShardedSession:
+    return ShardedSession(shard_session_factories)
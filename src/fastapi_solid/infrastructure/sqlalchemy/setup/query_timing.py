@@ -0,0 +1,51 @@
+import time
+from typing import Any
+
+from sqlalchemy import Connection, Engine, event
+from sqlalchemy.engine import ExceptionContext
+
+from fastapi_solid.utils.timing.context import record
+from fastapi_solid.utils.timing.slow_queries import log_slow_query
+
+_STARTED = "query_started"
+
+
+def instrument_engine(engine: Engine) -> None:
+    """Adds every statement to the request `db` timing, logs the slow ones"""
+    event.listen(engine, "before_cursor_execute", _before_cursor_execute)
+    event.listen(engine, "after_cursor_execute", _after_cursor_execute)
+    event.listen(engine, "handle_error", _handle_error)
+
+
+def _before_cursor_execute(
+    conn: Connection,
+    cursor: Any,
+    statement: str,
+    parameters: Any,
+    context: Any,
+    executemany: bool,
+) -> None:
+    conn.info.setdefault(_STARTED, []).append(time.perf_counter())
+
+
+def _after_cursor_execute(
+    conn: Connection,
+    cursor: Any,
+    statement: str,
+    parameters: Any,
+    context: Any,
+    executemany: bool,
+) -> None:
+    seconds = time.perf_counter() - conn.info[_STARTED].pop()
+    record("db", seconds)
+    log_slow_query("db", statement, parameters, seconds)
+
+
+def _handle_error(context: ExceptionContext) -> None:
+    conn = context.connection
+    if conn is None or not conn.info.get(_STARTED):
+        return
+    seconds = time.perf_counter() - conn.info[_STARTED].pop()
+    record("db", seconds)
+    if context.statement is not None:
+        log_slow_query("db", context.statement, context.parameters, seconds)
@@ -0,0 +1,88 @@
+import time
+from collections.abc import Mapping, Sequence
+from dataclasses import dataclass, fields, is_dataclass
+from typing import Any
+from uuid import UUID
+
+from asyncpg import Connection, QueryCanceledError, Record
+from sqlalchemy import Select, bindparam, select
+from sqlalchemy.dialects.postgresql import asyncpg
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from fastapi_solid.application.exceptions.app_error import DeadlineExceeded
+from fastapi_solid.application.interfaces.common.pagination import Pagination
+from fastapi_solid.utils.timing.context import record
+from fastapi_solid.utils.timing.slow_queries import log_slow_query
+
+from .base_model import Base
+
+_dialect = asyncpg.dialect()
+
+
+@dataclass(frozen=True)
+class RawQuery:
+    sql: str
+    params: tuple[str, ...]
+
+    @classmethod
+    def compile(cls, stmt: Select[Any]) -> "RawQuery":
+        compiled = stmt.compile(dialect=_dialect)
+        return cls(str(compiled), tuple(compiled.positiontup or ()))
+
+    def args(self, values: Mapping[str, Any]) -> list[Any]:
+        return [values[p] for p in self.params]
+
+
+class RawReader[D]:
+    """Hot read queries executed straight on the session's asyncpg connection.
+
+    Selects exactly the dataclass fields in declaration order, so a `Record` maps
+    positionally into the domain dataclass without ORM instances, identity map or
+    attribute instrumentation. Runs inside the session transaction, so it sees the
+    same data (and statement timeout) as the ORM path.
+    """
+
+    def __init__(self, model: type[Base], dc: type[D]):
+        if not is_dataclass(dc):
+            raise TypeError(f"{dc} is not a dataclass")
+        self._dc = dc
+        columns = [model.__table__.c[f.name] for f in fields(dc)]
+        base = select(*columns)
+        self._by_id = RawQuery.compile(base.where(model.id == bindparam("id")))
+        self._all = RawQuery.compile(base)
+        self._page = RawQuery.compile(
+            base.limit(bindparam("limit")).offset(bindparam("offset"))
+        )
+
+    async def get_by_id(self, session: AsyncSession, id: UUID) -> D | None:
+        records = await self._fetch(session, self._by_id, {"id": id})
+        return self._dc(*records[0]) if records else None
+
+    async def get_all(
+        self, session: AsyncSession, pagination: Pagination | None = None
+    ) -> list[D]:
+        if pagination:
+            values = {"limit": pagination.limit, "offset": pagination.offset}
+            records = await self._fetch(session, self._page, values)
+        else:
+            records = await self._fetch(session, self._all, {})
+        return [self._dc(*r) for r in records]
+
+    async def _fetch(
+        self, session: AsyncSession, query: RawQuery, values: Mapping[str, Any]
+    ) -> Sequence[Record]:
+        if session.new or session.dirty or session.deleted:
+            await session.flush()  # what autoflush would do for the ORM query
+        connection = await session.connection()
+        raw_connection = await connection.get_raw_connection()
+        driver: Connection = raw_connection.driver_connection  # type: ignore[reportAssignmentType]
+        args = query.args(values)
+        started = time.perf_counter()
+        try:
+            return await driver.fetch(query.sql, *args)
+        except QueryCanceledError as e:
+            raise DeadlineExceeded() from e
+        finally:  # bypasses the engine events
+            seconds = time.perf_counter() - started
+            record("db", seconds)
+            log_slow_query("db", query.sql, args, seconds)
@@ -0,0 +1,52 @@
+import asyncio
+import zlib
+from collections.abc import Sequence
+from uuid import UUID
+
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+
+def shard_for(id: UUID, shards: int) -> int:
+    """Shard index of an entity, stable across processes and restarts.
+
+    Plain modulo, so changing the number of shards means moving rows.
+    """
+    return zlib.crc32(id.bytes) % shards
+
+
+class ShardedSession:
+    """One AsyncSession per shard, opened lazily on first use.
+
+    Sessions are independent, so queries to different shards may run at once;
+    a commit touching several shards isn't atomic across them.
+    """
+
+    def __init__(self, factories: Sequence[async_sessionmaker[AsyncSession]]):
+        self._factories = factories
+        self._sessions: dict[int, AsyncSession] = {}
+
+    @property
+    def shards(self) -> int:
+        return len(self._factories)
+
+    def for_id(self, id: UUID) -> AsyncSession:
+        return self.for_shard(shard_for(id, self.shards))
+
+    def for_shard(self, shard: int) -> AsyncSession:
+        session = self._sessions.get(shard)
+        if session is None:
+            session = self._sessions[shard] = self._factories[shard]()
+        return session
+
+    def all(self) -> list[AsyncSession]:
+        return [self.for_shard(shard) for shard in range(self.shards)]
+
+    async def commit(self) -> None:
+        await asyncio.gather(*(s.commit() for s in self._sessions.values()))
+
+    async def rollback(self) -> None:
+        await asyncio.gather(*(s.rollback() for s in self._sessions.values()))
+
+    async def close(self) -> None:
+        sessions, self._sessions = list(self._sessions.values()), {}
+        await asyncio.gather(*(s.close() for s in sessions))
@@ -0,0 +1,100 @@
+"""Statement templates built once per model.
+
+Hot repo queries reuse the same construct with bound parameters instead of
+building a new `select()`/`update()` per call, which skips construction and keeps
+the SQLAlchemy compiled cache lookup on a memoized cache key.
+"""
+
+from functools import cache
+from typing import Any
+
+from sqlalchemy import ColumnElement, Select, Update, bindparam, func, select, update
+
+from .base_model import Base
+
+
+@cache
+def select_by_id[T: Base](model: type[T]) -> Select[tuple[T]]:
+    return select(model).where(model.id == bindparam("id"))
+
+
+@cache
+def select_all[T: Base](model: type[T]) -> Select[tuple[T]]:
+    return select(model)
+
+
+@cache
+def select_page[T: Base](model: type[T]) -> Select[tuple[T]]:
+    return select(model).limit(bindparam("limit")).offset(bindparam("offset"))
+
+
+@cache
+def select_ordered[T: Base](model: type[T]) -> Select[tuple[T]]:
+    """First rows in (created_at, id) order, mergeable across shards"""
+    return select(model).order_by(model.created_at, model.id).limit(bindparam("limit"))
+
+
+@cache
+def select_after[T: Base](model: type[T]) -> Select[tuple[T]]:
+    """Keyset page, rows with id above `after` in id order"""
+    return (
+        select(model)
+        .where(model.id > bindparam("after"))
+        .order_by(model.id)
+        .limit(bindparam("limit"))
+    )
+
+
+@cache
+def select_count(model: type[Base]) -> Select[tuple[int]]:
+    return select(func.count(model.id))
+
+
+@cache
+def update_by_id(model: type[Base], keys: tuple[str, ...]) -> Update:
+    """UPDATE template for one set of columns.
+
+    Params: `pk` for the row id and `v_<column>` for values, plain column names are
+    reserved by SQLAlchemy for the SET clause.
+    """
+    return (
+        update(model)
+        .where(model.id == bindparam("pk"))
+        .values({k: bindparam(f"v_{k}") for k in keys})
+        .returning(model)
+        # the bound id can't be evaluated in Python, refresh loaded rows instead
+        .execution_options(populate_existing=True)
+    )
+
+
+@cache
+def select_columns(model: type[Base], columns: tuple[str, ...]) -> Select[Any]:
+    return select(*_columns(model, columns))
+
+
+@cache
+def select_columns_by_id(model: type[Base], columns: tuple[str, ...]) -> Select[Any]:
+    return select(*_columns(model, columns)).where(model.id == bindparam("id"))
+
+
+@cache
+def select_columns_page(model: type[Base], columns: tuple[str, ...]) -> Select[Any]:
+    return (
+        select(*_columns(model, columns))
+        .limit(bindparam("limit"))
+        .offset(bindparam("offset"))
+    )
+
+
+@cache
+def select_columns_ordered(model: type[Base], columns: tuple[str, ...]) -> Select[Any]:
+    """`select_ordered` restricted to `columns`, they must include the sort keys"""
+    return (
+        select(*_columns(model, columns))
+        .order_by(model.created_at, model.id)
+        .limit(bindparam("limit"))
+    )
+
+
+def _columns(model: type[Base], names: tuple[str, ...]) -> list[ColumnElement[Any]]:
+    return [model.__table__.c[name] for name in names]
@@ -1,6 +1,10 @@
 from types import TracebackType
 
+from fastapi_solid.application.exceptions.app_error import DeadlineExceeded
 from fastapi_solid.application.interfaces.common.uow import UnitOfWork
+from fastapi_solid.infrastructure.sqlalchemy.setup.deadline import is_deadline_error
+from fastapi_solid.infrastructure.sqlalchemy.setup.sharding import ShardedSession
+from sqlalchemy.exc import DBAPIError
 from sqlalchemy.ext.asyncio import AsyncSession
 
 
@@ -21,7 +25,41 @@ class AlchemyUnitOfWork(UnitOfWork):
         await self._session.__aexit__(exc_type, exc, tb)
 
     async def commit(self) -> None:
-        await self._session.commit()
+        try:
+            await self._session.commit()
+        except DBAPIError as e:
+            if is_deadline_error(e):
+                raise DeadlineExceeded() from e
+            raise
+
+    async def rollback(self) -> None:
+        await self._session.rollback()
+
+
+class ShardedUnitOfWork(UnitOfWork):
+    """Unit of work over the shard sessions touched inside it"""
+
+    def __init__(self, session: ShardedSession):
+        self._session = session
+
+    async def __aenter__(self) -> "UnitOfWork":
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        tb: TracebackType | None,
+    ) -> None:
+        await self._session.close()
+
+    async def commit(self) -> None:
+        try:
+            await self._session.commit()
+        except DBAPIError as e:
+            if is_deadline_error(e):
+                raise DeadlineExceeded() from e
+            raise
 
     async def rollback(self) -> None:
         await self._session.rollback()
@@ -1,24 +1,34 @@
+import asyncio
+import heapq
 import random
-from uuid import UUID
+from collections.abc import Collection
+from itertools import islice
+from typing import Any
+from uuid import UUID, uuid4
 
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from fastapi_solid.application.exceptions.app_error import NotFound
+from fastapi_solid.application.exceptions.app_error import NotFound, ValidationError
 from fastapi_solid.application.interfaces.common.key_value_cache import KeyValueCache
 from fastapi_solid.application.interfaces.common.pagination import Pagination
+from fastapi_solid.application.interfaces.common.projection import Fields
 from fastapi_solid.application.interfaces.users.repo import UserRepository
 from fastapi_solid.application.users.dto import UserIn, UserUpdate
 from fastapi_solid.domain.user.model import User
+from fastapi_solid.infrastructure.cache.entity_cache import EntityCache
 from fastapi_solid.infrastructure.sqlalchemy.setup.base_repo import AlchemyRepo
+from fastapi_solid.infrastructure.sqlalchemy.setup.raw_reads import RawReader
+from fastapi_solid.infrastructure.sqlalchemy.setup.sharding import ShardedSession
 from fastapi_solid.infrastructure.sqlalchemy.user.table import UserOrm
+from fastapi_solid.utils.config.settings import get_settings
 from fastapi_solid.utils.converters.alch_to_dc import to_dataclass
-from fastapi_solid.utils.converters.json_to_dc import (
-    dataclass_from_json,
-    dataclass_to_json,
-)
+from fastapi_solid.utils.converters.cache_codec import get_codec
 from fastapi_solid.utils.logging.logger import get_logger
 
 logger = get_logger(__name__)
+settings = get_settings()
+
+user_codec = get_codec(User)
 
 
 class AlchemyUserRepo(UserRepository, AlchemyRepo[UserOrm]):
@@ -26,18 +36,53 @@ class AlchemyUserRepo(UserRepository, AlchemyRepo[UserOrm]):
     user_cache_key = "random_user"
     user_cache_ttl = 60 * 5
 
-    def __init__(self, session: AsyncSession, cache: KeyValueCache):
+    raw_reader = RawReader(UserOrm, User)
+
+    def __init__(
+        self,
+        session: AsyncSession,
+        cache: KeyValueCache,
+        entity_cache: EntityCache[User],
+        raw_reads: Collection[str] = (),
+    ):
         super().__init__(session)
         self.cache = cache
+        self.entity_cache = entity_cache
+        self.raw_reads = frozenset(raw_reads)  # method names served by raw_reader
 
     async def get_all(self, pagination: Pagination | None = None) -> list[User]:
-        users_orm = await self._get_all(pagination)
-        return [to_dataclass(u, User) for u in users_orm]
+        if "get_all" in self.raw_reads:
+            users = await self.raw_reader.get_all(self._session, pagination)
+        else:
+            users = [to_dataclass(u, User) for u in await self._get_all(pagination)]
+        if pagination:  # a page, not a full scan
+            await self.entity_cache.put_many({u.id: u for u in users})
+        return users
+
+    async def get_after(self, after: UUID | None, limit: int) -> list[User]:
+        users_orm = await self._get_after(after, limit)
+        users = [to_dataclass(u, User) for u in users_orm]
+        await self.entity_cache.put_many({u.id: u for u in users})
+        return users
 
     async def get_by_id(self, id: UUID) -> User | None:
+        return await self.entity_cache.get_or_load(id, lambda: self._load_by_id(id))
+
+    async def _load_by_id(self, id: UUID) -> User | None:
+        if "get_by_id" in self.raw_reads:
+            return await self.raw_reader.get_by_id(self._session, id)
         user_orm = await self._get_by_id(id)
         return to_dataclass(user_orm, User) if user_orm else None
 
+    async def get_all_fields(
+        self, fields: Fields, pagination: Pagination | None = None
+    ) -> list[dict[str, Any]]:
+        return await self._get_all_fields(fields, pagination)
+
+    async def get_fields_by_id(self, id: UUID, fields: Fields) -> dict[str, Any] | None:
+        # the entity cache holds whole users, a projected read skips it
+        return await self._get_fields_by_id(id, fields)
+
     async def create(self, user_in: UserIn) -> User:
         created_user = await self._create(user_in.model_dump())
         return to_dataclass(created_user, User)
@@ -49,6 +94,9 @@ class AlchemyUserRepo(UserRepository, AlchemyRepo[UserOrm]):
     async def delete(self, id: UUID) -> None:
         await self._delete(id)
 
+    async def evict(self, id: UUID) -> None:
+        await self.entity_cache.invalidate(id)
+
     # just a showcase how we should cache inside infra level
     async def get_random_user(self) -> User | None:
         if cache := await self._get_cached_user():
@@ -65,20 +113,22 @@ class AlchemyUserRepo(UserRepository, AlchemyRepo[UserOrm]):
         if not cache:
             return None
         try:
-            return dataclass_from_json(User, cache)
-        except Exception:  # damaged cache / old scheme
+            if user := user_codec.decode(cache):  # None for an old scheme
+                return user
+        except ValueError:  # damaged cache
             logger.debug(
                 "Failed to validate cache for key=%s",
                 self.user_cache_key,
                 exc_info=True,
             )
-            await self._drop_cached_user()
+        await self._drop_cached_user()
 
     async def _set_cached_user(self, user: User) -> None:
         try:
-            json_payload = dataclass_to_json(user)
             await self.cache.set(
-                key=self.user_cache_key, value=json_payload, ttl=self.user_cache_ttl
+                key=self.user_cache_key,
+                value=user_codec.encode(user),
+                ttl=self.user_cache_ttl,
             )
         except Exception:
             logger.exception("Failed to set cache for key=%s", self.user_cache_key)
@@ -88,3 +138,104 @@ class AlchemyUserRepo(UserRepository, AlchemyRepo[UserOrm]):
             await self.cache.delete(self.user_cache_key)
         except Exception:
             logger.exception("Failed to delete cache key=%s", self.user_cache_key)
+
+
+class ShardedAlchemyUserRepo(AlchemyUserRepo):
+    """Users spread over shards by a hash of their id.
+
+    Operations on one user go to its shard through an `AlchemyUserRepo` bound to
+    that shard's session. Lists query all shards at once and k-way merge the
+    results, ordered by (created_at, id) for pages and by id for keyset reads.
+    """
+
+    def __init__(
+        self,
+        session: ShardedSession,
+        cache: KeyValueCache,
+        entity_cache: EntityCache[User],
+        raw_reads: Collection[str] = (),
+    ):
+        # the base session is never used, every query picks a shard session
+        super().__init__(session, cache, entity_cache, raw_reads)  # type: ignore[reportArgumentType]
+        self.shards = session
+
+    async def get_all(self, pagination: Pagination | None = None) -> list[User]:
+        if pagination is None:
+            parts = await asyncio.gather(
+                *(self._on(s).get_all() for s in self.shards.all())
+            )
+            return [user for part in parts for user in part]
+
+        window = self._window(pagination)
+        parts = await asyncio.gather(
+            *(self._on(s)._get_ordered(window) for s in self.shards.all())
+        )
+        merged = heapq.merge(*parts, key=lambda u: (u.created_at, u.id))
+        page = islice(merged, pagination.offset, window)
+        users = [to_dataclass(u, User) for u in page]
+        await self.entity_cache.put_many({u.id: u for u in users})
+        return users
+
+    async def get_after(self, after: UUID | None, limit: int) -> list[User]:
+        # read below the shard repos, only the merged page is cached
+        parts = await asyncio.gather(
+            *(self._on(s)._get_after(after, limit) for s in self.shards.all())
+        )
+        merged = heapq.merge(*parts, key=lambda u: u.id)
+        users = [to_dataclass(u, User) for u in islice(merged, limit)]
+        await self.entity_cache.put_many({u.id: u for u in users})
+        return users
+
+    async def get_by_id(self, id: UUID) -> User | None:
+        repo = self._on(self.shards.for_id(id))
+        return await self.entity_cache.get_or_load(id, lambda: repo._load_by_id(id))
+
+    async def get_all_fields(
+        self, fields: Fields, pagination: Pagination | None = None
+    ) -> list[dict[str, Any]]:
+        if pagination is None:
+            parts = await asyncio.gather(
+                *(self._on(s).get_all_fields(fields) for s in self.shards.all())
+            )
+            return [row for part in parts for row in part]
+
+        # the merge needs the sort keys, they are dropped again if not requested
+        columns = tuple(sorted({*fields, "created_at", "id"}))
+        window = self._window(pagination)
+        parts = await asyncio.gather(
+            *(
+                self._on(s)._get_ordered_fields(columns, window)
+                for s in self.shards.all()
+            )
+        )
+        merged = heapq.merge(*parts, key=lambda r: (r["created_at"], r["id"]))
+        page = islice(merged, pagination.offset, window)
+        return [{f: row[f] for f in fields} for row in page]
+
+    async def get_fields_by_id(self, id: UUID, fields: Fields) -> dict[str, Any] | None:
+        return await self._on(self.shards.for_id(id)).get_fields_by_id(id, fields)
+
+    async def create(self, user_in: UserIn) -> User:
+        id = uuid4()  # the shard is picked by id, so it can't come from the database
+        repo = self._on(self.shards.for_id(id))
+        created_user = await repo._create({"id": id, **user_in.model_dump()})
+        return to_dataclass(created_user, User)
+
+    async def update(self, id: UUID, update_data: UserUpdate) -> User:
+        return await self._on(self.shards.for_id(id)).update(id, update_data)
+
+    async def delete(self, id: UUID) -> None:
+        await self._on(self.shards.for_id(id)).delete(id)
+
+    @staticmethod
+    def _window(pagination: Pagination) -> int:
+        # every shard may hold the whole window, so each one reads all of it
+        if pagination.offset > settings.pagination_max_offset:
+            raise ValidationError(
+                f"offset above {settings.pagination_max_offset}, "
+                "read deeper through get_after (keyset) instead"
+            )
+        return pagination.offset + pagination.limit
+
+    def _on(self, session: AsyncSession) -> AlchemyUserRepo:
+        return AlchemyUserRepo(session, self.cache, self.entity_cache, self.raw_reads)
@@ -8,9 +8,41 @@ from pydantic_settings import BaseSettings, SettingsConfigDict
 class _Settings(BaseSettings):
     api_port: int = 8000
 
+    di_stateless_singletons: bool = False  # share uow/repos/services between requests
+
+    concurrency_limit_enabled: bool = True
+    concurrency_limit_initial: int = 50  # per worker
+    concurrency_limit_min: int = 5
+    concurrency_limit_max: int = 200
+    concurrency_latency_tolerance: float = 2.0  # slowdown vs baseline to back off
+    concurrency_read_share: float = 0.8  # share of the limit reads may take
+
+    request_timeout_default: float = 10.0  # seconds
+    request_timeout_max: float = 30.0  # cap for the X-Request-Timeout header
+
+    profiling_enabled: bool = False
+    profiling_token: str = ""  # X-Profile value that profiles a request; off if empty
+    profiling_sample_rate: float = 0.0  # share of requests profiled at random
+    profiling_interval: float = 0.005  # seconds between stack samples
+
+    warmup_enabled: bool = True
+    warmup_timeout: float = 30.0  # seconds per warmup step
+    # requested through the app before it is ready, also fills hot cache keys
+    warmup_paths: list[str] = [
+        "/api/v1/users?limit=1",
+        "/api/v1/players?limit=1",
+        "/api/v1/users/random",
+    ]
+
+    server_timing_enabled: bool = True  # Server-Timing header on responses
+    slow_query_threshold: float = 0.2  # seconds, slower db/mongo queries are logged
+
     logging_level: str
     logging_lib_level: str = "WARNING"
     logging_app_prefix: str = "app"
+    logging_format: Literal["rich", "json"] = "rich"
+    logging_queue_size: int = 10_000
+    logging_sampling: dict[str, float] = {}  # logger prefix -> kept share of DEBUG
 
     db_scheme: str = "postgresql+asyncpg"
     db_host: str
@@ -18,8 +50,47 @@ class _Settings(BaseSettings):
     db_username: str
     db_password: str
     db_name: str
+    db_pool_min_size: int = 5  # connections opened per engine by the warmup
+    db_query_cache_size: int = 500  # SQLAlchemy compiled statements
+    db_prepared_statement_cache_size: int = 100  # asyncpg, per connection; 0 disables
+    db_raw_reads: set[str] = set()  # repo methods read via raw asyncpg, e.g. get_by_id
+    db_shard_dsns: list[str] = []  # users shards, JSON list of full DSNs; off if empty
+    pagination_max_offset: int = 10_000  # every shard reads offset+limit rows
 
     redis_dsn: str
+    redis_socket_timeout: float = 2.0
+    redis_pool_min_size: int = 5  # connections opened by the warmup
+    redis_breaker_failure_threshold: int = 5
+    redis_breaker_slow_call_threshold: float = 0.2  # seconds, slower counts as failure
+    redis_breaker_reset_timeout: float = 5.0  # seconds open before a probe
+
+    entity_cache_enabled: bool = True
+    entity_cache_ttl: int = 60  # seconds
+    entity_cache_negative_ttl: int = 5  # seconds to remember missing ids
+
+    cdc_history_size: int = 1000  # events kept per feed for resuming clients
+    cdc_subscriber_queue_size: int = 100  # pending events before a client is reset
+    sse_heartbeat_interval: float = 15.0  # seconds
+
+    idempotency_enabled: bool = True
+    idempotency_ttl: int = 24 * 60 * 60  # seconds a response can be replayed
+    idempotency_lock_ttl: float = 35.0  # seconds, above request_timeout_max
+    idempotency_wait_timeout: float = 10.0  # seconds a duplicate waits for the first
+
+    export_dir: str = "exports"  # shared by the API and the worker
+    export_chunk_size: int = 1000  # rows per file and per read transaction
+    export_ttl: int = 24 * 60 * 60  # seconds jobs and files are kept
+    export_poll_interval: float = 1.0  # seconds, keep below redis_socket_timeout
+    export_stale_after: float = 60.0  # seconds without progress to requeue a job
+
+    player_stats_slots: int = 8  # counter documents per group, spread write conflicts
+    player_stats_reconcile_interval: float = 300.0  # seconds, in the worker
+
+    rate_limit_enabled: bool = True
+    rate_limit_rate: float = 20  # tokens per second
+    rate_limit_burst: int = 40
+    rate_limit_lease_size: int = 10  # tokens a worker takes from Redis at once
+    trusted_proxies: list[str] = []  # IPs/CIDRs whose X-Forwarded-For is believed
 
     mongo_scheme: Literal["mongodb", "mongodb+srv"] = "mongodb"
     mongo_host: str
@@ -29,7 +100,11 @@ class _Settings(BaseSettings):
     mongo_db_name: str
     mongo_auth_db: str
     mongo_migrations_path: str = "src/fastapi_solid/infrastructure/beanie/migrations/"
-    mongo_use_transactions: bool = True
+    mongo_use_transactions: bool = True  # off: no profile runs in a transaction
+    mongo_durability: Literal["fast", "durable"] = "durable"  # unless one is chosen
+    mongo_pool_min_size: int = 5  # kept open by pymongo, filled by the warmup
+    mongo_migration_batch_size: int = 5000  # documents per bulk_write
+    mongo_migration_parallelism: int = 4  # bulk writes in flight
 
     @property
     def db_dsn(self) -> str:
@@ -0,0 +1,58 @@
+import json
+import struct
+import zlib
+from functools import cache
+from typing import Any
+
+from pydantic import TypeAdapter
+
+# codec version, schema hash, flags
+_HEADER = struct.Struct(">BIB")
+_CODEC_VERSION = 1
+_COMPRESSED = 0x01
+
+
+class CacheCodec[T]:
+    """Binary envelope for cached values: header + compact JSON, zlib when large.
+
+    The header carries the codec version and a hash of the type's JSON schema, so
+    entries written by an older shape of the type are rejected by comparing a few
+    bytes instead of failing validation.
+    """
+
+    def __init__(self, tp: type[T] | Any, compress_threshold: int = 1024):
+        self._adapter: TypeAdapter[T] = TypeAdapter(tp)
+        schema = json.dumps(self._adapter.json_schema(), sort_keys=True)
+        self.schema_hash = zlib.crc32(schema.encode())
+        self._compress_threshold = compress_threshold
+
+    def encode(self, value: T) -> bytes:
+        payload = self._adapter.dump_json(value)
+        flags = 0
+        if len(payload) >= self._compress_threshold:
+            payload = zlib.compress(payload, 1)
+            flags |= _COMPRESSED
+        return _HEADER.pack(_CODEC_VERSION, self.schema_hash, flags) + payload
+
+    def decode(self, data: bytes) -> T | None:
+        """Decoded value, None when the entry has another version or schema.
+
+        Raises ValueError for a damaged payload.
+        """
+        if len(data) < _HEADER.size:
+            return None
+        version, schema_hash, flags = _HEADER.unpack_from(data)
+        if version != _CODEC_VERSION or schema_hash != self.schema_hash:
+            return None
+        payload = data[_HEADER.size :]
+        if flags & _COMPRESSED:
+            try:
+                payload = zlib.decompress(payload)
+            except zlib.error as e:
+                raise ValueError("Damaged compressed payload") from e
+        return self._adapter.validate_json(payload)
+
+
+@cache
+def get_codec(tp: Any) -> CacheCodec[Any]:
+    return CacheCodec(tp)
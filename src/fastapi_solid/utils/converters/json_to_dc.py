@@ -1,11 +1,19 @@
+from functools import cache
+from typing import Any
+
 from pydantic import TypeAdapter
 
 
+@cache
+def _get_adapter(tp: Any) -> TypeAdapter[Any]:
+    return TypeAdapter(tp)
+
+
 def dataclass_to_json[T](obj: object) -> bytes:
-    adapter = TypeAdapter(type(obj))  # type: ignore[reportUnknownVariableType]
-    return adapter.dump_json(obj)  # type: ignore[reportUnknownMemberType]
+    adapter = _get_adapter(type(obj))
+    return adapter.dump_json(obj)
 
 
 def dataclass_from_json[T](cls: type[T], json_str: str | bytes) -> T:
-    adapter = TypeAdapter(cls)
+    adapter = _get_adapter(cls)
     return adapter.validate_json(json_str)
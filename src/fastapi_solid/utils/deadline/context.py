@@ -0,0 +1,42 @@
+import time
+from collections.abc import Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+
+from fastapi_solid.application.exceptions.app_error import DeadlineExceeded
+
+_deadline: ContextVar[float | None] = ContextVar("deadline", default=None)
+
+
+@contextmanager
+def deadline_scope(timeout: float | None) -> Iterator[None]:
+    """Sets the deadline `timeout` seconds from now for the current context"""
+    deadline = time.monotonic() + timeout if timeout is not None else None
+    token = _deadline.set(deadline)
+    try:
+        yield
+    finally:
+        _deadline.reset(token)
+
+
+def tighten_deadline(timeout: float) -> None:
+    """Moves the current deadline earlier, never later"""
+    deadline = time.monotonic() + timeout
+    current = _deadline.get()
+    if current is None or deadline < current:
+        _deadline.set(deadline)
+
+
+def remaining_time() -> float | None:
+    """Seconds left until the deadline, None when there is no deadline.
+
+    Raises DeadlineExceeded when the deadline has already passed, so callers fail
+    before doing any I/O.
+    """
+    deadline = _deadline.get()
+    if deadline is None:
+        return None
+    remaining = deadline - time.monotonic()
+    if remaining <= 0:
+        raise DeadlineExceeded()
+    return remaining
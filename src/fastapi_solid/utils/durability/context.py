@@ -0,0 +1,50 @@
+from collections.abc import Awaitable, Callable, Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from enum import StrEnum
+from functools import wraps
+
+
+class Durability(StrEnum):
+    """Named durability profiles, each storage maps them to its own settings"""
+
+    FAST = "fast"  # acknowledged by one node, no transaction
+    DURABLE = "durable"  # acknowledged by a majority, in a transaction
+
+
+_durability: ContextVar[Durability | None] = ContextVar("durability", default=None)
+
+
+@contextmanager
+def durability_scope(profile: Durability) -> Iterator[None]:
+    """Operations of the current context use `profile`"""
+    token = _durability.set(profile)
+    try:
+        yield
+    finally:
+        _durability.reset(token)
+
+
+def with_durability[**P, R](
+    profile: Durability,
+) -> Callable[[Callable[P, Awaitable[R]]], Callable[P, Awaitable[R]]]:
+    """Runs the decorated coroutine function, e.g. a service method, in `profile`"""
+
+    def decorator(func: Callable[P, Awaitable[R]]) -> Callable[P, Awaitable[R]]:
+        @wraps(func)
+        async def wrapper(*args: P.args, **kwargs: P.kwargs) -> R:
+            with durability_scope(profile):
+                return await func(*args, **kwargs)
+
+        return wrapper
+
+    return decorator
+
+
+def set_durability(profile: Durability) -> None:
+    """Chooses `profile` for the rest of the current context, e.g. a request"""
+    _durability.set(profile)
+
+
+def current_durability() -> Durability | None:
+    return _durability.get()
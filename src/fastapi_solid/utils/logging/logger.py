@@ -1,16 +1,50 @@
+import atexit
 import logging
+import queue
+import sys
+from logging.handlers import QueueHandler, QueueListener
 
 from rich.console import Console
 from rich.logging import RichHandler
 
 from fastapi_solid.utils.config.settings import get_settings
+from fastapi_solid.utils.metrics.registry import MetricsRegistry
 
+from .json_formatter import JsonFormatter
 from .lib_log_filter import LibraryLogFilter
+from .sampling_filter import SamplingFilter
 
 settings = get_settings()
 
+dropped_counter = MetricsRegistry().counter(
+    "log_records_dropped_total", "Log records dropped because the log queue was full"
+)
 
-def setup_logging():
+
+class _DeferredQueueHandler(QueueHandler):
+    """Enqueues records with their message rendered, the JSON line is built in the
+    listener thread.
+
+    Arguments are merged into the message in the calling thread, like the stdlib
+    `prepare` does: their `repr` may read state owned by the event loop (e.g.
+    expired ORM attributes). The listener lives in the same process, so the rest
+    of the record doesn't have to be pickle-safe and is passed as is.
+    """
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        record.msg = record.message = record.getMessage()
+        record.args = None
+        return record
+
+    def enqueue(self, record: logging.LogRecord) -> None:
+        # never block the event loop on a slow sink
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            dropped_counter.inc()
+
+
+def _rich_handler() -> logging.Handler:
     # force_terminal=True for colored terminal output
     rich_console = Console(style="bold cyan", width=200, force_terminal=True)
     rich_handler = RichHandler(
@@ -20,12 +54,31 @@ def setup_logging():
         tracebacks_word_wrap=False,
         log_time_format="[%d/%m/%y %H:%M:%S]",
     )
-    rich_handler.addFilter(LibraryLogFilter())
     rich_handler.setFormatter(logging.Formatter("[ %(funcName)s() ] - %(message)s"))
+    return rich_handler
+
+
+def _queue_handler() -> logging.Handler:
+    stream_handler = logging.StreamHandler(sys.stdout)
+    stream_handler.setFormatter(JsonFormatter())
+
+    log_queue: queue.Queue[logging.LogRecord] = queue.Queue(settings.logging_queue_size)
+    listener = QueueListener(log_queue, stream_handler, respect_handler_level=True)
+    listener.start()
+    atexit.register(listener.stop)
+
+    return _DeferredQueueHandler(log_queue)
+
+
+def setup_logging():
+    handler = _rich_handler() if settings.logging_format == "rich" else _queue_handler()
+    handler.addFilter(LibraryLogFilter())
+    if settings.logging_sampling:
+        handler.addFilter(SamplingFilter(settings.logging_sampling))
 
     root_logger = logging.getLogger()
     root_logger.setLevel(settings.logging_level)
-    root_logger.addHandler(rich_handler)
+    root_logger.addHandler(handler)
 
 
 def get_logger(name: str):
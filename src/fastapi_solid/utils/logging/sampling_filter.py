@@ -0,0 +1,28 @@
+import random
+from logging import INFO, Filter, LogRecord
+
+
+class SamplingFilter(Filter):
+    """Keeps only a share of records below INFO for configured logger prefixes.
+
+    Rates map a logger name prefix to the kept fraction (0.0 - 1.0), the longest
+    matching prefix wins. Records at INFO and above are never sampled.
+    """
+
+    def __init__(self, rates: dict[str, float]):
+        super().__init__()
+        self._rates = sorted(rates.items(), key=lambda item: len(item[0]), reverse=True)
+        self._resolved: dict[str, float] = {}
+
+    def filter(self, record: LogRecord) -> bool:
+        if record.levelno >= INFO or not self._rates:
+            return True
+        rate = self._resolved.get(record.name)
+        if rate is None:
+            rate = self._resolve(record.name)
+        return rate >= 1.0 or random.random() < rate
+
+    def _resolve(self, name: str) -> float:
+        rate = next((r for prefix, r in self._rates if name.startswith(prefix)), 1.0)
+        self._resolved[name] = rate
+        return rate
@@ -0,0 +1,50 @@
+from typing import Literal
+
+from fastapi_solid.utils.meta.singleton import Singleton
+
+MetricType = Literal["counter", "gauge"]
+Labels = tuple[tuple[str, str], ...]
+
+
+class Metric:
+    def __init__(self, name: str, help: str, type: MetricType):
+        self.name = name
+        self.help = help
+        self.type = type
+        self.values: dict[Labels, float] = {}
+
+    def set(self, value: float, **labels: str) -> None:
+        self.values[tuple(sorted(labels.items()))] = value
+
+    def inc(self, amount: float = 1, **labels: str) -> None:
+        key = tuple(sorted(labels.items()))
+        self.values[key] = self.values.get(key, 0) + amount
+
+    def render(self) -> str:
+        lines = [f"# HELP {self.name} {self.help}", f"# TYPE {self.name} {self.type}"]
+        for labels, value in self.values.items():
+            label_str = ",".join(f'{k}="{v}"' for k, v in labels)
+            name = f"{self.name}{{{label_str}}}" if label_str else self.name
+            lines.append(f"{name} {value}")
+        return "\n".join(lines)
+
+
+class MetricsRegistry(metaclass=Singleton):
+    """Process-wide in-memory metrics rendered in Prometheus text format"""
+
+    def __init__(self):
+        self._metrics: dict[str, Metric] = {}
+
+    def counter(self, name: str, help: str) -> Metric:
+        return self._get_or_create(name, help, "counter")
+
+    def gauge(self, name: str, help: str) -> Metric:
+        return self._get_or_create(name, help, "gauge")
+
+    def render(self) -> str:
+        return "\n".join(m.render() for m in self._metrics.values()) + "\n"
+
+    def _get_or_create(self, name: str, help: str, type: MetricType) -> Metric:
+        if name not in self._metrics:
+            self._metrics[name] = Metric(name, help, type)
+        return self._metrics[name]
@@ -0,0 +1,122 @@
+import asyncio
+import sys
+import threading
+import time
+from collections import Counter
+from types import FrameType
+
+from fastapi_solid.utils.meta.singleton import Singleton
+
+Samples = Counter[tuple[str, ...]]
+
+
+class StackSampler(metaclass=Singleton):
+    """Process-wide sampling profiler of selected asyncio tasks.
+
+    A daemon thread wakes every `interval` seconds while any task is tracked and
+    takes the stack of the event loop thread; the sample is kept only when one of
+    the tracked tasks is running at that moment. So only CPU time spent by the
+    task itself is seen, time awaiting I/O isn't. Finished samples are aggregated
+    by label and rendered as collapsed stacks, the input of flamegraph.pl and
+    speedscope.
+    """
+
+    max_depth = 128
+    max_stacks_per_label = 5000
+
+    def __init__(self, interval: float = 0.005):
+        self.interval = interval
+        self.sample_rate = 0.0  # share of requests profiled without the header
+        self._lock = threading.Lock()
+        self._tracked: dict[asyncio.Task[object], Samples] = {}
+        self._stacks: dict[str, Samples] = {}
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._loop_thread_id = 0
+        self._wakeup = threading.Event()
+        self._thread: threading.Thread | None = None
+
+    def track(self) -> Samples:
+        """Starts sampling the current task, returns its (live) samples"""
+        task = asyncio.current_task()
+        if task is None:
+            raise RuntimeError("track() must be called from a task")
+        samples: Samples = Counter()
+        with self._lock:
+            self._loop = task.get_loop()
+            self._loop_thread_id = threading.get_ident()
+            self._tracked[task] = samples
+        if self._thread is None:
+            self._thread = threading.Thread(
+                target=self._run, name="stack-sampler", daemon=True
+            )
+            self._thread.start()
+        self._wakeup.set()
+        return samples
+
+    def untrack(self, label: str) -> int:
+        """Stops sampling the current task, adds its samples under `label`"""
+        task = asyncio.current_task()
+        with self._lock:
+            samples = self._tracked.pop(task, None)  # type: ignore[reportArgumentType]
+            if not samples:
+                return 0
+            stacks = self._stacks.setdefault(label, Counter())
+            for stack, count in samples.items():
+                if stack in stacks or len(stacks) < self.max_stacks_per_label:
+                    stacks[stack] += count
+            return samples.total()
+
+    def collapsed(self, label: str | None = None) -> str:
+        """Aggregated stacks as `label;outer;...;inner count` lines"""
+        with self._lock:
+            stacks = {
+                k: Counter(v)
+                for k, v in self._stacks.items()
+                if label is None or k == label
+            }
+        lines = [
+            ";".join((name, *stack)) + f" {count}"
+            for name, samples in stacks.items()
+            for stack, count in samples.most_common()
+        ]
+        return "\n".join(lines) + "\n" if lines else ""
+
+    def labels(self) -> dict[str, int]:
+        with self._lock:
+            return {k: v.total() for k, v in self._stacks.items()}
+
+    def reset(self) -> None:
+        with self._lock:
+            self._stacks.clear()
+
+    def _run(self) -> None:
+        while True:
+            if not self._tracked:
+                self._wakeup.clear()
+                if not self._tracked:  # re-check, track() may have run meanwhile
+                    self._wakeup.wait()
+                continue
+            self._sample()
+            time.sleep(self.interval)
+
+    def _sample(self) -> None:
+        if self._loop is None:
+            return
+        task = asyncio.current_task(self._loop)
+        frame = sys._current_frames().get(self._loop_thread_id)  # type: ignore[reportPrivateUsage]
+        if frame is None or asyncio.current_task(self._loop) is not task:
+            return  # the loop switched tasks meanwhile
+        with self._lock:
+            samples = self._tracked.get(task)  # type: ignore[reportArgumentType]
+            if samples is not None:
+                samples[_stack(frame, self.max_depth)] += 1
+
+
+def _stack(frame: FrameType | None, max_depth: int) -> tuple[str, ...]:
+    names: list[str] = []
+    while frame is not None and len(names) < max_depth:
+        code = frame.f_code
+        names.append(f"{frame.f_globals.get('__name__', '?')}:{code.co_qualname}")
+        frame = frame.f_back
+    names.reverse()
+    return tuple(names)
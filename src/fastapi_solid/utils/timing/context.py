@@ -0,0 +1,75 @@
+import time
+from collections.abc import Iterator, Mapping
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any
+
+
+class RequestTimings:
+    """Time and call count per backend (db, mongo, redis, ...) of one request"""
+
+    def __init__(self, scope: Mapping[str, Any]):
+        self.scope = scope
+        self.started = time.perf_counter()
+        self.endpoint_done: float | None = None
+        self.spans: dict[str, list[float]] = {}  # name -> [seconds, count]
+
+    def add(self, name: str, seconds: float) -> None:
+        span = self.spans.get(name)
+        if span is None:
+            self.spans[name] = [seconds, 1]
+        else:
+            span[0] += seconds
+            span[1] += 1
+
+    @property
+    def route(self) -> str:
+        route = self.scope.get("route")
+        path = getattr(route, "path", self.scope.get("path", ""))
+        return f"{self.scope.get('method', '')} {path}"
+
+    def server_timing(self) -> str:
+        """`Server-Timing` header value, durations in milliseconds"""
+        now = time.perf_counter()
+        metrics = [
+            f'{name};dur={seconds * 1000:.1f};desc="count={int(count)}"'
+            for name, (seconds, count) in self.spans.items()
+        ]
+        if self.endpoint_done is not None:
+            metrics.append(f"serialize;dur={(now - self.endpoint_done) * 1000:.1f}")
+        metrics.append(f"total;dur={(now - self.started) * 1000:.1f}")
+        return ", ".join(metrics)
+
+
+_timings: ContextVar[RequestTimings | None] = ContextVar("timings", default=None)
+
+
+@contextmanager
+def timing_scope(scope: Mapping[str, Any]) -> Iterator[RequestTimings]:
+    """Collects timings of everything awaited in the current context"""
+    timings = RequestTimings(scope)
+    token = _timings.set(timings)
+    try:
+        yield timings
+    finally:
+        _timings.reset(token)
+
+
+def current_timings() -> RequestTimings | None:
+    return _timings.get()
+
+
+def record(name: str, seconds: float) -> None:
+    """Adds a call to the current request timings, a no-op outside a request"""
+    timings = _timings.get()
+    if timings is not None:
+        timings.add(name, seconds)
+
+
+@contextmanager
+def timed(name: str) -> Iterator[None]:
+    started = time.perf_counter()
+    try:
+        yield
+    finally:
+        record(name, time.perf_counter() - started)
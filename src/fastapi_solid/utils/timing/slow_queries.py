@@ -0,0 +1,55 @@
+from collections.abc import Mapping
+from typing import Any
+
+from fastapi_solid.utils.config.settings import get_settings
+from fastapi_solid.utils.logging.logger import get_logger
+
+from .context import current_timings
+
+logger = get_logger(__name__)
+settings = get_settings()
+
+MAX_STATEMENT_LENGTH = 2000
+
+
+def log_slow_query(backend: str, statement: str, params: Any, seconds: float) -> None:
+    """Logs a query slower than `slow_query_threshold`, parameter values left out"""
+    if not settings.slow_query_threshold or seconds < settings.slow_query_threshold:
+        return
+    timings = current_timings()
+    route = timings.route if timings is not None else None
+    shape = params_shape(params)
+    logger.warning(
+        "Slow %s query, %.1f ms, route %s: %s %s",
+        backend,
+        seconds * 1000,
+        route,
+        statement[:MAX_STATEMENT_LENGTH],
+        shape,
+        extra={
+            "fields": {
+                "backend": backend,
+                "duration_ms": round(seconds * 1000, 1),
+                "route": route,
+                "statement": statement[:MAX_STATEMENT_LENGTH],
+                "params": shape,
+            }
+        },
+    )
+
+
+def params_shape(params: Any, depth: int = 3) -> Any:
+    """Structure and types of query parameters without their values"""
+    if isinstance(params, Mapping):
+        if depth == 0:
+            return "{...}"
+        return {str(k): params_shape(v, depth - 1) for k, v in params.items()}  # type: ignore[reportUnknownVariableType]
+    if isinstance(params, list | tuple):
+        if not params:
+            return []
+        if depth == 0:
+            return f"[{len(params)} items]"  # type: ignore[reportUnknownArgumentType]
+        if len(params) > 3:  # type: ignore[reportUnknownArgumentType]
+            return [params_shape(params[0], depth - 1), f"x{len(params)}"]  # type: ignore[reportUnknownArgumentType]
+        return [params_shape(p, depth - 1) for p in params]  # type: ignore[reportUnknownVariableType]
+    return type(params).__name__
@@ -0,0 +1,80 @@
+import asyncio
+import contextlib
+import contextvars
+import signal
+from collections.abc import Sequence
+from uuid import UUID
+
+from fastapi_solid.infrastructure.beanie import docs
+from fastapi_solid.infrastructure.beanie.setup.client import (
+    client,  # type: ignore[reportUnknownVariableType]
+    init_beanie_async,
+)
+from fastapi_solid.infrastructure.di.container import Container
+from fastapi_solid.infrastructure.exports.worker import ExportRow, ExportWorker
+from fastapi_solid.utils.config.settings import get_settings
+from fastapi_solid.utils.logging import get_logger
+
+logger = get_logger(__name__)
+settings = get_settings()
+
+
+async def _run() -> None:
+    container = Container()
+    await init_beanie_async(docs)
+
+    # services are resolved per call, so every chunk gets its own sessions
+    async def export_users(after: UUID | None, limit: int) -> Sequence[ExportRow]:
+        return await container.users_service().get_after(after, limit)
+
+    async def export_players(after: UUID | None, limit: int) -> Sequence[ExportRow]:
+        return await container.player_service().get_after(after, limit)
+
+    worker = ExportWorker(
+        job_queue=container.export_queue(),
+        files=container.export_files(),
+        sources={"users": export_users, "players": export_players},
+        chunk_size=settings.export_chunk_size,
+        poll_interval=settings.export_poll_interval,
+        stale_after=settings.export_stale_after,
+        files_ttl=settings.export_ttl,
+    )
+
+    stop = asyncio.Event()
+    loop = asyncio.get_running_loop()
+    for sig in (signal.SIGINT, signal.SIGTERM):
+        loop.add_signal_handler(sig, stop.set)  # finish the current job, then exit
+
+    try:
+        async with asyncio.TaskGroup() as tasks:
+            tasks.create_task(worker.run(stop))
+            tasks.create_task(_reconcile_player_stats(container, stop))
+    finally:
+        await client.close()
+        await container.redis().close()
+
+
+async def _reconcile_player_stats(container: Container, stop: asyncio.Event) -> None:
+    """Periodically fixes drift of the incrementally maintained player counters"""
+
+    async def reconcile() -> None:
+        await container.player_service().reconcile_stats()
+
+    while not stop.is_set():
+        try:
+            # a fresh context, so the session isn't shared with the export jobs
+            await asyncio.create_task(reconcile(), context=contextvars.Context())
+        except Exception:
+            logger.exception("Player stats reconciliation failed")
+        with contextlib.suppress(TimeoutError):
+            await asyncio.wait_for(
+                stop.wait(), settings.player_stats_reconcile_interval
+            )
+
+
+def main() -> None:
+    asyncio.run(_run())
+
+
+if __name__ == "__main__":
+    main()
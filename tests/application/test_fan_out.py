@@ -0,0 +1,53 @@
+"""Branches of `fan_out` never share context-local resources"""
+
+from collections.abc import Iterator
+from contextvars import ContextVar
+
+import pytest
+
+from fastapi_solid.application.common import fan_out as fan_out_module
+from fastapi_solid.application.common.fan_out import fan_out, isolate_per_branch
+
+pytestmark = pytest.mark.anyio
+
+session: ContextVar[object | None] = ContextVar("session", default=None)
+
+
+def _session() -> object:
+    # stands in for a `ContextLocalSingleton` session
+    if (current := session.get()) is None:
+        session.set(current := object())
+    return current
+
+
+@pytest.fixture
+def registered() -> Iterator[None]:
+    saved = list(fan_out_module._branch_resets)
+    isolate_per_branch(lambda: session.set(None))
+    yield
+    isolate_per_branch(*saved)
+
+
+@pytest.fixture
+def unregistered() -> Iterator[None]:
+    saved = list(fan_out_module._branch_resets)
+    isolate_per_branch()
+    yield
+    isolate_per_branch(*saved)
+
+
+async def branch() -> object:
+    return _session()
+
+
+async def test_branches_get_own_sessions(registered: None):
+    request_session = _session()
+
+    first, second = await fan_out(branch, branch)
+
+    assert len({id(request_session), id(first), id(second)}) == 3
+
+
+async def test_raises_without_resets(unregistered: None):
+    with pytest.raises(RuntimeError, match="isolate_per_branch"):
+        await fan_out(branch, branch)
@@ -0,0 +1,28 @@
+import os
+from pathlib import Path
+
+import pytest
+
+ROOT = Path(__file__).parent.parent
+
+
+def _env_keys(path: Path) -> dict[str, str]:
+    if not path.exists():
+        return {}
+    lines = (line.strip() for line in path.read_text().splitlines())
+    pairs = (line.split("=", 1) for line in lines if line and not line.startswith("#"))
+    return {key.strip().upper(): value.strip() for key, value in pairs}
+
+
+# settings are read at import of the app modules: the example values fill in what
+# neither the environment nor `.env` configures, services that aren't there are
+# skipped by the fixtures that need them
+_configured = {key.upper() for key in os.environ} | _env_keys(ROOT / ".env").keys()
+for key, value in _env_keys(ROOT / ".env.example").items():
+    if key not in _configured:
+        os.environ[key] = value
+
+
+@pytest.fixture
+def anyio_backend() -> str:
+    return "asyncio"
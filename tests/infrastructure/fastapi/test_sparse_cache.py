@@ -0,0 +1,60 @@
+"""Cached sparse responses are replayed as they were first sent"""
+
+from datetime import UTC, datetime
+from uuid import UUID, uuid4
+
+import pytest
+from dependency_injector import providers
+from fastapi import FastAPI
+from fastapi_cache import FastAPICache
+from fastapi_cache.backends.inmemory import InMemoryBackend
+from httpx import ASGITransport, AsyncClient
+
+from fastapi_solid.application.common.projection import partial_model
+from fastapi_solid.application.interfaces.common.projection import Fields
+from fastapi_solid.application.users.dto import UserOut
+from fastapi_solid.infrastructure.di.container import Container
+from fastapi_solid.infrastructure.fastapi.endpoints.v1.users import users_router
+
+pytestmark = pytest.mark.anyio
+
+USER = UserOut(id=uuid4(), name="x", created_at=datetime.now(UTC))
+
+
+class StubUserService:
+    async def get_by_id(self, user_id: UUID, fields: Fields | None = None) -> UserOut:
+        if fields:  # shaped like the sparse outputs of `UserService`
+            row = {f: getattr(USER, f) for f in fields}
+            return partial_model(UserOut).model_construct(**row)
+        return USER
+
+
+@pytest.fixture
+async def client():
+    container = Container()
+    container.users_service.override(providers.Object(StubUserService()))
+    container.wire()
+    FastAPICache.init(InMemoryBackend(), prefix="test")
+    app = FastAPI()
+    app.include_router(users_router)
+    async with AsyncClient(
+        transport=ASGITransport(app=app), base_url="http://test"
+    ) as client:
+        yield client
+    FastAPICache.reset()
+    container.unwire()
+
+
+@pytest.mark.parametrize("fields", ["id,name", "name", None])
+async def test_hit_equals_miss(client: AsyncClient, fields: str | None):
+    params = {"fields": fields} if fields else {}
+
+    miss = await client.get(f"/users/{USER.id}", params=params)
+    hit = await client.get(f"/users/{USER.id}", params=params)
+
+    assert miss.status_code == hit.status_code == 200
+    assert miss.headers["x-fastapi-cache"] == "MISS"
+    assert hit.headers["x-fastapi-cache"] == "HIT"
+    assert hit.json() == miss.json()
+    if fields:
+        assert miss.json().keys() == set(fields.split(","))
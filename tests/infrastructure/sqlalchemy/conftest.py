@@ -0,0 +1,29 @@
+from collections.abc import AsyncIterator
+
+import pytest
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+
+from fastapi_solid.infrastructure.sqlalchemy.user.table import UserOrm
+from fastapi_solid.utils.config.settings import get_settings
+
+
+@pytest.fixture
+async def pg_session() -> AsyncIterator[AsyncSession]:
+    """Session in a transaction that is rolled back, against `db_dsn`.
+
+    Tests using it are skipped when Postgres isn't reachable.
+    """
+    engine = create_async_engine(get_settings().db_dsn)
+    try:
+        connection = await engine.connect()
+    except (OSError, TimeoutError) as e:
+        await engine.dispose()
+        pytest.skip(f"Postgres is not available: {e}")
+    transaction = await connection.begin()
+    try:
+        await connection.run_sync(UserOrm.metadata.create_all, [UserOrm.__table__])
+        yield AsyncSession(bind=connection, join_transaction_mode="create_savepoint")
+    finally:
+        await transaction.rollback()
+        await connection.close()
+        await engine.dispose()
@@ -0,0 +1,78 @@
+"""Parity of `RawReader` with the ORM path it replaces for users"""
+
+import re
+from dataclasses import fields
+from uuid import uuid4
+
+import pytest
+from sqlalchemy import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from fastapi_solid.application.interfaces.common.pagination import Pagination
+from fastapi_solid.domain.user.model import User
+from fastapi_solid.infrastructure.sqlalchemy.setup.base_repo import AlchemyRepo
+from fastapi_solid.infrastructure.sqlalchemy.setup.raw_reads import RawReader
+from fastapi_solid.infrastructure.sqlalchemy.user.table import UserOrm
+from fastapi_solid.utils.converters.alch_to_dc import to_dataclass
+
+pytestmark = pytest.mark.anyio
+
+reader = RawReader(UserOrm, User)
+
+
+class OrmUsers(AlchemyRepo[UserOrm]):
+    model = UserOrm
+
+
+@pytest.fixture
+async def users(pg_session: AsyncSession) -> list[User]:
+    rows = [{"id": uuid4(), "name": f"user {i}"} for i in range(5)]
+    await pg_session.execute(insert(UserOrm).values(rows))
+    orm = OrmUsers(pg_session)
+    return [to_dataclass(await orm._get_by_id(row["id"]), User) for row in rows]  # type: ignore[reportArgumentType]
+
+
+def assert_types(user: User) -> None:
+    for field in fields(User):
+        assert isinstance(getattr(user, field.name), field.type), field.name  # type: ignore[reportArgumentType]
+
+
+def test_selects_dataclass_fields_in_order():
+    select_list = re.match(r"SELECT (.*?)\s+FROM", reader._all.sql, re.S)  # type: ignore[reportPrivateUsage]
+    assert select_list
+    columns = [c.strip().split(".")[-1] for c in select_list.group(1).split(",")]
+    assert columns == [f.name for f in fields(User)]
+
+
+async def test_get_by_id_hit(pg_session: AsyncSession, users: list[User]):
+    raw = await reader.get_by_id(pg_session, users[0].id)
+
+    assert raw == users[0]
+    assert raw is not None
+    assert_types(raw)
+
+
+async def test_get_by_id_miss(pg_session: AsyncSession, users: list[User]):
+    assert await reader.get_by_id(pg_session, uuid4()) is None
+    assert await OrmUsers(pg_session)._get_by_id(uuid4()) is None
+
+
+async def test_get_all(pg_session: AsyncSession, users: list[User]):
+    orm = [to_dataclass(u, User) for u in await OrmUsers(pg_session)._get_all()]
+    raw = await reader.get_all(pg_session)
+
+    assert sorted(raw, key=lambda u: u.id) == sorted(orm, key=lambda u: u.id)
+    assert set(users) <= set(raw)
+    for user in raw:
+        assert_types(user)
+
+
+@pytest.mark.parametrize("limit, offset", [(2, 0), (2, 2), (10, 3)])
+async def test_get_all_page(
+    pg_session: AsyncSession, users: list[User], limit: int, offset: int
+):
+    pagination = Pagination(limit=limit, offset=offset)
+    orm = await OrmUsers(pg_session)._get_all(pagination)
+    raw = await reader.get_all(pg_session, pagination)
+
+    assert raw == [to_dataclass(u, User) for u in orm]